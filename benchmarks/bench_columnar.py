@@ -0,0 +1,45 @@
+"""
+Compare the memory used by ContainerManagement's dict-per-container storage with
+ColumnarContainerStore.
+
+Run from the repository root:
+    python benchmarks/bench_columnar.py [containers]
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project import ColumnarContainerStore, ContainerManagement
+
+
+def fill(store, size):
+    for i in range(size):
+        if i % 2:
+            store.add_container(f"bed-{i}", 24 + i % 200, 12 + i % 100, 2 + i % 40)
+        else:
+            store.add_container(f"pot-{i}", 6 + i % 200, None, 2 + i % 40, shape='circle')
+    return store
+
+
+def measure(factory, size):
+    tracemalloc.start()
+    store = fill(factory(), size)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return store, current
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{size:,} containers")
+    for name, factory in [("ContainerManagement (dicts)", ContainerManagement),
+                          ("ColumnarContainerStore", ColumnarContainerStore)]:
+        store, used = measure(factory, size)
+        print(f"{name:<30} {used / 1e6:>9.1f} MB  {used / size:>7.1f} bytes/container")
+        del store
+
+
+if __name__ == "__main__":
+    main()
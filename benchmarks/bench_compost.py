@@ -0,0 +1,67 @@
+"""
+Compare fleet-wide compost totals from CompostPlanner and aggregate_compost with
+one calculate_compost call per container.
+
+Run from the repository root:
+    python benchmarks/bench_compost.py [containers]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from project import ColumnarContainerStore, CompostPlanner, ContainerManagement, aggregate_compost
+
+RATIOS = (0.2, 0.25, 0.3, 0.4)
+SITES = 50
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(326)
+    manager = ContainerManagement()
+    store = ColumnarContainerStore()
+    sites = []
+    for i in range(count):
+        if rng.random() < 0.5:
+            row = (f"c{i}", rng.uniform(6, 48), rng.uniform(6, 48), rng.uniform(4, 24), "rectangle")
+        else:
+            row = (f"c{i}", rng.uniform(6, 48), None, rng.uniform(4, 24), "circle")
+        manager.add_container(*row)
+        store.add_container(*row)
+        sites.append(f"site-{rng.randrange(SITES)}")
+
+    start = time.perf_counter()
+    totals = {}
+    for record, site in zip(manager.list_containers(), sites):
+        for ratio in RATIOS:
+            result = manager.calculate_compost(record['id'], ratio)
+            key = (site, record['shape'], ratio)
+            totals[key] = totals.get(key, 0.0) + result['compost_ratio_needed']
+    loop = time.perf_counter() - start
+
+    planner = CompostPlanner()
+    for record, site in zip(manager.list_containers(), sites):
+        planner.add_container(record['id'], record['volume_cu_in'], record['shape'], site)
+    start = time.perf_counter()
+    planner.totals(RATIOS)
+    grouped = time.perf_counter() - start
+
+    volumes = np.asarray(store.column('volume_cu_in'))
+    labels = np.array([f"{site}/{record['shape']}" for site, record in zip(sites, store.list_containers())])
+    start = time.perf_counter()
+    aggregate_compost(volumes, RATIOS, labels)
+    vectorized = time.perf_counter() - start
+
+    print(f"{count:,} containers, {SITES} sites, {len(RATIOS)} ratios")
+    print(f"{'per-container loop':<28} {loop * 1000:>10.1f} ms")
+    print(f"{'aggregate_compost':<28} {vectorized * 1000:>10.1f} ms")
+    print(f"{'CompostPlanner.totals':<28} {grouped * 1000:>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
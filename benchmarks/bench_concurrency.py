@@ -0,0 +1,121 @@
+"""
+Stress test and throughput benchmark for the concurrent container and planting
+classes, from 1 to 32 threads.
+
+The same total number of operations is split across the threads. Each thread
+adds its own containers and planting records while also listing containers and
+reading the planting history. The striped, lock-free-read classes
+are compared with the plain classes wrapped in one global lock. After every run
+the stress checks confirm nothing was lost or duplicated.
+
+Run from the repository root (on a free-threaded build, with python3.13t or later):
+    python benchmarks/bench_concurrency.py [total operations]
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project import (ConcurrentContainerManagement, ConcurrentPlantingSchedule, ContainerManagement,
+                     PlantingSchedule)
+
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32)
+READ_EVERY = 200
+
+
+class GloballyLocked:
+    """The plain classes behind one lock, as callers had to do before."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._manager = ContainerManagement()
+        self._schedule = PlantingSchedule("bench")
+
+    def add_container(self, *args):
+        with self._lock:
+            return self._manager.add_container(*args)
+
+    def list_containers(self, **filters):
+        with self._lock:
+            return self._manager.list_containers(**filters)
+
+    def add_planting_record(self, *args):
+        with self._lock:
+            self._schedule.add_planting_record(*args)
+
+    def get_planting_history(self):
+        with self._lock:
+            return list(self._schedule.get_planting_history())
+
+
+class Concurrent:
+    def __init__(self):
+        self._manager = ConcurrentContainerManagement()
+        self._schedule = ConcurrentPlantingSchedule("bench")
+        self.add_container = self._manager.add_container
+        self.list_containers = self._manager.list_containers
+        self.add_planting_record = self._schedule.add_planting_record
+        self.get_planting_history = self._schedule.get_planting_history
+
+
+def worker(target, thread, operations, barrier, errors):
+    barrier.wait()
+    try:
+        for i in range(operations):
+            container_id = f"t{thread}-{i}"
+            target.add_container(container_id, 10 + i % 40, 12, 6 + i % 30)
+            target.add_planting_record("Tomato", f"{1 + i % 12:02d}/15/2024", container_id)
+            if i % READ_EVERY == 0:
+                target.list_containers(min_depth=10, max_depth=20)
+                target.get_planting_history()
+    except Exception as error:
+        errors.append(error)
+
+
+def run(make_target, threads, total):
+    operations = total // threads
+    target = make_target()
+    barrier = threading.Barrier(threads + 1)
+    errors = []
+    pool = [threading.Thread(target=worker, args=(target, t, operations, barrier, errors)) for t in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    check(target, threads, operations, errors)
+    return threads * operations / elapsed
+
+
+def check(target, threads, operations, errors):
+    """Stress checks: no errors, and every container and record present exactly once."""
+    if errors:
+        raise AssertionError(f"{len(errors)} worker errors, first: {errors[0]!r}")
+    expected = {f"t{t}-{i}" for t in range(threads) for i in range(operations)}
+    containers = [container['id'] for container in target.list_containers()]
+    if len(containers) != len(expected) or set(containers) != expected:
+        raise AssertionError("container set does not match what was added")
+    plantings = [record['container'] for record in target.get_planting_history()]
+    if len(plantings) != len(expected) or set(plantings) != expected:
+        raise AssertionError("planting history does not match what was added")
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 32_000
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, {os.cpu_count()} CPUs, "
+          f"{total:,} operations per run")
+    print(f"{'threads':>7} {'global lock ops/s':>18} {'concurrent ops/s':>17}")
+    for threads in THREAD_COUNTS:
+        locked = run(GloballyLocked, threads, total)
+        concurrent = run(Concurrent, threads, total)
+        print(f"{threads:>7} {locked:>18,.0f} {concurrent:>17,.0f}")
+    print("stress checks passed")
+
+
+if __name__ == "__main__":
+    main()
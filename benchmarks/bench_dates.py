@@ -0,0 +1,74 @@
+"""
+Compare the cached date parsers with the strptime-based code they replaced.
+
+Run from the repository root:
+    python benchmarks/bench_dates.py [rows] [distinct dates]
+"""
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project import Plant, clear_date_cache, format_planting_date, parse_dates, to_date
+
+
+def strptime_format_planting_date(date_str):
+    try:
+        date_obj = datetime.strptime(date_str, '%m/%d/%Y')
+    except ValueError:
+        date_obj = datetime.strptime(date_str, '%m-%d-%Y')
+    return date_obj.strftime('%Y-%m-%d')
+
+
+def split_to_date(value):
+    parts = value.split("/")
+    return date(int(parts[2]), int(parts[0]), int(parts[1]))
+
+
+def strptime_is_valid_date(date_str):
+    try:
+        datetime.strptime(date_str, "%Y-%m-%d")
+        return True
+    except ValueError:
+        return False
+
+
+def timed(label, func, values):
+    start = time.perf_counter()
+    for value in values:
+        func(value)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:>8.3f} s  {elapsed / len(values) * 1e9:>8.0f} ns/row")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 3_000
+    rng = random.Random(326)
+    days = [date(2020, 1, 1) + timedelta(days=i) for i in range(distinct)]
+    us_dates = [f"{d.month}/{d.day}/{d.year}" for d in days]
+    iso_dates = [d.isoformat() for d in days]
+    us_column = [rng.choice(us_dates) for _ in range(rows)]
+    iso_column = [rng.choice(iso_dates) for _ in range(rows)]
+    plant = Plant("Solanum lycopersicum", "2024-05-01", 6.5)
+
+    print(f"{rows:,} rows, {distinct:,} distinct dates")
+    clear_date_cache()
+    timed("to_date (split, uncached)", split_to_date, us_column)
+    timed("to_date (cached)", to_date, us_column)
+    timed("format_planting_date (strptime)", strptime_format_planting_date, us_column)
+    timed("format_planting_date (cached)", format_planting_date, us_column)
+    timed("is_valid_date (strptime)", strptime_is_valid_date, iso_column)
+    timed("is_valid_date (cached)", plant.is_valid_date, iso_column)
+
+    start = time.perf_counter()
+    parse_dates(us_column)
+    elapsed = time.perf_counter() - start
+    print(f"{'parse_dates (one call)':<40} {elapsed:>8.3f} s  {elapsed / rows * 1e9:>8.0f} ns/row")
+
+
+if __name__ == "__main__":
+    main()
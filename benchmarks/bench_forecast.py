@@ -0,0 +1,50 @@
+"""
+Measure how forecast_yields throughput scales with the number of worker processes.
+
+Run from the repository root:
+    python benchmarks/bench_forecast.py [gardens]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project import DEFAULT_YIELDS, Garden, forecast_yields
+
+
+def build_gardens(count):
+    rng = random.Random(326)
+    plant_types = list(DEFAULT_YIELDS)
+    gardens = []
+    for i in range(count):
+        garden = Garden(f"garden-{i}", "4/15/2025", "10/15/2025")
+        for plant_type in rng.sample(plant_types, 6):
+            garden.add_plant(plant_type.title(), rng.randint(1, 40))
+        gardens.append(garden)
+    return gardens
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    gardens = build_gardens(count)
+
+    start = time.perf_counter()
+    serial_total = sum(g.total_yield(include_details=False)["total_lb"] for g in gardens)
+    baseline = time.perf_counter() - start
+    print(f"{count:,} gardens, {os.cpu_count()} CPUs")
+    print(f"{'Garden.total_yield loop':<26} {baseline:>7.2f} s  {count / baseline:>10,.0f} gardens/s")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        result = forecast_yields(gardens, workers=workers)
+        elapsed = time.perf_counter() - start
+        assert abs(result["total_lb"] - serial_total) < 1e-6 * max(serial_total, 1)
+        print(f"{f'forecast_yields x{workers}':<26} {elapsed:>7.2f} s  {count / elapsed:>10,.0f} gardens/s")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Compare FrostCalendar's batch frost queries with one days_until_frost /
+is_safe_to_plant call per (site, date) pair.
+
+Run from the repository root:
+    python benchmarks/bench_frost.py [pairs]
+"""
+import os
+import random
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from project import FrostCalendar, days_until_frost, is_safe_to_plant
+
+SITES = 5_000
+ZONES = 40
+
+
+def main():
+    pairs = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(326)
+    calendar = FrostCalendar()
+    for zone in range(ZONES):
+        calendar.add_zone(f"zone-{zone}", f"{3 + zone % 3}/{1 + zone % 28}", f"{9 + zone % 3}/{1 + zone % 28}")
+    for site in range(SITES):
+        calendar.add_site(f"site-{site}", f"zone-{rng.randrange(ZONES)}")
+
+    sites = [f"site-{rng.randrange(SITES)}" for _ in range(pairs)]
+    start_ordinal = date(2024, 1, 1).toordinal()
+    ordinals = np.array([start_ordinal + rng.randrange(730) for _ in range(pairs)], dtype=np.int64)
+
+    start = time.perf_counter()
+    calendar.days_until_frost_batch(sites, ordinals)
+    calendar.is_safe_to_plant_batch(sites, ordinals, "hardy")
+    batch = time.perf_counter() - start
+    print(f"{pairs:,} (site, date) pairs, {SITES:,} sites in {ZONES} zones")
+    print(f"{'FrostCalendar batch':<28} {batch:>7.2f} s  {pairs / batch:>12,.0f} pairs/s")
+
+    sample = min(pairs, 100_000)
+    days = [date.fromordinal(int(o)) for o in ordinals[:sample]]
+    start = time.perf_counter()
+    for site, day in zip(sites[:sample], days):
+        last_frost, first_frost = calendar.frost_dates(site, day.year)
+        days_until_frost(day, first_frost)
+        is_safe_to_plant(day, last_frost, "hardy")
+    loop = time.perf_counter() - start
+    print(f"{'per-pair function calls':<28} {loop:>7.2f} s  {sample / loop:>12,.0f} pairs/s ({sample:,} pairs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Measure how long a fresh interpreter takes to import project and make a first call.
+
+Each case runs in a new Python process, so nothing is cached between runs. With
+--check the script fails when a light case loads a module it should not need
+(NumPy, asyncio, sqlite3, or the container and garden code) or takes longer
+than --max-ms.
+
+Run from the repository root:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --check
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ('numpy', 'asyncio', 'sqlite3', 'concurrent.futures', 'mmap',
+                 'project.management', 'project.garden', 'project.service', 'project.database')
+
+# name -> (code to time, True if the case must stay away from HEAVY_MODULES)
+CASES = {
+    'import project': ("import project", True),
+    'to_date': ("from project import to_date\nto_date('04/15/2025')", True),
+    'is_valid_ph_level': ("from project import is_valid_ph_level\nis_valid_ph_level(6.5)", True),
+    'calculate_area': ("from project import calculate_area\ncalculate_area(12, 24)", True),
+    'ContainerManagement': ("from project import ContainerManagement\nContainerManagement().add_container('a', 12, 24, 8)",
+                            False),
+    'Garden': ("from project import Garden\nGarden('g', '04/15/2025', '10/15/2025').add_plant('tomato', 3, 'tender')",
+               False),
+    'everything': ("from project import *", False),
+}
+
+CHILD = """
+import sys, time
+start = time.perf_counter()
+exec({code!r})
+elapsed = time.perf_counter() - start
+import json
+print(json.dumps({{'ms': elapsed * 1e3, 'loaded': [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+
+def run_case(code, repeat):
+    """Return (median milliseconds, heavy modules loaded) over repeat fresh processes."""
+    child = CHILD.format(code=code, heavy=HEAVY_MODULES)
+    times = []
+    loaded = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", child], cwd=ROOT, capture_output=True, text=True, check=True)
+        sample = json.loads(result.stdout)
+        times.append(sample['ms'])
+        loaded = sample['loaded']
+    return statistics.median(times), loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--check", action="store_true", help="fail if a light case is slow or loads heavy modules")
+    parser.add_argument("--max-ms", type=float, default=100.0, help="time budget for the light cases")
+    args = parser.parse_args(argv)
+
+    failures = []
+    print(f"{'case':<22} {'median ms':>10}  heavy modules loaded")
+    for name, (code, light) in CASES.items():
+        elapsed, loaded = run_case(code, args.repeat)
+        print(f"{name:<22} {elapsed:>10.1f}  {', '.join(loaded) or '-'}")
+        if light and loaded:
+            failures.append(f"{name} loaded {', '.join(loaded)}")
+        if light and elapsed > args.max_ms:
+            failures.append(f"{name} took {elapsed:.1f} ms (budget {args.max_ms:g} ms)")
+
+    if args.check and failures:
+        print("\n".join(["", "Import-time check failed:"] + failures))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
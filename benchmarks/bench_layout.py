@@ -0,0 +1,77 @@
+"""
+Time PlantLayout radius, nearest-neighbor, and spacing queries on a large layout,
+including queries far outside it, and compare the radius query with a linear scan
+over every plant.
+
+Run from the repository root:
+    python benchmarks/bench_layout.py [plants]
+"""
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project import PlantLayout
+
+BED_PLANTS = 500
+QUERIES = 2_000
+
+
+def main():
+    plants = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(326)
+    layout = PlantLayout(cell_size=12.0)
+    beds = -(-plants // BED_PLANTS)
+    per_row = math.ceil(math.sqrt(beds))
+    start = time.perf_counter()
+    spacing = None
+    for bed in range(beds):
+        ids = range(bed * BED_PLANTS, min(plants, (bed + 1) * BED_PLANTS))
+        row, column = divmod(bed, per_row)
+        spacing = layout.auto_place(ids, 96, 48, container_id=f"bed-{bed}", origin=(column * 120, row * 72))
+    build = time.perf_counter() - start
+    print(f"{plants:,} plants in {beds:,} beds, {spacing:.2f} in spacing")
+    print(f"{'build':<26} {build:>8.2f} s")
+
+    extent_x, extent_y = per_row * 120, per_row * 72
+    queries = [(rng.uniform(0, extent_x), rng.uniform(0, extent_y)) for _ in range(QUERIES)]
+
+    start = time.perf_counter()
+    for x, y in queries:
+        layout.within(x, y, 12)
+    indexed = time.perf_counter() - start
+    print(f"{'within 12 in':<26} {indexed / QUERIES * 1e6:>8.1f} us/query")
+
+    start = time.perf_counter()
+    for x, y in queries:
+        layout.nearest(x, y, 5)
+    nearest = time.perf_counter() - start
+    print(f"{'nearest 5':<26} {nearest / QUERIES * 1e6:>8.1f} us/query")
+
+    far = [(extent_x * 50 + x, -extent_y * 50 - y) for x, y in queries[:200]]
+    start = time.perf_counter()
+    for x, y in far:
+        layout.nearest(x, y, 1)
+        layout.within(x, y, 12)
+    distant = time.perf_counter() - start
+    print(f"{'far nearest + within':<26} {distant / len(far) * 1e6:>8.1f} us/query")
+
+    points = [layout.position(plant_id)[:2] for plant_id in range(plants)]
+    sample = queries[:50]
+    start = time.perf_counter()
+    for x, y in sample:
+        [i for i, (px, py) in enumerate(points) if math.hypot(px - x, py - y) <= 12]
+    scan = time.perf_counter() - start
+    print(f"{'linear scan within 12 in':<26} {scan / len(sample) * 1e6:>8.1f} us/query")
+
+    start = time.perf_counter()
+    violations = layout.spacing_violations(spacing * 0.9)
+    check = time.perf_counter() - start
+    print(f"{'spacing_violations':<26} {check:>8.2f} s  ({len(violations):,} pairs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Measure bytes per instance of the slotted Plant, Soil, and container classes
+against dict-based classes with the layout they had before __slots__.
+
+Run from the repository root:
+    python benchmarks/bench_memory.py [instances]
+"""
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project import Plant, RectangularContainer, Soil
+
+SPECIES = ["Solanum lycopersicum", "Capsicum annuum", "Lactuca sativa", "Daucus carota",
+           "Cucumis sativus", "Ocimum basilicum", "Phaseolus vulgaris", "Allium cepa"]
+SOIL_TYPES = ["loamy", "clay", "sandy", "silty", "peaty"]
+
+
+class DictPlant:
+    def __init__(self, species, planting_date, required_ph):
+        self._species = species.split()[0]
+        self._planting_date = planting_date
+        self._required_ph = required_ph
+        self._harvest_ready = False
+
+
+class DictSoil:
+    def __init__(self, soil_type, ph_level):
+        self._soil_type = soil_type
+        self._ph_level = ph_level
+
+
+class DictRectangularContainer:
+    def __init__(self, container_id, length, width, depth):
+        self._width = width
+        self._id = container_id
+        self._length = length
+        self._depth = depth
+        self._area = length * width
+        self._volume = self._area * depth
+
+
+def per_instance(build, rows):
+    # Input strings are copied per row, as they would be when read from a file.
+    rows = [tuple(value.encode().decode() if isinstance(value, str) else value for value in row) for row in rows]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(*row) for row in rows]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / len(rows)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(326)
+    plants = [(rng.choice(SPECIES), f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+               round(rng.uniform(5, 8), 1)) for _ in range(count)]
+    soils = [(rng.choice(SOIL_TYPES), round(rng.uniform(5, 8), 1)) for _ in range(count)]
+    containers = [(f"c{i}", rng.uniform(6, 48), rng.uniform(6, 48), rng.uniform(4, 24)) for i in range(count)]
+
+    print(f"{count:,} instances each, bytes per instance (including the list slot)")
+    print(f"{'class':<24} {'before':>8} {'after':>8}")
+    for name, old, new, rows in (("Plant", DictPlant, Plant, plants),
+                                 ("Soil", DictSoil, Soil, soils),
+                                 ("RectangularContainer", DictRectangularContainer, RectangularContainer, containers)):
+        print(f"{name:<24} {per_instance(old, rows):>8.0f} {per_instance(new, rows):>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
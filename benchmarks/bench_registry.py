@@ -0,0 +1,70 @@
+"""
+Benchmark container lookup latency in ContainerManagement from 1k to 1M containers.
+
+Run from the repository root:
+    python benchmarks/bench_registry.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project import ContainerManagement
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+LOOKUPS = 10_000
+SCAN_LIMIT = 100_000
+
+
+def build_manager(size):
+    cm = ContainerManagement()
+    for i in range(size):
+        if i % 2:
+            cm.add_container(f"bed-{i}", 24 + i % 200, 12 + i % 100, 2 + i % 40)
+        else:
+            cm.add_container(f"pot-{i}", 6 + i % 200, None, 2 + i % 40, shape='circle')
+    return cm
+
+
+def linear_lookup(containers, container_id):
+    for container in containers:
+        if container['id'] == container_id:
+            return container
+    raise ValueError(f"Container with ID {container_id} not found.")
+
+
+def main():
+    rng = random.Random(326)
+    print(f"{'containers':>12} {'indexed us':>12} {'linear scan us':>16} {'filtered ms':>12}")
+    for size in SIZES:
+        cm = build_manager(size)
+        ids = [c['id'] for c in cm.list_containers()]
+        sample = [rng.choice(ids) for _ in range(LOOKUPS)]
+
+        start = time.perf_counter()
+        for container_id in sample:
+            cm.get_container(container_id)
+        indexed = (time.perf_counter() - start) / LOOKUPS * 1e6
+
+        if size <= SCAN_LIMIT:
+            containers = cm.list_containers()
+            scan_sample = sample[:100]
+            start = time.perf_counter()
+            for container_id in scan_sample:
+                linear_lookup(containers, container_id)
+            linear = f"{(time.perf_counter() - start) / len(scan_sample) * 1e6:.2f}"
+        else:
+            linear = "skipped"
+
+        cm.list_containers(min_depth=10, max_depth=12)
+        start = time.perf_counter()
+        cm.list_containers(shape='circle', min_depth=10, max_depth=12)
+        filtered = (time.perf_counter() - start) * 1e3
+
+        print(f"{size:>12,} {indexed:>12.2f} {linear:>16} {filtered:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Load test GardenService with the bundled client.
+
+By default the server runs inside this process on a free port. Pass --port to
+load test a server started elsewhere with project.run_service.
+
+Run from the repository root:
+    python benchmarks/bench_service.py [--requests N] [--concurrency N] [--port PORT]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project import ContainerManagement, Garden, GardenService, load_test
+
+CONTAINERS = 10_000
+
+
+def build_service():
+    cm = ContainerManagement()
+    for i in range(CONTAINERS):
+        cm.add_container(f"bed-{i}", 24 + i % 200, 12 + i % 100, 2 + i % 40)
+    garden = Garden("home", "4/15/2025", "10/15/2025")
+    for plant_type in ("tomato", "pepper", "kale", "lettuce"):
+        garden.add_plant(plant_type, 10)
+    return GardenService(cm, [garden], max_pending=100_000)
+
+
+async def main(args):
+    rng = random.Random(326)
+    requests = []
+    for _ in range(args.requests):
+        op = rng.choice(("compost", "compost", "compost", "yield", "season", "safe"))
+        if op == "compost":
+            params = {"container_id": f"bed-{rng.randrange(CONTAINERS)}", "ratio": 0.25}
+        elif op == "yield":
+            params = {"garden": "home", "details": False}
+        elif op == "season":
+            params = {"date": f"{rng.randint(1, 12)}/{rng.randint(1, 28)}/2025"}
+        else:
+            params = {"garden": "home", "date": f"4/{rng.randint(1, 30)}/2025"}
+        requests.append((op, params))
+
+    service = None
+    host, port = args.host, args.port
+    if port is None:
+        service = build_service()
+        await service.start()
+        host, port = service.address[:2]
+
+    result = await load_test(requests, host, port, concurrency=args.concurrency, connections=args.connections)
+    print(f"{result['requests']:,} requests, {result['errors']} errors, "
+          f"{result['requests_per_second']:,.0f} requests/s")
+    print(f"client latency: p50 <= {result['latency']['p50_ms']} ms, p99 <= {result['latency']['p99_ms']} ms")
+    if service is not None:
+        for endpoint, summary in service.metrics().items():
+            if summary['count']:
+                print(f"  {endpoint:<8} {summary['count']:>8,} requests  mean {summary['mean_ms']:.2f} ms  "
+                      f"p99 <= {summary['p99_ms']} ms")
+        await service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int)
+    asyncio.run(main(parser.parse_args()))
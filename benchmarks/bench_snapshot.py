@@ -0,0 +1,51 @@
+"""
+Measure how long it takes to open a container snapshot and answer the first queries.
+
+Run from the repository root:
+    python benchmarks/bench_snapshot.py [containers]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project import ColumnarContainerStore, Garden, GardenSnapshot, write_snapshot
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    store = ColumnarContainerStore()
+    for i in range(size):
+        store.add_container(f"bed-{i}", 24 + i % 200, 12 + i % 100, 2 + i % 40)
+    garden = Garden("Benchmark", "4/15/2025", "10/15/2025")
+    for plant_type in ("tomato", "pepper", "kale", "lettuce"):
+        garden.add_plant(plant_type, 10)
+
+    path = os.path.join(tempfile.mkdtemp(), "fleet.snap")
+    start = time.perf_counter()
+    size_bytes = write_snapshot(path, store, garden)
+    print(f"write {size:,} containers: {time.perf_counter() - start:.2f} s ({size_bytes / 1e6:.1f} MB)")
+
+    start = time.perf_counter()
+    snapshot = GardenSnapshot(path)
+    opened = time.perf_counter() - start
+    snapshot.get_container(f"bed-{size // 2}")
+    first_lookup = time.perf_counter() - start
+    snapshot.total_yield()
+    first_yield = time.perf_counter() - start
+    print(f"open: {opened * 1e3:.2f} ms, first get_container: {first_lookup * 1e3:.2f} ms, "
+          f"first total_yield: {first_yield * 1e3:.2f} ms")
+
+    start = time.perf_counter()
+    for i in range(0, size, max(size // 10_000, 1)):
+        snapshot.get_container(f"bed-{i}")
+    lookups = len(range(0, size, max(size // 10_000, 1)))
+    print(f"get_container: {(time.perf_counter() - start) / lookups * 1e6:.1f} us per lookup")
+    snapshot.close()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
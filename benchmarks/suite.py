@@ -0,0 +1,381 @@
+"""
+Benchmark suite for the library functions and the main class workflows, with
+stored baselines and a regression gate.
+
+Every case runs over a deterministic synthetic dataset of the requested size and
+is reported in nanoseconds per row (the best of --repeat samples). Baselines are
+kept in benchmarks/baselines.json, keyed by case and size.
+
+Run from the repository root:
+    python benchmarks/suite.py                          # 1k and 10k rows, every case
+    python benchmarks/suite.py --sizes 1k,100k,10M -k Garden
+    python benchmarks/suite.py --save                   # record the results as the baseline
+    python benchmarks/suite.py --check                  # exit 1 if a case is slower than its baseline
+
+--check fails a case when it is more than --threshold (default 0.25, i.e. 25%)
+slower than its baseline. Baselines only compare within one machine, so record
+them where the gate runs.
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project import (DEFAULT_YIELDS, ContainerManagement, Garden, Plant, PlantingSchedule, Soil,
+                     calculate_area, calculate_compost_needed, calculate_plant_space,
+                     calculate_season_change, calculate_soil_volume, days_until_frost,
+                     estimate_harvest_yield, format_planting_date, is_safe_to_plant,
+                     is_valid_ph_level, measurement_conversion, parse_plant_species, to_date,
+                     validate_boolean_input, validate_container_dimensions)
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+DEFAULT_SIZES = "1k,10k"
+SEED = 326
+MIN_SAMPLE_SECONDS = 0.05
+
+SPECIES = ["Solanum lycopersicum", "Capsicum annuum", "Lactuca sativa", "Daucus carota",
+           "Cucumis sativus", "Ocimum basilicum", "Phaseolus vulgaris", "Allium cepa"]
+SOIL_TYPES = ["loamy", "clay", "sandy", "silty", "peaty"]
+TOLERANCES = ["tender", "half-hardy", "hardy"]
+
+
+def parse_size(text):
+    text = text.strip().lower()
+    scale = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    return int(float(text[:-1] if scale > 1 else text) * scale)
+
+
+class Dataset:
+    """
+    Synthetic rows for the suite. Each column is generated on first use from its
+    own seeded random stream, so a column has the same values for a given size
+    whichever cases run.
+    """
+
+    def __init__(self, rows, seed=SEED):
+        self.rows = rows
+        self._seed = seed
+        self._columns = {}
+
+    def _column(self, name, make):
+        if name not in self._columns:
+            rng = random.Random(f"{self._seed}:{name}")
+            self._columns[name] = [make(rng, i) for i in range(self.rows)]
+        return self._columns[name]
+
+    @property
+    def containers(self):
+        """(id, length, width, depth, shape) with widths of None for circles."""
+        def make(rng, i):
+            length, depth = round(rng.uniform(6, 48), 1), round(rng.uniform(4, 24), 1)
+            if rng.random() < 0.5:
+                return f"c{i}", length, round(rng.uniform(6, 48), 1), depth, "rectangle"
+            return f"c{i}", length, None, depth, "circle"
+        return self._column("containers", make)
+
+    @property
+    def dates(self):
+        start = date(2020, 1, 1).toordinal()
+        return self._column("dates", lambda rng, i: date.fromordinal(start + rng.randrange(2190)))
+
+    @property
+    def us_dates(self):
+        return self._column("us_dates", lambda rng, i: self.dates[i].strftime("%m/%d/%Y"))
+
+    @property
+    def iso_dates(self):
+        return self._column("iso_dates", lambda rng, i: self.dates[i].isoformat())
+
+    @property
+    def datetimes(self):
+        return self._column("datetimes", lambda rng, i: datetime.combine(self.dates[i], datetime.min.time())
+                            + timedelta(minutes=rng.randrange(1440)))
+
+    @property
+    def plants(self):
+        """(plant_type, count, tolerance)"""
+        types = sorted(DEFAULT_YIELDS)
+        return self._column("plants", lambda rng, i: (rng.choice(types).title(), rng.randint(1, 40),
+                                                      rng.choice(TOLERANCES)))
+
+    @property
+    def species(self):
+        return self._column("species", lambda rng, i: rng.choice(SPECIES))
+
+    @property
+    def ph(self):
+        return self._column("ph", lambda rng, i: round(rng.uniform(4.5, 8.5), 1))
+
+    @property
+    def soils(self):
+        return self._column("soils", lambda rng, i: (rng.choice(SOIL_TYPES), round(rng.uniform(5, 8), 1)))
+
+    @property
+    def flags(self):
+        return self._column("flags", lambda rng, i: rng.random() < 0.5)
+
+
+CASES = {}
+
+
+def case(name, setup=None):
+    """Register run(data, state) under name; setup(data) builds state outside the timed region."""
+    def register(run):
+        CASES[name] = (setup, run)
+        return run
+    return register
+
+
+@case("calculate_area")
+def _(data, state):
+    for _, length, width, _, shape in data.containers:
+        calculate_area(length, width, shape)
+
+
+@case("validate_container_dimensions")
+def _(data, state):
+    for _, length, width, depth, _ in data.containers:
+        validate_container_dimensions(length, width or length, depth)
+
+
+@case("measurement_conversion")
+def _(data, state):
+    for _, length, _, _, _ in data.containers:
+        measurement_conversion(length, "in", "cm")
+
+
+@case("calculate_soil_volume")
+def _(data, state):
+    for _, length, width, depth, shape in data.containers:
+        calculate_soil_volume(length, width, depth, shape)
+
+
+@case("validate_boolean_input")
+def _(data, state):
+    for flag in data.flags:
+        validate_boolean_input(flag)
+
+
+@case("format_planting_date")
+def _(data, state):
+    for text in data.us_dates:
+        format_planting_date(text)
+
+
+@case("parse_plant_species")
+def _(data, state):
+    for name in data.species:
+        parse_plant_species(name)
+
+
+@case("is_valid_ph_level")
+def _(data, state):
+    for ph in data.ph:
+        is_valid_ph_level(ph)
+
+
+@case("calculate_plant_space")
+def _(data, state):
+    for (_, length, width, _, shape), (_, count, _) in zip(data.containers, data.plants):
+        calculate_plant_space(length, width, count, shape)
+
+
+@case("calculate_compost_needed")
+def _(data, state):
+    for _, length, width, depth, shape in data.containers:
+        calculate_compost_needed(length * (width or length) * depth)
+
+
+@case("calculate_season_change")
+def _(data, state):
+    for moment in data.datetimes:
+        calculate_season_change(moment)
+
+
+@case("to_date")
+def _(data, state):
+    for text in data.us_dates:
+        to_date(text)
+
+
+@case("days_until_frost")
+def _(data, state):
+    first_frost = date(2023, 10, 15)
+    for day in data.dates:
+        days_until_frost(day, first_frost)
+
+
+@case("is_safe_to_plant")
+def _(data, state):
+    last_frost = date(2023, 4, 15)
+    for day, (_, _, tolerance) in zip(data.dates, data.plants):
+        is_safe_to_plant(day, last_frost, tolerance)
+
+
+@case("estimate_harvest_yield")
+def _(data, state):
+    for plant_type, count, _ in data.plants:
+        estimate_harvest_yield(plant_type, count)
+
+
+@case("ContainerManagement.add_container", setup=lambda data: ContainerManagement())
+def _(data, manager):
+    for container_id, length, width, depth, shape in data.containers:
+        manager.add_container(container_id, length, width, depth, shape)
+
+
+def _filled_manager(data):
+    manager = ContainerManagement()
+    manager.add_containers(data.containers)
+    return manager
+
+
+@case("ContainerManagement.calculate_compost", setup=_filled_manager)
+def _(data, manager):
+    for row in data.containers:
+        manager.calculate_compost(row[0], 0.3)
+
+
+@case("ContainerManagement.list_containers", setup=_filled_manager)
+def _(data, manager):
+    manager.list_containers(shape="circle", min_depth=10, max_depth=12)
+    manager.list_containers(min_volume=5_000, max_volume=6_000)
+
+
+@case("Garden.add_plant+total_yield", setup=lambda data: Garden("bench", "4/15/2023", "10/15/2023"))
+def _(data, garden):
+    for plant_type, count, tolerance in data.plants:
+        garden.add_plant(plant_type, count, tolerance)
+    garden.total_yield()
+
+
+def _filled_garden(data):
+    garden = Garden("bench", "4/15/2023", "10/15/2023")
+    garden.add_plants(data.plants[:100])
+    return garden
+
+
+@case("Garden.is_safe_on", setup=_filled_garden)
+def _(data, garden):
+    for day in data.dates:
+        garden.is_safe_on(day)
+
+
+@case("PlantingSchedule.add_planting_record", setup=lambda data: PlantingSchedule("bench"))
+def _(data, schedule):
+    for (plant_type, _, _), text, (container_id, *_) in zip(data.plants, data.us_dates, data.containers):
+        schedule.add_planting_record(plant_type, text, container_id)
+
+
+def _filled_schedule(data):
+    schedule = PlantingSchedule("bench")
+    schedule.add_planting_records((plant_type, text, container_id) for (plant_type, _, _), text, (container_id, *_)
+                                  in zip(data.plants, data.us_dates, data.containers))
+    return schedule
+
+
+@case("PlantingSchedule.find_plantings", setup=_filled_schedule)
+def _(data, schedule):
+    for season in ("Spring", "Summer", "Fall", "Winter"):
+        for year in range(2020, 2026):
+            schedule.find_plantings(season=season, year=year)
+    schedule.find_plantings(plant_name="tomato")
+
+
+@case("Plant.days_since_planted")
+def _(data, state):
+    for name, text, ph in zip(data.species, data.iso_dates, data.ph):
+        Plant(name, text, ph).days_since_planted()
+
+
+@case("Soil.check_compatibility")
+def _(data, state):
+    plant = Plant("Solanum lycopersicum", "2024-04-01", 6.5)
+    for soil_type, ph in data.soils:
+        Soil(soil_type, ph).check_compatibility(plant)
+
+
+def run_case(name, data, repeat):
+    """
+    Return the best nanoseconds per row over repeat samples. Like timeit, each
+    sample runs the case as many times as it takes to fill MIN_SAMPLE_SECONDS,
+    with the garbage collector off, so small sizes are not dominated by noise.
+    """
+    setup, run = CASES[name]
+    best = float("inf")
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            elapsed = 0.0
+            loops = 0
+            while elapsed < MIN_SAMPLE_SECONDS:
+                state = setup(data) if setup else None
+                start = time.perf_counter()
+                run(data, state)
+                elapsed += time.perf_counter() - start
+                loops += 1
+            best = min(best, elapsed / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best / data.rows * 1e9
+
+
+def load_baselines(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma-separated row counts, e.g. 1k,100k,10M")
+    parser.add_argument("-k", dest="pattern", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="write the results into the baseline file")
+    parser.add_argument("--check", action="store_true", help="fail if a case regressed past the threshold")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if args.pattern in name]
+    if not names:
+        parser.error(f"no cases match {args.pattern!r}")
+    baselines = load_baselines(args.baseline)
+    results = {}
+    regressions = []
+    print(f"{'case':<42} {'rows':>10} {'ns/row':>10} {'baseline':>10} {'change':>8}")
+    for rows in (parse_size(size) for size in args.sizes.split(",")):
+        data = Dataset(rows)
+        for name in names:
+            key = f"{name}@{rows}"
+            ns = results[key] = run_case(name, data, args.repeat)
+            base = baselines.get(key)
+            shown = f"{base:.1f}" if base else "-"
+            change = f"{ns / base - 1:+.0%}" if base else "-"
+            print(f"{name:<42} {rows:>10,} {ns:>10.1f} {shown:>10} {change:>8}")
+            if base and ns > base * (1 + args.threshold):
+                regressions.append(key)
+
+    if args.save:
+        baselines.update({key: round(ns, 1) for key, ns in results.items()})
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(dict(sorted(baselines.items())), handle, indent=2)
+            handle.write("\n")
+        print(f"saved {len(results)} results to {args.baseline}")
+    if args.check and regressions:
+        print(f"{len(regressions)} case(s) more than {args.threshold:.0%} slower than baseline: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
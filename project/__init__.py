@@ -0,0 +1,75 @@
+"""
+Garden Management System.
+
+The library is split into submodules that are imported the first time one of
+their names is used, so `from project import to_date` loads only the date code
+and not the container, garden, service, or database classes. NumPy is imported
+only when a batch function is first called.
+"""
+
+import importlib
+
+_SUBMODULES = {
+    'geometry': (
+        'calculate_area', 'validate_container_dimensions', 'LENGTH_FACTORS', 'VOLUME_FACTORS',
+        'measurement_conversion', 'volume_conversion', 'convert_batch', 'calculate_soil_volume',
+        'validate_boolean_input', 'calculate_plant_space', 'calculate_compost_needed', 'calculate_area_batch',
+        'calculate_soil_volume_batch', 'calculate_plant_space_batch', 'aggregate_compost'
+    ),
+    'dates': (
+        'Dateish', 'DATE_CACHE_SIZE', 'parse_dates', 'date_cache_info', 'clear_date_cache', 'format_planting_date',
+        'calculate_season_change', 'to_date', 'days_until_frost', 'FROST_OFFSETS', 'is_safe_to_plant',
+        'is_safe_to_plant_batch', 'FROST_TABLE_CACHE_SIZE', 'FrostCalendar', 'SEASONS', 'SEASON_STARTS',
+        'SeasonCalendar'
+    ),
+    'soil': (
+        'parse_plant_species', 'is_valid_ph_level', 'interned_name_counts', 'Plant', 'Soil', 'SoilMatcher'
+    ),
+    'yields': (
+        'DEFAULT_YIELDS', 'estimate_harvest_yield', 'FORECAST_CHUNK_SIZE', 'forecast_yields'
+    ),
+    'management': (
+        'container_cache_info', 'reset_container_cache_info', 'AbstractContainer', 'RectangularContainer',
+        'CircularContainer', 'SquareContainer', 'ContainerRegistry', 'ContainerManagement', 'CONTAINER_STRIPES',
+        'StripedContainerRegistry', 'ConcurrentContainerManagement', 'ContainerRecord', 'ColumnarContainerStore',
+        'CompostPlanner', 'LAYOUT_CELL_SIZE', 'PlantLayout'
+    ),
+    'garden': (
+        'Garden', 'PlantingRecords', 'PlantingIndex', 'PlantingSchedule', 'ConcurrentPlantingIndex',
+        'ConcurrentPlantingSchedule', 'ConcurrentGarden'
+    ),
+    'importer': (
+        'IMPORT_CHUNK_SIZE', 'ImportReport', 'iter_record_chunks', 'import_containers', 'import_plants',
+        'import_plantings'
+    ),
+    'snapshot': (
+        'SNAPSHOT_MAGIC', 'SNAPSHOT_VERSION', 'write_snapshot', 'GardenSnapshot'
+    ),
+    'database': (
+        'GardenDatabase', 'SQLiteContainerStore', 'SQLitePlantingStore'
+    ),
+    'profiling': (
+        'LatencyHistogram', 'PROFILE_BUCKETS_MS', 'PROFILE_TARGETS', 'Profiler', 'profiled'
+    ),
+    'service': (
+        'ServiceBusy', 'GardenService', 'calculate_compost_rows', 'GardenClient', 'load_test', 'run_service'
+    ),
+}
+
+_LOCATIONS = {name: module for module, names in _SUBMODULES.items() for name in names}
+
+__all__ = sorted(_LOCATIONS)
+
+
+def __getattr__(name):
+    """Import the submodule that defines name and keep the value for later lookups."""
+    module = _LOCATIONS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LOCATIONS))
@@ -0,0 +1,26 @@
+"""Small helpers shared by the submodules."""
+
+
+def _require_numpy():
+    """Import NumPy on first use so the rest of the library keeps to the standard library."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is required for the batch functions. Install it with 'pip install numpy'.") from None
+    return numpy
+
+
+def _insert_rows(add, rows):
+    """
+    Call add(*row) for each row, keeping going when a row is rejected.
+
+    Returns:
+        list: (position in rows, reason) for every rejected row
+    """
+    rejected = []
+    for position, row in enumerate(rows):
+        try:
+            add(*row)
+        except (ValueError, TypeError) as error:
+            rejected.append((position, str(error)))
+    return rejected
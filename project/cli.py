@@ -0,0 +1,601 @@
+"""
+Command-line batch tool for the garden library.
+
+Every command streams its input file (CSV or JSON Lines) in chunks, runs each
+chunk through the library's bulk functions, and writes CSV, JSON, or JSON Lines
+as it goes, so a file with millions of rows is a single command:
+
+    python -m project containers import containers.csv -o containers.jsonl
+    python -m project compost report containers.csv --ratio 0.25 --ratio 0.4 --by site
+    python -m project yield forecast plants.csv --by plant --workers 4
+    python -m project season report plantings.csv
+    python -m project frost check plantings.csv --last-frost 04/15/2025 --first-frost 10/15/2025
+"""
+
+import argparse
+from collections import deque
+from contextlib import nullcontext
+import csv
+from datetime import date
+import json
+import os
+import sys
+import time
+
+from ._common import _require_numpy
+from .dates import _SEASON_CALENDAR, FROST_OFFSETS, FrostCalendar, is_safe_to_plant_batch, to_date
+from .geometry import (_compost_totals, _validate_ratios, aggregate_compost, calculate_area_batch,
+                       calculate_soil_volume_batch, volume_conversion)
+from .importer import IMPORT_CHUNK_SIZE, ImportReport, _container_fields, _optional, _plant_fields, iter_record_chunks
+from .profiling import Profiler
+from .yields import DEFAULT_YIELDS, _forecast_chunk
+
+REJECTED_SHOWN = 10
+
+CLI_PROFILE_TARGETS = (
+    'calculate_area_batch', 'calculate_soil_volume_batch', 'aggregate_compost', 'is_safe_to_plant_batch',
+    'FrostCalendar.is_safe_to_plant_batch', 'FrostCalendar.days_until_frost_batch', 'SeasonCalendar.lookup',
+    'ContainerManagement.add_containers',
+)
+
+_worker_task = None
+
+
+class _RowWriter:
+    """Write dict rows as CSV, one JSON array, or JSON Lines; the first row sets the CSV columns."""
+
+    def __init__(self, handle, output_format):
+        self._handle = handle
+        self._format = output_format
+        self._csv = None
+        self._rows = 0
+
+    def write(self, rows):
+        if not rows:
+            return
+        handle = self._handle
+        if self._format == 'csv':
+            if self._csv is None:
+                self._csv = csv.DictWriter(handle, fieldnames=list(rows[0]), extrasaction='ignore')
+                self._csv.writeheader()
+            self._csv.writerows(rows)
+        elif self._format == 'json':
+            for row in rows:
+                handle.write(',\n' if self._rows else '[\n')
+                handle.write(json.dumps(row))
+                self._rows += 1
+            return
+        else:
+            handle.writelines(json.dumps(row) + '\n' for row in rows)
+        self._rows += len(rows)
+
+    def close(self):
+        if self._format == 'json':
+            self._handle.write('\n]\n' if self._rows else '[]\n')
+
+
+def _convert_rows(chunk, convert):
+    """
+    Convert each (row number, row) pair of a chunk, setting rejected rows aside.
+
+    Returns:
+        tuple: ([(row number, row, converted fields), ...], [(row number, reason), ...])
+    """
+    parsed = []
+    rejected = []
+    for row_number, row in chunk:
+        try:
+            parsed.append((row_number, row, convert(row)))
+        except KeyError as error:
+            rejected.append((row_number, f"Missing column: {error.args[0]}"))
+        except (ValueError, TypeError) as error:
+            rejected.append((row_number, str(error)))
+    return parsed, rejected
+
+
+def _passthrough(row):
+    """Copy an input row for output, dropping the extra values csv.DictReader keeps under None."""
+    row = dict(row)
+    row.pop(None, None)
+    return row
+
+
+def _container_columns(parsed):
+    fields = [fields for _, _, fields in parsed]
+    lengths = [length for _, length, _, _, _ in fields]
+    widths = [float('nan') if width is None else width for _, _, width, _, _ in fields]
+    depths = [depth for _, _, _, depth, _ in fields]
+    shapes = [shape for _, _, _, _, shape in fields]
+    return lengths, widths, depths, shapes
+
+
+def _containers_chunk(chunk, options):
+    parsed, rejected = _convert_rows(chunk, _container_fields)
+    if not parsed:
+        return [], 0, rejected
+    lengths, widths, depths, shapes = _container_columns(parsed)
+    areas = calculate_area_batch(lengths, widths, shapes).tolist()
+    volumes = calculate_soil_volume_batch(lengths, widths, depths, shapes).tolist()
+    rows = [
+        (row_number, {
+            'id': container_id, 'shape': shape, 'length': length, 'width': width, 'depth': depth,
+            'area_sq_in': round(area, 2), 'volume_cu_in': round(volume, 2)
+        })
+        for (row_number, _, (container_id, length, width, depth, shape)), area, volume in zip(parsed, areas, volumes)
+    ]
+    return rows, len(rows), rejected
+
+
+def _compost_chunk(chunk, options):
+    """
+    Total soil volume and container count per group key for one chunk.
+
+    Each container's (row number, ID, key, volume) comes back too, so the parent
+    process can take out IDs already seen in an earlier chunk.
+    """
+    parsed, rejected = _convert_rows(chunk, _container_fields)
+    if not parsed:
+        return ({}, []), 0, rejected
+    lengths, widths, depths, shapes = _container_columns(parsed)
+    volumes = calculate_soil_volume_batch(lengths, widths, depths, shapes)
+    keys = {}
+    codes = []
+    row_keys = []
+    for _, row, fields in parsed:
+        key = tuple(fields[4] if field == 'shape' else _optional(row, 'site') for field in options['by'])
+        codes.append(keys.setdefault(key, len(keys)))
+        row_keys.append(key)
+    totals = aggregate_compost(volumes, groups=codes)
+    groups = {key: (totals[code]['soil_volume_cu_in'], totals[code]['containers']) for key, code in keys.items()}
+    rows = [(row_number, fields[0], key, volume)
+            for (row_number, _, fields), key, volume in zip(parsed, row_keys, volumes.tolist())]
+    return (groups, rows), len(parsed), rejected
+
+
+def _repeated_ids(seen, ids):
+    """
+    Add ids to seen and return (position, reason) for every ID that was already there,
+    the same way ContainerManagement turns down a second container with one ID.
+    """
+    rejected = []
+    for position, container_id in enumerate(ids):
+        if container_id in seen:
+            rejected.append((position, f"Container with ID {container_id} already exists."))
+        else:
+            seen.add(container_id)
+    return rejected
+
+
+def _garden_plant_fields(row):
+    garden = row.get('garden')
+    if not garden:
+        raise ValueError("Garden name is required.")
+    plant_type, count, _, avg_per_plant = _plant_fields(row)
+    if not plant_type:
+        raise ValueError("Plant type is required.")
+    if count < 0:
+        raise ValueError("Plant count must be 0 or more.")
+    if avg_per_plant is None and plant_type.lower() not in DEFAULT_YIELDS:
+        raise ValueError("Unknown plant type. Please give avg_per_plant value.")
+    return garden, plant_type, count, avg_per_plant
+
+
+def _yield_chunk(chunk, options):
+    """Forecast one chunk of plant rows; a garden split over chunks is added up by the caller."""
+    parsed, rejected = _convert_rows(chunk, _garden_plant_fields)
+    gardens = {}
+    for _, _, (garden, plant_type, count, avg_per_plant) in parsed:
+        gardens.setdefault(garden, []).append((plant_type, count, avg_per_plant))
+    return _forecast_chunk(list(gardens.items()), DEFAULT_YIELDS), len(parsed), rejected
+
+
+def _season_chunk(chunk, options):
+    np = _require_numpy()
+    column = options['date_column']
+    parsed, rejected = _convert_rows(chunk, lambda row: to_date(row[column]))
+    if not parsed:
+        return [], 0, rejected
+    ordinals = _SEASON_CALENDAR.ordinals([day for _, _, day in parsed])
+    # Dates repeat a lot in planting files, so each distinct day is looked up once.
+    days, inverse = np.unique(ordinals, return_inverse=True)
+    seasons = [_SEASON_CALENDAR.lookup(date.fromordinal(day)) for day in days.tolist()]
+    rows = []
+    for (row_number, row, _), index, ordinal in zip(parsed, inverse.reshape(-1).tolist(), ordinals.tolist()):
+        season, next_season, start = seasons[index]
+        out = _passthrough(row)
+        out['season'] = season
+        out['next_season'] = next_season
+        out['next_season_start'] = _SEASON_CALENDAR.start_string(start)
+        out['days_until_next_season'] = start - ordinal
+        rows.append((row_number, out))
+    return rows, len(rows), rejected
+
+
+def _frost_fields(row, options):
+    day = to_date(row[options['date_column']]).toordinal()
+    tolerance = (_optional(row, 'tolerance') or options['tolerance']).lower()
+    if tolerance not in FROST_OFFSETS:
+        raise ValueError("Tolerance must be tender, half-hardy, or hardy.")
+    site = None
+    calendar = options['calendar']
+    if calendar is not None:
+        site = row['site']
+        calendar.zone_of(site)
+    return day, tolerance, site
+
+
+def _frost_chunk(chunk, options):
+    np = _require_numpy()
+    parsed, rejected = _convert_rows(chunk, lambda row: _frost_fields(row, options))
+    if not parsed:
+        return [], 0, rejected
+    ordinals = np.array([fields[0] for _, _, fields in parsed], dtype=np.int64)
+    tolerances = np.array([fields[1] for _, _, fields in parsed])
+    sites = [fields[2] for _, _, fields in parsed]
+    calendar = options['calendar']
+    extra_days = options['extra_days']
+
+    safe = np.empty(len(parsed), dtype=bool)
+    for tolerance in FROST_OFFSETS:
+        rows = np.flatnonzero(tolerances == tolerance)
+        if not rows.size:
+            continue
+        if calendar is None:
+            safe[rows] = is_safe_to_plant_batch(ordinals[rows], options['last_frost'], tolerance, extra_days)
+        else:
+            safe[rows] = calendar.is_safe_to_plant_batch([sites[i] for i in rows.tolist()], ordinals[rows],
+                                                         tolerance, extra_days)
+    if calendar is None:
+        days = np.maximum(options['first_frost'] - ordinals, 0)
+    else:
+        days = calendar.days_until_frost_batch(sites, ordinals)
+
+    rows = []
+    for (row_number, row, _), is_safe, days_left in zip(parsed, safe.tolist(), days.tolist()):
+        out = _passthrough(row)
+        out['safe_to_plant'] = is_safe
+        out['days_until_frost'] = days_left
+        rows.append((row_number, out))
+    return rows, len(rows), rejected
+
+
+def _init_worker(function, options):
+    global _worker_task
+    _worker_task = (function, options)
+
+
+def _run_chunk(chunk):
+    function, options = _worker_task
+    return function(chunk, options)
+
+
+def _map_chunks(function, chunks, workers, options):
+    """
+    Yield function(chunk, options) for every chunk, in order.
+
+    With more than one worker the chunks go to a process pool, and only a few
+    chunks per worker are in flight at once so a huge file is never read ahead
+    into memory.
+    """
+    if workers == 1:
+        for chunk in chunks:
+            yield function(chunk, options)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(function, options)) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_run_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _timed(iterable, timings, stage):
+    """Yield from iterable, adding the time spent producing each item to timings[stage]."""
+    iterator = iter(iterable)
+    clock = time.perf_counter
+    while True:
+        start = clock()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            timings[stage] += clock() - start
+            return
+        timings[stage] += clock() - start
+        yield item
+
+
+def _process(args, function, options, collect):
+    """
+    Stream args.input through function chunk by chunk and hand each result to collect.
+
+    collect(result) may return (row number, reason) pairs for rows it turned down.
+
+    Returns:
+        tuple: (ImportReport, {'read', 'process', 'output'} seconds)
+    """
+    report = ImportReport(REJECTED_SHOWN)
+    timings = {'read': 0.0, 'process': 0.0, 'output': 0.0}
+    chunks = _timed(iter_record_chunks(args.input, args.chunk_size, args.input_format, report), timings, 'read')
+    results = _timed(_map_chunks(function, chunks, args.workers, options), timings, 'process')
+    for result, accepted, rejected in results:
+        for row_number, reason in rejected:
+            report.reject(row_number, reason)
+        start = time.perf_counter()
+        turned_down = collect(result) or ()
+        timings['output'] += time.perf_counter() - start
+        for row_number, reason in turned_down:
+            report.reject(row_number, reason)
+        report.accept(accepted - len(turned_down))
+    timings['process'] -= timings['read']
+    return report, timings
+
+
+def _containers_import(args, writer):
+    seen = set()
+    database = manager = None
+    if args.database:
+        from .database import GardenDatabase
+        from .management import ContainerManagement
+
+        database = GardenDatabase(args.database)
+        manager = ContainerManagement(store=database.container_store(args.fleet))
+
+    def collect(rows):
+        if manager is not None:
+            rejected = manager.add_containers([(row['id'], row['length'], row['width'], row['depth'], row['shape'])
+                                               for _, row in rows])
+        else:
+            rejected = _repeated_ids(seen, [row['id'] for _, row in rows])
+        dropped = {position for position, _ in rejected}
+        writer.write([row for position, (_, row) in enumerate(rows) if position not in dropped])
+        return [(rows[position][0], reason) for position, reason in rejected]
+
+    try:
+        return _process(args, _containers_chunk, {}, collect)
+    finally:
+        if database is not None:
+            database.close()
+
+
+def _compost_report(args, writer):
+    ratios = _validate_ratios(args.ratio or (0.25,))
+    volume_conversion(1, 'cu_in', args.unit)
+    by = tuple(field for field in args.by.split(',') if field)
+    if any(field not in ('site', 'shape') for field in by):
+        raise ValueError("Group fields must be 'site' and/or 'shape'.")
+    groups = {}
+    seen = set()
+
+    def collect(result):
+        chunk_groups, rows = result
+        for key, (volume, containers) in chunk_groups.items():
+            group = groups.setdefault(key, [0.0, 0])
+            group[0] += volume
+            group[1] += containers
+        rejected = _repeated_ids(seen, [container_id for _, container_id, _, _ in rows])
+        for position, _ in rejected:
+            _, _, key, volume = rows[position]
+            group = groups[key]
+            group[0] -= volume
+            group[1] -= 1
+        return [(rows[position][0], reason) for position, reason in rejected]
+
+    report, timings = _process(args, _compost_chunk, {'by': by}, collect)
+    unit = args.unit
+
+    def converted(cubic_inches):
+        return round(volume_conversion(cubic_inches, 'cu_in', unit), 2)
+
+    rows = []
+    for key in sorted(groups, key=lambda key: tuple('' if value is None else value for value in key)):
+        volume, containers = groups[key]
+        if not containers:
+            continue
+        row = dict(zip(by, key))
+        row['containers'] = containers
+        row[f'soil_volume_{unit}'] = converted(volume)
+        for ratio, needed in _compost_totals(volume, containers, ratios)['ratios'].items():
+            row[f'compost_{ratio:g}_{unit}'] = converted(needed['compost_ratio_needed'])
+            row[f'soil_{ratio:g}_{unit}'] = converted(needed['soil_ratio_needed'])
+        rows.append(row)
+    writer.write(rows)
+    return report, timings
+
+
+def _yield_forecast(args, writer):
+    gardens = {}
+    by_plant = {}
+
+    def collect(result):
+        chunk_gardens, chunk_plants = result
+        for name, total in chunk_gardens:
+            gardens[name] = gardens.get(name, 0) + total
+        for plant_type, amount in chunk_plants.items():
+            by_plant[plant_type] = by_plant.get(plant_type, 0) + amount
+
+    report, timings = _process(args, _yield_chunk, {}, collect)
+    if args.by == 'plant':
+        writer.write([{'plant_type': plant_type, 'total_lb': round(total, 2)}
+                      for plant_type, total in sorted(by_plant.items())])
+    else:
+        writer.write([{'garden': name, 'total_lb': round(total, 2)} for name, total in gardens.items()])
+    return report, timings
+
+
+def _write_rows(writer):
+    def collect(rows):
+        writer.write([row for _, row in rows])
+    return collect
+
+
+def _season_report(args, writer):
+    return _process(args, _season_chunk, {'date_column': args.date_column}, _write_rows(writer))
+
+
+def _load_sites(path):
+    """Build a FrostCalendar from a file of site, last_frost, first_frost ('MM/DD'), and optional zone columns."""
+    calendar = FrostCalendar()
+    for chunk in iter_record_chunks(path):
+        for row_number, row in chunk:
+            try:
+                zone = _optional(row, 'zone') or row['site']
+                calendar.add_zone(zone, row['last_frost'], row['first_frost'])
+                calendar.add_site(row['site'], zone)
+            except KeyError as error:
+                raise ValueError(f"{path} row {row_number}: missing column {error.args[0]}") from None
+    return calendar
+
+
+def _frost_check(args, writer):
+    if args.sites is None and (args.last_frost is None or args.first_frost is None):
+        raise ValueError("Give --last-frost and --first-frost, or a --sites file.")
+    if args.tolerance.lower() not in FROST_OFFSETS:
+        raise ValueError("Tolerance must be tender, half-hardy, or hardy.")
+    options = {
+        'date_column': args.date_column,
+        'tolerance': args.tolerance,
+        'extra_days': args.extra_days,
+        'calendar': None if args.sites is None else _load_sites(args.sites),
+        'last_frost': args.last_frost,
+        'first_frost': None if args.first_frost is None else to_date(args.first_frost).toordinal(),
+    }
+    if options['calendar'] is None:
+        to_date(args.last_frost)
+    return _process(args, _frost_chunk, options, _write_rows(writer))
+
+
+def _positive_int(text):
+    value = int(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError("must be a positive number")
+    return value
+
+
+def _add_common_arguments(parser):
+    parser.add_argument("input", help="CSV or JSON Lines file to read")
+    parser.add_argument("-o", "--output", default="-", help="file to write (default: standard output)")
+    parser.add_argument("--format", choices=("csv", "json", "jsonl"),
+                        help="output format (default: from the output file extension, else csv)")
+    parser.add_argument("--input-format", choices=("csv", "jsonl"),
+                        help="input format (default: from the input file extension)")
+    parser.add_argument("--chunk-size", type=_positive_int, default=IMPORT_CHUNK_SIZE, help="rows per chunk")
+    parser.add_argument("--workers", type=_positive_int, default=1,
+                        help=f"worker processes for the chunks (this machine has {os.cpu_count()} CPUs)")
+    parser.add_argument("--profile", action="store_true", help="print timings and library call statistics")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m project", description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    containers = commands.add_parser("containers", help="container files").add_subparsers(dest="action", required=True)
+    command = containers.add_parser("import", help="validate containers and write their area and soil volume")
+    _add_common_arguments(command)
+    command.add_argument("--database", help="also store the containers in this SQLite database")
+    command.add_argument("--fleet", default="default", help="container fleet name in the database")
+    command.set_defaults(handler=_containers_import)
+
+    compost = commands.add_parser("compost", help="compost totals").add_subparsers(dest="action", required=True)
+    command = compost.add_parser("report", help="compost and soil totals for a container file")
+    _add_common_arguments(command)
+    command.add_argument("--ratio", type=float, action="append", help="target compost ratio, repeatable (default 0.25)")
+    command.add_argument("--by", default="site,shape", help="group by 'site', 'shape', both, or '' for one total")
+    command.add_argument("--unit", default="cu_in", help="volume unit: cu_in, cu_ft, cu_yd, liter, or bag")
+    command.set_defaults(handler=_compost_report)
+
+    yields = commands.add_parser("yield", help="harvest yields").add_subparsers(dest="action", required=True)
+    command = yields.add_parser("forecast", help="harvest forecast from garden, plant_type, count rows")
+    _add_common_arguments(command)
+    command.add_argument("--by", choices=("garden", "plant"), default="garden")
+    command.set_defaults(handler=_yield_forecast)
+
+    season = commands.add_parser("season", help="seasons").add_subparsers(dest="action", required=True)
+    command = season.add_parser("report", help="season and next season change for every dated row")
+    _add_common_arguments(command)
+    command.add_argument("--date-column", default="date", help="column holding MM/DD/YYYY dates")
+    command.set_defaults(handler=_season_report)
+
+    frost = commands.add_parser("frost", help="frost safety").add_subparsers(dest="action", required=True)
+    command = frost.add_parser("check", help="planting safety and days until frost for every dated row")
+    _add_common_arguments(command)
+    command.add_argument("--date-column", default="date", help="column holding MM/DD/YYYY planting dates")
+    command.add_argument("--last-frost", help="last spring frost (MM/DD/YYYY) for every row")
+    command.add_argument("--first-frost", help="first fall frost (MM/DD/YYYY) for every row")
+    command.add_argument("--sites", help="file of site, last_frost, first_frost (MM/DD) rows; input rows need a site")
+    command.add_argument("--tolerance", default="tender", help="tolerance for rows without a tolerance column")
+    command.add_argument("--extra-days", type=int, default=0)
+    command.set_defaults(handler=_frost_check)
+    return parser
+
+
+def _output_format(args):
+    if args.format:
+        return args.format
+    extension = os.path.splitext(args.output)[1].lower()
+    return {'.json': 'json', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}.get(extension, 'csv')
+
+
+def _print_profile(args, report, timings, elapsed, profiler):
+    rows = report.accepted + report.rejected_count
+    name = f"{args.command} {args.action}"
+    print(f"{name}: {rows:,} rows in {elapsed:.2f} s ({rows / elapsed if elapsed else 0:,.0f} rows/s)",
+          file=sys.stderr)
+    print("  " + ", ".join(f"{stage} {seconds:.2f} s" for stage, seconds in timings.items()), file=sys.stderr)
+    if args.workers > 1:
+        print("  library calls made in worker processes are not counted", file=sys.stderr)
+    calls = profiler.report()
+    if calls:
+        print(f"  {'library call':<40} {'calls':>8} {'mean ms':>9} {'p99 ms':>9}", file=sys.stderr)
+    for target, stats in calls.items():
+        latency = stats['latency']
+        print(f"  {target:<40} {stats['calls']:>8,} {latency['mean_ms']:>9.3f} {latency['p99_ms']:>9.3f}",
+              file=sys.stderr)
+
+
+def main(argv=None):
+    """
+    Run the command-line tool.
+
+    Returns:
+        int: 0 on success, 1 if the command could not run
+    """
+    args = build_parser().parse_args(argv)
+    profiler = Profiler(CLI_PROFILE_TARGETS) if args.profile else None
+    start = time.perf_counter()
+    try:
+        if args.output == "-":
+            output = nullcontext(sys.stdout)
+        else:
+            output = open(args.output, "w", newline="", encoding="utf-8")
+        with output as handle:
+            writer = _RowWriter(handle, _output_format(args))
+            if profiler is not None:
+                profiler.enable()
+            try:
+                report, timings = args.handler(args, writer)
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+            writer.close()
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); keep Python from complaining again at exit.
+        sys.stdout = open(os.devnull, "w")
+        return 1
+    except (OSError, ValueError, ImportError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    print(str(report).replace("Import", f"{args.command} {args.action}", 1), file=sys.stderr)
+    for row_number, reason in report.rejected:
+        print(f"  row {row_number}: {reason}", file=sys.stderr)
+    if report.rejected_count > len(report.rejected):
+        print(f"  ... {report.rejected_count - len(report.rejected):,} more", file=sys.stderr)
+    if profiler is not None:
+        _print_profile(args, report, timings, elapsed, profiler)
+    return 0
@@ -0,0 +1,286 @@
+"""Optional SQLite persistence for containers, plantings, and gardens."""
+
+from datetime import date
+import sqlite3
+
+from .dates import _SEASON_CALENDAR
+from .garden import Garden, PlantingRecords, _plant_key
+
+
+# Container IDs, plant names, and plant keys are declared without a type, so SQLite
+# keeps each value as it was given (an int ID comes back as an int, not a string),
+# just as the in-memory stores do.
+_DATABASE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS containers (
+    seq INTEGER PRIMARY KEY,
+    fleet TEXT NOT NULL,
+    id NOT NULL,
+    shape TEXT NOT NULL,
+    length REAL NOT NULL,
+    width REAL,
+    depth REAL NOT NULL,
+    area_sq_in REAL NOT NULL,
+    volume_cu_in REAL NOT NULL,
+    UNIQUE (fleet, id)
+);
+CREATE INDEX IF NOT EXISTS containers_shape ON containers (fleet, shape);
+CREATE INDEX IF NOT EXISTS containers_depth ON containers (fleet, depth);
+CREATE INDEX IF NOT EXISTS containers_volume ON containers (fleet, volume_cu_in);
+
+CREATE TABLE IF NOT EXISTS gardens (
+    name TEXT PRIMARY KEY,
+    last_frost INTEGER NOT NULL,
+    first_frost INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS plants (
+    garden TEXT NOT NULL REFERENCES gardens (name),
+    position INTEGER NOT NULL,
+    plant_type TEXT NOT NULL,
+    plant_key TEXT NOT NULL,
+    count NUMERIC NOT NULL,
+    tolerance TEXT NOT NULL,
+    avg_per_plant NUMERIC,
+    PRIMARY KEY (garden, position)
+);
+CREATE INDEX IF NOT EXISTS plants_type ON plants (plant_key);
+
+CREATE TABLE IF NOT EXISTS plantings (
+    seq INTEGER PRIMARY KEY,
+    schedule TEXT NOT NULL,
+    plant,
+    plant_key,
+    day INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    container
+);
+CREATE INDEX IF NOT EXISTS plantings_day ON plantings (schedule, day);
+CREATE INDEX IF NOT EXISTS plantings_season ON plantings (schedule, season, year, container);
+CREATE INDEX IF NOT EXISTS plantings_container ON plantings (schedule, container);
+CREATE INDEX IF NOT EXISTS plantings_plant ON plantings (schedule, plant_key);
+"""
+
+
+class GardenDatabase:
+    """
+    SQLite persistence for containers, gardens, and planting records.
+
+    The database runs in WAL mode so readers are not blocked by a writer, and
+    every write method commits its own transaction; bulk writes go through
+    executemany. Several fleets and schedules can share one file, each under its
+    own name.
+
+        with GardenDatabase("garden.db") as db:
+            manager = ContainerManagement(store=db.container_store())
+            schedule = PlantingSchedule("Plot 7", store=db.planting_store("plot-7"))
+    """
+
+    def __init__(self, path=":memory:"):
+        self._path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_DATABASE_SCHEMA)
+
+    @property
+    def connection(self):
+        return self._connection
+
+    def container_store(self, fleet="default"):
+        """Return a store for ContainerManagement(store=...) backed by this database."""
+        return SQLiteContainerStore(self._connection, fleet)
+
+    def planting_store(self, schedule="default"):
+        """Return a store for PlantingSchedule(store=...) backed by this database."""
+        return SQLitePlantingStore(self._connection, schedule)
+
+    def save_garden(self, garden):
+        """Write a Garden and its plants, replacing any garden saved under the same name."""
+        rows = [(garden.name(), position, str(plant["plant_type"]), str(plant["plant_type"]).lower(),
+                 plant["count"], plant["tolerance"], plant["avg_per_plant"])
+                for position, plant in enumerate(garden.plants())]
+        with self._connection:
+            self._connection.execute("DELETE FROM plants WHERE garden = ?", (garden.name(),))
+            self._connection.execute(
+                "INSERT OR REPLACE INTO gardens (name, last_frost, first_frost) VALUES (?, ?, ?)",
+                (garden.name(), garden.last_frost().toordinal(), garden.first_frost().toordinal()))
+            self._connection.executemany(
+                "INSERT INTO plants (garden, position, plant_type, plant_key, count, tolerance, avg_per_plant)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def load_garden(self, name):
+        """
+        Rebuild a saved Garden.
+
+        Raises:
+            ValueError: If no garden is saved under this name
+        """
+        row = self._connection.execute(
+            "SELECT last_frost, first_frost FROM gardens WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            raise ValueError(f"Garden {name} not found.")
+        garden = Garden(name, date.fromordinal(row[0]), date.fromordinal(row[1]))
+        plants = self._connection.execute(
+            "SELECT plant_type, count, tolerance, avg_per_plant FROM plants WHERE garden = ? ORDER BY position",
+            (name,))
+        for plant_type, count, tolerance, avg_per_plant in plants:
+            garden.add_plant(plant_type, count, tolerance, avg_per_plant)
+        return garden
+
+    def garden_names(self):
+        return [name for name, in self._connection.execute("SELECT name FROM gardens ORDER BY name")]
+
+    def find_plants(self, plant_type):
+        """
+        Return (garden name, plant_type, count, tolerance) for every saved planting of a
+        plant type, compared without regard to case, using the plant type index.
+        """
+        return self._connection.execute(
+            "SELECT garden, plant_type, count, tolerance FROM plants WHERE plant_key = ? ORDER BY garden, position",
+            (plant_type.lower(),)).fetchall()
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __str__(self):
+        return f"GardenDatabase - {self._path}"
+
+
+class SQLiteContainerStore:
+    """
+    ContainerRegistry replacement that keeps one fleet's containers in SQLite.
+
+    Containers are the dicts built by ContainerManagement. get() and find() return
+    new dicts, so changing a returned dict does not change the database.
+    """
+
+    _COLUMNS = "id, shape, length, width, depth, area_sq_in, volume_cu_in"
+
+    def __init__(self, connection, fleet="default"):
+        self._connection = connection
+        self._fleet = fleet
+
+    def _row(self, container):
+        return (self._fleet, container['id'], container['shape'], container['length'], container['width'],
+                container['depth'], container['area_sq_in'], container['volume_cu_in'])
+
+    def _insert(self, rows):
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    f"INSERT INTO containers (fleet, {self._COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        except sqlite3.IntegrityError:
+            raise ValueError("Container ID already exists.") from None
+
+    def add(self, container_id, container, shape, depth, volume):
+        """
+        Store a container dict.
+
+        Raises:
+            ValueError: If the ID is already stored in this fleet
+        """
+        if container_id in self:
+            raise ValueError(f"Container with ID {container_id} already exists.")
+        self._insert([self._row(container)])
+
+    def add_many(self, items):
+        """Store (container_id, container, shape, depth, volume) tuples in one transaction."""
+        self._insert([self._row(item[1]) for item in items])
+
+    def remove(self, container_id):
+        container = self.get(container_id)
+        with self._connection:
+            self._connection.execute("DELETE FROM containers WHERE fleet = ? AND id = ?", (self._fleet, container_id))
+        return container
+
+    def get(self, container_id):
+        row = self._connection.execute(
+            f"SELECT {self._COLUMNS} FROM containers WHERE fleet = ? AND id = ?", (self._fleet, container_id)
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"Container with ID {container_id} not found.")
+        return self._container(row)
+
+    @staticmethod
+    def _container(row):
+        return dict(zip(('id', 'shape', 'length', 'width', 'depth', 'area_sq_in', 'volume_cu_in'), row))
+
+    def values(self):
+        return self.find()
+
+    def find(self, shape=None, min_depth=None, max_depth=None, min_volume=None, max_volume=None):
+        """Return the containers matching every given filter in insertion order, filtered in SQL."""
+        conditions = ["fleet = ?"]
+        parameters = [self._fleet]
+        for clause, value in (("shape = ?", shape), ("depth >= ?", min_depth), ("depth <= ?", max_depth),
+                              ("volume_cu_in >= ?", min_volume), ("volume_cu_in <= ?", max_volume)):
+            if value is not None:
+                conditions.append(clause)
+                parameters.append(value)
+        rows = self._connection.execute(
+            f"SELECT {self._COLUMNS} FROM containers WHERE {' AND '.join(conditions)} ORDER BY seq", parameters)
+        return [self._container(row) for row in rows]
+
+    def __contains__(self, container_id):
+        return self._connection.execute(
+            "SELECT 1 FROM containers WHERE fleet = ? AND id = ?", (self._fleet, container_id)
+        ).fetchone() is not None
+
+    def __len__(self):
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM containers WHERE fleet = ?", (self._fleet,)).fetchone()[0]
+
+
+class SQLitePlantingStore:
+    """PlantingIndex replacement that keeps one schedule's planting records in SQLite."""
+
+    def __init__(self, connection, schedule="default"):
+        self._connection = connection
+        self._schedule = schedule
+
+    def _row(self, record):
+        planted = record['date']
+        return (self._schedule, record['plant'], _plant_key(record['plant']), planted.toordinal(),
+                _SEASON_CALENDAR.season_of(planted), planted.year, record['container'])
+
+    def add(self, record):
+        """Store a record with 'plant', 'date' (date) and 'container' keys."""
+        self.add_many([record])
+
+    def add_many(self, records):
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO plantings (schedule, plant, plant_key, day, season, year, container)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)", [self._row(record) for record in records])
+
+    def _select(self, conditions, parameters, order="seq"):
+        rows = self._connection.execute(
+            f"SELECT plant, day, container FROM plantings WHERE schedule = ?{''.join(' AND ' + c for c in conditions)}"
+            f" ORDER BY {order}", [self._schedule] + parameters)
+        return PlantingRecords([{'plant': plant, 'date': date.fromordinal(day), 'container': container}
+                                for plant, day, container in rows])
+
+    def find(self, season=None, year=None, container_id=None, plant=None):
+        """Return the records matching every given filter, in the order they were added."""
+        conditions = []
+        parameters = []
+        for clause, value in (("season = ?", season), ("year = ?", year), ("container = ?", container_id),
+                              ("plant_key = ?", _plant_key(plant))):
+            if value is not None:
+                conditions.append(clause)
+                parameters.append(value)
+        return self._select(conditions, parameters)
+
+    def between(self, start, end):
+        """Return the records planted from start to end (dates, inclusive), by planting date."""
+        return self._select(["day BETWEEN ? AND ?"], [start.toordinal(), end.toordinal()], "day, seq")
+
+    def __len__(self):
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM plantings WHERE schedule = ?", (self._schedule,)).fetchone()[0]
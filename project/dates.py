@@ -0,0 +1,564 @@
+"""Date parsing, frost dates, seasons, and the frost and season calendars."""
+
+from bisect import bisect_right
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+import re
+from typing import Union
+
+from ._common import _require_numpy
+
+
+Dateish = Union[str, date]
+
+
+DATE_CACHE_SIZE = 4096
+
+_US_DATE = re.compile(r"(\d{1,2})([/-])(\d{1,2})\2(\d{4})", re.ASCII)
+_ISO_DATE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})", re.ASCII)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_mdy(text):
+    """
+    Parse a 'MM/DD/YYYY' string the way to_date always has.
+
+    Returns None when the string does not have three parts so each caller can
+    raise its own message.
+    """
+    parts = text.split("/")
+    if len(parts) != 3:
+        return None
+    month = int(parts[0])
+    day = int(parts[1])
+    year = int(parts[2])
+    return date(year, month, day)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_iso(text):
+    """
+    Parse a 'YYYY-MM-DD' string with the same results as strptime(text, '%Y-%m-%d').
+
+    Plain digit layouts are handled directly; anything else, including invalid
+    dates, goes through strptime so the errors are unchanged.
+    """
+    match = _ISO_DATE.fullmatch(text)
+    if match:
+        try:
+            return date(int(match[1]), int(match[2]), int(match[3]))
+        except ValueError:
+            pass
+    return datetime.strptime(text, '%Y-%m-%d').date()
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _format_us_date(text):
+    match = _US_DATE.fullmatch(text)
+    if match and int(match[4]) >= 1000:
+        try:
+            return date(int(match[4]), int(match[1]), int(match[3])).isoformat()
+        except ValueError:
+            pass
+    try:
+        date_obj = datetime.strptime(text, '%m/%d/%Y')
+    except ValueError:
+        try:
+            date_obj = datetime.strptime(text, '%m-%d-%Y')
+        except ValueError:
+            raise ValueError(f"Date format is invalid or unparsable: {text}")
+    return date_obj.strftime('%Y-%m-%d')
+
+
+def parse_dates(values, layout='MM/DD/YYYY', errors='raise'):
+    """
+    Parse a whole column of date strings in one call.
+
+    Parameters:
+        values (iterable): Date strings (date objects are passed through)
+        layout (str): 'MM/DD/YYYY' (same rules as to_date) or 'YYYY-MM-DD'
+        errors (str): 'raise' to stop at the first bad value, 'coerce' to put None in its place
+
+    Returns:
+        list: date objects in the same order as values
+
+    Raises:
+        ValueError: If layout or errors is unknown, or a value cannot be parsed and errors='raise'
+        TypeError: If a value is not a string or date and errors='raise'
+    """
+    if layout == 'MM/DD/YYYY':
+        parse = to_date
+    elif layout == 'YYYY-MM-DD':
+        def parse(value):
+            return value if isinstance(value, date) else _parse_iso(value)
+    else:
+        raise ValueError("Layout must be 'MM/DD/YYYY' or 'YYYY-MM-DD'.")
+    if errors not in ('raise', 'coerce'):
+        raise ValueError("Errors must be 'raise' or 'coerce'.")
+
+    seen = {}
+    parsed = []
+    for value in values:
+        try:
+            result = seen[value]
+        except (KeyError, TypeError):
+            try:
+                result = parse(value)
+            except (ValueError, TypeError):
+                if errors == 'raise':
+                    raise
+                result = None
+            if isinstance(value, str):
+                seen[value] = result
+        parsed.append(result)
+    return parsed
+
+
+def date_cache_info():
+    """Return the lru_cache statistics of the shared date parsers, keyed by layout."""
+    return {
+        'MM/DD/YYYY': _parse_mdy.cache_info(),
+        'YYYY-MM-DD': _parse_iso.cache_info(),
+        'format_planting_date': _format_us_date.cache_info(),
+    }
+
+
+def clear_date_cache():
+    """Empty the caches of the shared date parsers."""
+    _parse_mdy.cache_clear()
+    _parse_iso.cache_clear()
+    _format_us_date.cache_clear()
+
+
+def format_planting_date(date_str: str) -> str:
+    """
+    Formats a date string into a standard YYYY-MM-DD format.
+
+    Parameters:
+        date_str (str): The date string to format (e.g., '3/1/2025').
+
+    Returns:
+        str: The date formatted as YYYY-MM-DD.
+
+    Raises:
+        TypeError: If date_str is not a string.
+        ValueError: If the date_str cannot be parsed into a valid date.
+    """
+    if not isinstance(date_str, str):
+        raise TypeError("Date must be provided as a string.")
+    return _format_us_date(date_str)
+
+
+def calculate_season_change(current_date=None):
+    """
+    Calculate the estimated amount of time (in days) before the season's change.
+
+    Parameters:
+        current_date: The current date of the user using the function. If none, default will be today's date.
+
+    Returns:
+        dict:
+            'current_date'
+            'next_season'
+            'season_start_date'
+            'days_remaining'
+
+    Raises:
+        TypeError: If current_date is invalid
+    """
+    if current_date is None:
+        current_date = datetime.today()
+    elif not isinstance(current_date, datetime):
+        raise TypeError("Date is invalid.")
+
+    _, next_season, season_start = _SEASON_CALENDAR.lookup(current_date)
+    days_remaining = season_start - current_date.toordinal()
+    if current_date.time() != datetime.min.time():
+        # Any time past midnight leaves one less full day before the season starts.
+        days_remaining -= 1
+
+    return {
+        'current_date': current_date.strftime('%Y-%m-%d'),
+        'next_season': next_season,
+        'season_start_date': _SEASON_CALENDAR.start_string(season_start),
+        'days_remaining': days_remaining
+    }
+
+
+def to_date(value):
+    """
+    Convert a value to a date. Accepts date or 'MM/DD/YYYY' string.
+    """
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        parsed = _parse_mdy(value)
+        if parsed is None:
+            raise ValueError("Use MM/DD/YYYY format.")
+        return parsed
+    else:
+        raise TypeError("Enter a date or a string in MM/DD/YYYY format.")
+
+
+_to_date = to_date
+
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _date_ordinals(dates):
+    """Convert a column of dates to a NumPy array of day ordinals."""
+    np = _require_numpy()
+    if isinstance(dates, np.ndarray):
+        if np.issubdtype(dates.dtype, np.datetime64):
+            return dates.astype('datetime64[D]').astype(np.int64) + _UNIX_EPOCH_ORDINAL
+        if np.issubdtype(dates.dtype, np.integer):
+            return dates.astype(np.int64, copy=False)
+    return np.fromiter((to_date(value).toordinal() for value in dates), dtype=np.int64)
+
+
+def days_until_frost(today: Dateish, first_frost_date: Dateish) -> int:
+    t = _to_date(today)
+    f = _to_date(first_frost_date)
+    delta_days = (f - t).days
+    return delta_days if delta_days > 0 else 0
+
+
+FROST_OFFSETS = {"tender": 0, "half-hardy": -7, "hardy": -14}
+
+
+def is_safe_to_plant(plant_date, last_frost, tolerance="tender", extra_days=0):
+    """ Check if it's safe to plant based on frost tolerance."""
+    p = to_date(plant_date)
+    l = to_date(last_frost)
+
+    tolerance = tolerance.lower()
+
+    if tolerance not in FROST_OFFSETS:
+        raise ValueError("Tolerance must be tender, half-hardy, or hardy.")
+
+    safe_day = l + timedelta(days=FROST_OFFSETS[tolerance] + extra_days)
+    return p >= safe_day
+
+
+def _safe_day_ordinal(last_frost, tolerance, extra_days=0):
+    """Return the day ordinal from which planting is safe for a frost tolerance class."""
+    tolerance = tolerance.lower()
+    if tolerance not in FROST_OFFSETS:
+        raise ValueError("Tolerance must be tender, half-hardy, or hardy.")
+    return (to_date(last_frost) + timedelta(days=FROST_OFFSETS[tolerance] + extra_days)).toordinal()
+
+
+def is_safe_to_plant_batch(plant_dates, last_frost, tolerances, extra_days=0):
+    """
+    Check frost safety for many planting dates and tolerances in one vectorized pass.
+
+    The safe-day threshold of each tolerance class is worked out once, and every
+    date is then compared against it as a day ordinal.
+
+    Parameters:
+        plant_dates: NumPy array of day ordinals or datetime64 values, or an iterable of
+            dates / 'MM/DD/YYYY' strings
+        last_frost (date or str): Last frost date
+        tolerances (str or iterable): One tolerance, or one per result row
+        extra_days (int): Extra days to wait after the usual safe day
+
+    Returns:
+        numpy.ndarray: booleans, shaped (len(tolerances), len(plant_dates)), or
+            (len(plant_dates),) when a single tolerance string is given
+
+    Raises:
+        ValueError: If a tolerance is not tender, half-hardy, or hardy
+    """
+    np = _require_numpy()
+    ordinals = _date_ordinals(plant_dates)
+    if isinstance(tolerances, str):
+        return ordinals >= _safe_day_ordinal(last_frost, tolerances, extra_days)
+    by_class = {}
+    thresholds = []
+    for tolerance in tolerances:
+        if tolerance not in by_class:
+            by_class[tolerance] = _safe_day_ordinal(last_frost, tolerance, extra_days)
+        thresholds.append(by_class[tolerance])
+    thresholds = np.array(thresholds, dtype=np.int64).reshape(-1, 1)
+    return ordinals[np.newaxis, :] >= thresholds
+
+
+FROST_TABLE_CACHE_SIZE = 1024
+
+
+def _month_day(value):
+    """Return (month, day) from a date, an 'MM/DD' string, or an 'MM/DD/YYYY' string."""
+    if isinstance(value, date):
+        return value.month, value.day
+    if isinstance(value, str):
+        parts = value.split("/")
+        if len(parts) in (2, 3):
+            month, day = int(parts[0]), int(parts[1])
+            date(2000, month, day)
+            return month, day
+    raise ValueError("Frost dates must be dates or 'MM/DD' strings.")
+
+
+@lru_cache(maxsize=FROST_TABLE_CACHE_SIZE)
+def _frost_table(last_frost, first_frost, year):
+    """
+    Precompute one zone's frost day ordinals for a year.
+
+    Parameters:
+        last_frost (tuple): (month, day) of the last spring frost
+        first_frost (tuple): (month, day) of the first fall frost
+        year (int): The year
+
+    Returns:
+        tuple: last frost, first frost, then the tender, half-hardy, and hardy
+            safe-planting days, all as day ordinals
+    """
+    # calendar pulls in locale, so it is only imported once a frost table is built.
+    from calendar import monthrange
+
+    def on(month, day):
+        # Feb 29 frost dates fall on Feb 28 in other years.
+        return date(year, month, min(day, monthrange(year, month)[1])).toordinal()
+
+    last = on(*last_frost)
+    first = on(*first_frost)
+    return (last, first) + tuple(last + FROST_OFFSETS[t] for t in ("tender", "half-hardy", "hardy"))
+
+
+class FrostCalendar:
+    """
+    Maps sites to frost zones and answers frost questions for many sites at once.
+
+    Each zone stores its frost dates as month/day pairs. The day ordinals for a
+    (zone, year) are built once and kept in an LRU cache shared by every zone with
+    the same dates.
+    """
+
+    _TABLE_COLUMNS = {"tender": 2, "half-hardy": 3, "hardy": 4}
+
+    def __init__(self):
+        self._zones = {}
+        self._zone_codes = {}
+        self._sites = {}
+
+    def add_zone(self, zone, last_frost, first_frost):
+        """
+        Add or replace a frost zone.
+
+        Parameters:
+            zone (str): Zone name (e.g. '7a')
+            last_frost (date or str): Last spring frost, as a date or 'MM/DD'
+            first_frost (date or str): First fall frost, as a date or 'MM/DD'
+
+        Raises:
+            ValueError: If a frost date cannot be read
+        """
+        if zone not in self._zone_codes:
+            self._zone_codes[zone] = len(self._zone_codes)
+        self._zones[zone] = (_month_day(last_frost), _month_day(first_frost))
+
+    def add_site(self, site, zone):
+        """
+        Put a site in a frost zone.
+
+        Raises:
+            ValueError: If the zone has not been added
+        """
+        if zone not in self._zones:
+            raise ValueError(f"Unknown frost zone: {zone}")
+        self._sites[site] = zone
+
+    def zone_of(self, site):
+        try:
+            return self._sites[site]
+        except KeyError:
+            raise ValueError(f"Unknown site: {site}") from None
+
+    def frost_dates(self, site, year):
+        """Return the site's (last frost, first frost) dates for a year."""
+        table = _frost_table(*self._zones[self.zone_of(site)], year)
+        return date.fromordinal(table[0]), date.fromordinal(table[1])
+
+    def garden(self, site, name, year):
+        """Create a Garden that uses the site's frost dates for a year."""
+        from .garden import Garden
+
+        last_frost, first_frost = self.frost_dates(site, year)
+        return Garden(name, last_frost, first_frost)
+
+    def days_until_frost(self, site, today):
+        """Days from today until the site's first fall frost of the same year (0 once it has passed)."""
+        today = to_date(today)
+        first = _frost_table(*self._zones[self.zone_of(site)], today.year)[1]
+        return max(first - today.toordinal(), 0)
+
+    def is_safe_to_plant(self, site, plant_date, tolerance="tender", extra_days=0):
+        """Check if planting at a site on a date is safe, like is_safe_to_plant."""
+        plant_date = to_date(plant_date)
+        column = self._tolerance_column(tolerance)
+        safe_day = _frost_table(*self._zones[self.zone_of(site)], plant_date.year)[column]
+        return plant_date.toordinal() >= safe_day + extra_days
+
+    def _tolerance_column(self, tolerance):
+        column = self._TABLE_COLUMNS.get(tolerance.lower())
+        if column is None:
+            raise ValueError("Tolerance must be tender, half-hardy, or hardy.")
+        return column
+
+    def _lookup(self, sites, dates, column):
+        """
+        Gather one frost-table column for every (site, date) pair.
+
+        Returns:
+            tuple: (day ordinals of the dates, the table value for each pair)
+        """
+        np = _require_numpy()
+        ordinals = _date_ordinals(dates)
+        zone_codes = self._zone_codes
+        sites = list(sites)
+        if len(sites) != len(ordinals):
+            raise ValueError("Sites and dates must be the same length.")
+        try:
+            codes = np.fromiter((zone_codes[self._sites[site]] for site in sites), dtype=np.int64, count=len(sites))
+        except KeyError:
+            missing = next(site for site in sites if site not in self._sites)
+            raise ValueError(f"Unknown site: {missing}") from None
+        if ordinals.size == 0:
+            return ordinals, ordinals.copy()
+
+        years = (ordinals - _UNIX_EPOCH_ORDINAL).astype('datetime64[D]').astype('datetime64[Y]').astype(np.int64) + 1970
+        first_year = int(years.min())
+        span = int(years.max()) - first_year + 1
+        keys, inverse = np.unique(codes * span + (years - first_year), return_inverse=True)
+        zones_by_code = {code: self._zones[zone] for zone, code in zone_codes.items()}
+        values = np.array([_frost_table(*zones_by_code[int(key) // span], first_year + int(key) % span)[column]
+                           for key in keys], dtype=np.int64)
+        return ordinals, values[inverse.reshape(-1)]
+
+    def days_until_frost_batch(self, sites, dates):
+        """
+        Days until the first fall frost for many (site, date) pairs in one vectorized pass.
+
+        Parameters:
+            sites (iterable): Site for each row
+            dates: Date for each row (NumPy ordinals or datetime64, dates, or 'MM/DD/YYYY' strings)
+
+        Returns:
+            numpy.ndarray: days until frost, 0 once the frost has passed
+
+        Raises:
+            ValueError: If a site is unknown or the columns differ in length
+        """
+        np = _require_numpy()
+        ordinals, first_frost = self._lookup(sites, dates, 1)
+        return np.maximum(first_frost - ordinals, 0)
+
+    def is_safe_to_plant_batch(self, sites, dates, tolerance="tender", extra_days=0):
+        """
+        Check planting safety for many (site, date) pairs in one vectorized pass.
+
+        Parameters:
+            sites (iterable): Site for each row
+            dates: Planting date for each row (NumPy ordinals or datetime64, dates, or 'MM/DD/YYYY' strings)
+            tolerance (str): Frost tolerance used for every row
+            extra_days (int): Extra days to wait after the usual safe day
+
+        Returns:
+            numpy.ndarray: True where planting is safe
+
+        Raises:
+            ValueError: If a site or the tolerance is unknown
+        """
+        ordinals, safe_day = self._lookup(sites, dates, self._tolerance_column(tolerance))
+        return ordinals >= safe_day + extra_days
+
+    def __len__(self):
+        return len(self._sites)
+
+    def __str__(self):
+        return f"FrostCalendar - {len(self._zones)} zones, {len(self._sites)} sites."
+
+
+SEASONS = ('Spring', 'Summer', 'Fall', 'Winter')
+SEASON_STARTS = ((3, 20), (6, 21), (9, 22), (12, 21))
+
+
+class SeasonCalendar:
+    """
+    Answers season questions by bisecting day ordinals against season start
+    dates that are computed once per year.
+    """
+
+    def __init__(self):
+        self._years = {}
+        self._start_strings = {}
+
+    def boundaries(self, year):
+        """
+        Return the day ordinals of the year's Spring, Summer, Fall, and Winter
+        start dates followed by the next year's Spring start.
+        """
+        bounds = self._years.get(year)
+        if bounds is None:
+            bounds = tuple(date(year, month, day).toordinal() for month, day in SEASON_STARTS)
+            bounds += (date(year + 1, *SEASON_STARTS[0]).toordinal(),)
+            self._years[year] = bounds
+        return bounds
+
+    def lookup(self, day):
+        """
+        Find the season a date falls in.
+
+        Parameters:
+            day (date): The date to look up (a datetime is looked up by its calendar day)
+
+        Returns:
+            tuple: (current season, next season, day ordinal of the next season's start)
+        """
+        bounds = self.boundaries(day.year)
+        index = bisect_right(bounds, day.toordinal(), 0, 4)
+        if index == 0:
+            return 'Winter', 'Spring', bounds[0]
+        if index == 4:
+            return 'Winter', 'Spring', bounds[4]
+        return SEASONS[index - 1], SEASONS[index], bounds[index]
+
+    def season_of(self, day):
+        return self.lookup(day)[0]
+
+    def start_string(self, ordinal):
+        """Return a season start ordinal as a 'YYYY-MM-DD' string."""
+        text = self._start_strings.get(ordinal)
+        if text is None:
+            text = date.fromordinal(ordinal).strftime('%Y-%m-%d')
+            self._start_strings[ordinal] = text
+        return text
+
+    def label_seasons(self, dates):
+        """
+        Label a whole column of dates with their seasons in one vectorized pass.
+
+        Parameters:
+            dates: NumPy array of day ordinals or datetime64 values, or an iterable of
+                dates / 'MM/DD/YYYY' strings
+
+        Returns:
+            numpy.ndarray: season names, one per date
+        """
+        np = _require_numpy()
+        ordinals = self.ordinals(dates)
+        if ordinals.size == 0:
+            return np.array([], dtype='<U6')
+        first_year = date.fromordinal(int(ordinals.min())).year
+        last_year = date.fromordinal(int(ordinals.max())).year
+        edges = np.array([bound for year in range(first_year, last_year + 1)
+                          for bound in self.boundaries(year)[:4]], dtype=np.int64)
+        index = np.searchsorted(edges, ordinals, side='right')
+        return np.array(SEASONS)[(index + 3) % 4]
+
+    def ordinals(self, dates):
+        """Convert a column of dates to a NumPy array of day ordinals."""
+        return _date_ordinals(dates)
+
+
+_SEASON_CALENDAR = SeasonCalendar()
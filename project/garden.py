@@ -0,0 +1,582 @@
+"""Gardens, planting records, and planting schedules."""
+
+from collections.abc import Sequence
+from datetime import date
+import threading
+
+from ._common import _insert_rows, _require_numpy
+from .dates import (_SEASON_CALENDAR, _parse_mdy, _safe_day_ordinal, days_until_frost, is_safe_to_plant_batch,
+                    to_date)
+from .yields import estimate_harvest_yield
+
+
+class Garden:
+    def __init__(self, name, last_frost, first_frost):
+        self._name = name
+        self._last_frost = to_date(last_frost)
+        self._first_frost = to_date(first_frost)
+        self._plants = []
+        # Running yield aggregates, kept up to date by add_plant, update_plant, and remove_plant.
+        self._yields = []
+        self._total_lb = 0
+        self._by_type = {}
+        self._unknown = 0
+
+    def name(self):
+        return self._name
+
+    def last_frost(self):
+        return self._last_frost
+
+    def first_frost(self):
+        return self._first_frost
+
+    def plants(self):
+        return list(self._plants)
+
+    def _validate_plant(self, plant_type, count, tolerance):
+        if not plant_type:
+            raise ValueError("Plant type required.")
+        if count < 0:
+            raise ValueError("Count must be >= 0.")
+        tolerance = tolerance.lower()
+        if tolerance not in ["tender", "half-hardy", "hardy"]:
+            raise ValueError("Tolerance must be tender, half-hardy, or hardy.")
+        return tolerance
+
+    def _plant_yield(self, plant):
+        """Return the plant's yield estimate, or None if it cannot be estimated yet."""
+        try:
+            return estimate_harvest_yield(plant["plant_type"], plant["count"], plant["avg_per_plant"])
+        except (ValueError, AttributeError):
+            return None
+
+    def _recount_yields(self):
+        self._total_lb = 0
+        self._by_type = {}
+        self._unknown = 0
+        for y in self._yields:
+            if y is None:
+                self._unknown += 1
+            else:
+                self._total_lb += y["total"]
+                self._by_type[y["plant"]] = self._by_type.get(y["plant"], 0) + y["total"]
+
+    def _matching_plants(self, plant_type):
+        key = plant_type.lower()
+        positions = [i for i, p in enumerate(self._plants) if str(p["plant_type"]).lower() == key]
+        if not positions:
+            raise ValueError(f"No {plant_type} plants in this garden.")
+        return positions
+
+    def add_plant(self, plant_type, count, tolerance="tender", avg_per_plant=None):
+        tolerance = self._validate_plant(plant_type, count, tolerance)
+        plant = {
+            "plant_type": plant_type,
+            "count": count,
+            "tolerance": tolerance,
+            "avg_per_plant": avg_per_plant
+        }
+        y = self._plant_yield(plant)
+        self._plants.append(plant)
+        self._yields.append(y)
+        if y is None:
+            self._unknown += 1
+        else:
+            self._total_lb += y["total"]
+            self._by_type[y["plant"]] = self._by_type.get(y["plant"], 0) + y["total"]
+
+    def update_plant(self, plant_type, count=None, tolerance=None, avg_per_plant=None):
+        """
+        Change every entry for a plant type (matched without regard to case).
+
+        Parameters:
+            plant_type (str): The plant type to update
+            count (int): New number of plants, or None to keep the current count
+            tolerance (str): New frost tolerance, or None to keep the current one
+            avg_per_plant (float): New pounds per plant, or None to keep the current value
+
+        Returns:
+            int: number of entries updated
+
+        Raises:
+            ValueError: If the garden has no plants of that type or the new values are invalid
+        """
+        positions = self._matching_plants(plant_type)
+        for i in positions:
+            plant = self._plants[i]
+            new_count = plant["count"] if count is None else count
+            new_tolerance = self._validate_plant(
+                plant["plant_type"], new_count, plant["tolerance"] if tolerance is None else tolerance)
+            plant.update(count=new_count, tolerance=new_tolerance)
+            if avg_per_plant is not None:
+                plant["avg_per_plant"] = avg_per_plant
+            self._yields[i] = self._plant_yield(plant)
+        self._recount_yields()
+        return len(positions)
+
+    def remove_plant(self, plant_type):
+        """
+        Remove every entry for a plant type (matched without regard to case).
+
+        Returns:
+            int: number of entries removed
+
+        Raises:
+            ValueError: If the garden has no plants of that type
+        """
+        positions = set(self._matching_plants(plant_type))
+        self._plants = [p for i, p in enumerate(self._plants) if i not in positions]
+        self._yields = [y for i, y in enumerate(self._yields) if i not in positions]
+        self._recount_yields()
+        return len(positions)
+
+    def add_plants(self, rows):
+        """
+        Add many plants at once.
+
+        Parameters:
+            rows (iterable): (plant_type, count, tolerance, avg_per_plant) tuples
+
+        Returns:
+            list: (position, reason) for each row that was rejected
+        """
+        return _insert_rows(self.add_plant, rows)
+
+    def is_safe_on(self, plant_date):
+        if not self._plants:
+            return []
+        day = to_date(plant_date).toordinal()
+        thresholds = {}
+        results = []
+        for p in self._plants:
+            tolerance = p["tolerance"]
+            if tolerance not in thresholds:
+                thresholds[tolerance] = _safe_day_ordinal(self._last_frost, tolerance)
+            results.append((p["plant_type"], day >= thresholds[tolerance]))
+        return results
+
+    def safe_days(self, start, days, packed=False):
+        """
+        Work out which of the next `days` days are safe to plant, for every plant at once.
+
+        Parameters:
+            start (date or str): First day to check
+            days (int): Number of days to check
+            packed (bool): Return bitmaps packed 8 days per byte with numpy.packbits
+
+        Returns:
+            list: (plant_type, numpy array) pairs, one boolean (or packed bit) per day
+
+        Raises:
+            ValueError: If days is negative
+        """
+        np = _require_numpy()
+        if days < 0:
+            raise ValueError("Days must be 0 or more.")
+        first = to_date(start).toordinal()
+        ordinals = np.arange(first, first + days, dtype=np.int64)
+        matrix = is_safe_to_plant_batch(ordinals, self._last_frost, [p["tolerance"] for p in self._plants])
+        if packed:
+            matrix = np.packbits(matrix, axis=1)
+        return [(p["plant_type"], row) for p, row in zip(self._plants, matrix)]
+
+    def first_safe_dates(self, start=None):
+        """
+        Return the first day on or after start that each plant can safely go in the ground.
+
+        Parameters:
+            start (date or str): Earliest day to consider, today when None
+
+        Returns:
+            list: (plant_type, date) pairs
+        """
+        first = date.today().toordinal() if start is None else to_date(start).toordinal()
+        thresholds = {}
+        results = []
+        for p in self._plants:
+            tolerance = p["tolerance"]
+            if tolerance not in thresholds:
+                thresholds[tolerance] = date.fromordinal(max(first, _safe_day_ordinal(self._last_frost, tolerance)))
+            results.append((p["plant_type"], thresholds[tolerance]))
+        return results
+
+    def total_yield(self, include_details=True):
+        """
+        Return the garden's estimated harvest from the running totals.
+
+        The per-plant estimates are kept up to date as plants change, so 'by_plant'
+        holds fresh copies of them rather than re-estimating every plant; pass
+        include_details=False when only the total is needed.
+
+        Parameters:
+            include_details (bool): Also return the per-entry 'by_plant' list
+
+        Returns:
+            dict: 'garden', 'total_lb', and (when include_details) 'by_plant'
+
+        Raises:
+            ValueError: If a plant has an unknown type and no avg_per_plant
+        """
+        if self._unknown:
+            for p, y in zip(self._plants, self._yields):
+                if y is None:
+                    estimate_harvest_yield(p["plant_type"], p["count"], p["avg_per_plant"])
+        result = {"garden": self._name, "total_lb": self._total_lb}
+        if include_details:
+            result["by_plant"] = [dict(y) for y in self._yields]
+        return result
+
+    def yield_by_type(self):
+        """Return the total pounds expected for each (lowercase) plant type."""
+        return dict(self._by_type)
+
+    def days_until_first_frost(self, today):
+        return days_until_frost(today, self._first_frost)
+
+    def __str__(self):
+        return f"{self._name} Garden with {len(self._plants)} plants."
+
+    def __repr__(self):
+        return f"Garden(name={self._name}, last_frost={self._last_frost}, first_frost={self._first_frost})"
+
+
+def _plant_key(plant_name):
+    """Return the key plant names are indexed by: lowercased for strings, unchanged otherwise."""
+    return plant_name.lower() if isinstance(plant_name, str) else plant_name
+
+
+class PlantingRecords(Sequence):
+    """
+    Read-only view of planting records, either every record or only the ones at
+    the given positions. Nothing is copied when the view is created; the lists it
+    reads are append-only, so the view keeps the length they had at that point and
+    records added later do not show up in it.
+    """
+
+    __slots__ = ('_records', '_positions', '_length')
+
+    def __init__(self, records, positions=None):
+        self._records = records
+        self._positions = positions
+        self._length = len(records if positions is None else positions)
+
+    def __getitem__(self, index):
+        selected = range(self._length)[index]
+        if isinstance(index, slice):
+            return [self[i] for i in selected]
+        if self._positions is None:
+            return self._records[selected]
+        return self._records[self._positions[selected]]
+
+    def __iter__(self):
+        records = self._records
+        if self._positions is None:
+            return (records[i] for i in range(self._length))
+        positions = self._positions
+        return (records[positions[i]] for i in range(self._length))
+
+    def __len__(self):
+        return self._length
+
+    def __eq__(self, other):
+        if isinstance(other, (PlantingRecords, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"PlantingRecords({list(self)!r})"
+
+
+class PlantingIndex:
+    """
+    Stores planting records with indexes by season, year, container ID, and plant
+    name so queries only touch the records of their most selective filter.
+    """
+
+    def __init__(self):
+        self._records = []
+        self._seasons = []
+        self._by_season = {}
+        self._by_year = {}
+        self._by_container = {}
+        self._by_plant = {}
+        self._by_season_year_container = {}
+
+    def add(self, record):
+        """
+        Store a record with 'plant', 'date' (date) and 'container' keys and index it.
+
+        Raises:
+            TypeError: If the plant name or container ID cannot be used as an index key;
+                nothing is stored in that case
+        """
+        planted = record['date']
+        season = _SEASON_CALENDAR.season_of(planted)
+        plant = _plant_key(record['plant'])
+        key = (season, planted.year, record['container'])
+        hash((key, plant))
+
+        position = len(self._records)
+        self._records.append(record)
+        self._seasons.append(season)
+        self._by_season.setdefault(season, []).append(position)
+        self._by_year.setdefault(planted.year, []).append(position)
+        self._by_container.setdefault(record['container'], []).append(position)
+        self._by_plant.setdefault(plant, []).append(position)
+        self._by_season_year_container.setdefault(key, []).append(position)
+
+    def add_many(self, records):
+        for record in records:
+            self.add(record)
+
+    def between(self, start, end):
+        """Return the records planted from start to end (dates, inclusive), by planting date."""
+        records = self._records
+        positions = [position for position, record in enumerate(records) if start <= record['date'] <= end]
+        positions.sort(key=lambda position: records[position]['date'])
+        return PlantingRecords(records, positions)
+
+    def find(self, season=None, year=None, container_id=None, plant=None):
+        """
+        Return the records matching every given filter, in the order they were added.
+
+        Parameters:
+            season (str): 'Spring', 'Summer', 'Fall', or 'Winter'
+            year (int): Planting year
+            container_id (str): Container the plant went into
+            plant (str): Plant name, compared without regard to case
+
+        Returns:
+            PlantingRecords: read-only view of the matching records
+        """
+        if season is None and year is None and container_id is None and plant is None:
+            return PlantingRecords(self._records)
+        if season is not None and year is not None and container_id is not None:
+            positions = self._by_season_year_container.get((season, year, container_id), [])
+            if plant is None:
+                return PlantingRecords(self._records, positions)
+            postings = [positions]
+        else:
+            postings = []
+            if season is not None:
+                postings.append(self._by_season.get(season, []))
+            if year is not None:
+                postings.append(self._by_year.get(year, []))
+            if container_id is not None:
+                postings.append(self._by_container.get(container_id, []))
+        if plant is not None:
+            plant = _plant_key(plant)
+            postings.append(self._by_plant.get(plant, []))
+
+        smallest = min(postings, key=len)
+        if len(postings) == 1:
+            return PlantingRecords(self._records, smallest)
+        positions = []
+        for position in smallest:
+            record = self._records[position]
+            if season is not None and self._seasons[position] != season:
+                continue
+            if year is not None and record['date'].year != year:
+                continue
+            if container_id is not None and record['container'] != container_id:
+                continue
+            if plant is not None and _plant_key(record['plant']) != plant:
+                continue
+            positions.append(position)
+        return PlantingRecords(self._records, positions)
+
+    def __len__(self):
+        return len(self._records)
+
+
+class PlantingSchedule:
+    """
+    Manages planting dates, seasons, and tracks important dates.
+
+    Records are held in a PlantingIndex unless another store with the same methods
+    is passed in, such as GardenDatabase.planting_store() to keep them in SQLite.
+    """
+    
+    def __init__(self, location="Unknown", store=None):
+        self._location = location
+        self._plantings = PlantingIndex() if store is None else store
+    
+    @property
+    def location(self):
+        return self._location
+    
+    def parse_date(self, value):
+        if isinstance(value, date):
+            return value
+        if isinstance(value, str):
+            parsed = _parse_mdy(value)
+            if parsed is None:
+                raise ValueError("Use MM/DD/YYYY format")
+            return parsed
+        raise TypeError("Date must be string (MM/DD/YYYY) or date object")
+    
+    def get_season_info(self, check_date=None):
+        if check_date is None:
+            check_date = date.today()
+        elif isinstance(check_date, str):
+            check_date = self.parse_date(check_date)
+        elif not isinstance(check_date, date):
+            raise TypeError("Must be date object or string")
+        
+        current_season, next_season, season_start = _SEASON_CALENDAR.lookup(check_date)
+        days_remaining = season_start - check_date.toordinal()
+        
+        return {
+            'date': check_date.strftime('%Y-%m-%d'),
+            'current_season': current_season,
+            'next_season': next_season,
+            'season_start_date': _SEASON_CALENDAR.start_string(season_start),
+            'days_until_next_season': days_remaining
+        }
+    
+    def _planting_record(self, plant_name, plant_date, container_id):
+        try:
+            hash((plant_name, container_id))
+        except TypeError:
+            raise TypeError("Plant name and container ID must be hashable") from None
+        return {
+            'plant': plant_name,
+            'date': self.parse_date(plant_date),
+            'container': container_id
+        }
+
+    def add_planting_record(self, plant_name, plant_date, container_id=None):
+        self._plantings.add(self._planting_record(plant_name, plant_date, container_id))
+
+    def add_planting_records(self, rows):
+        """
+        Add many planting records at once.
+
+        Parameters:
+            rows (iterable): (plant_name, plant_date, container_id) tuples
+
+        Returns:
+            list: (position, reason) for each row that was rejected
+        """
+        accepted = []
+
+        def build(plant_name, plant_date, container_id=None):
+            accepted.append(self._planting_record(plant_name, plant_date, container_id))
+
+        rejected = _insert_rows(build, rows)
+        self._plantings.add_many(accepted)
+        return rejected
+    
+    def get_planting_history(self):
+        """Return a read-only view of every planting record, oldest first."""
+        return self._plantings.find()
+    
+    def get_plantings_by_season(self, season):
+        return self.find_plantings(season=season)
+
+    def plantings_between(self, start, end):
+        """
+        Return the records planted from start to end, inclusive, ordered by planting date.
+
+        Parameters:
+            start: date or 'MM/DD/YYYY' string
+            end: date or 'MM/DD/YYYY' string
+        """
+        return self._plantings.between(self.parse_date(start), self.parse_date(end))
+
+    def find_plantings(self, season=None, year=None, container_id=None, plant_name=None):
+        """
+        Find planting records using the season, year, container, and plant indexes.
+
+        Parameters:
+            season (str): 'Spring', 'Summer', 'Fall', or 'Winter' (any capitalization)
+            year (int): Planting year
+            container_id (str): Container the plant went into
+            plant_name (str): Plant name, compared without regard to case
+
+        Returns:
+            PlantingRecords: read-only view of the matching records, oldest first
+
+        Raises:
+            ValueError: If season is not a valid season
+        """
+        if season is not None:
+            season = season.capitalize()
+            valid_seasons = ['Spring', 'Summer', 'Fall', 'Winter']
+            if season not in valid_seasons:
+                raise ValueError(f"Season must be one of: {', '.join(valid_seasons)}")
+        return self._plantings.find(season, year, container_id, plant_name)
+    
+    def __str__(self):
+        return f"Planting Schedule ({self._location}) - {len(self._plantings)} plantings recorded"
+    
+    def __repr__(self):
+        return f"PlantingSchedule(location='{self._location}')"
+
+
+class ConcurrentPlantingIndex(PlantingIndex):
+    """
+    PlantingIndex for concurrent writers and lock-free readers.
+
+    Records are append-only and every record is stored before it is indexed, so a
+    reader always finds complete records. Writers share one lock; find() and
+    between() take none, and their PlantingRecords results already stop at the
+    records that existed when they were made.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._write_lock = threading.Lock()
+
+    def add(self, record):
+        with self._write_lock:
+            super().add(record)
+
+    def add_many(self, records):
+        with self._write_lock:
+            for record in records:
+                PlantingIndex.add(self, record)
+
+
+class ConcurrentPlantingSchedule(PlantingSchedule):
+    """PlantingSchedule whose history readers never wait for add_planting_record."""
+
+    def __init__(self, location="Unknown"):
+        super().__init__(location, store=ConcurrentPlantingIndex())
+
+
+class ConcurrentGarden(Garden):
+    """
+    Garden that is safe to change from several threads. Changes to the plant list
+    and the yield totals happen under one lock, and yield reads take it too so
+    they never see a half-applied change.
+    """
+
+    def __init__(self, name, last_frost, first_frost):
+        super().__init__(name, last_frost, first_frost)
+        self._lock = threading.RLock()
+
+    def add_plant(self, plant_type, count, tolerance="tender", avg_per_plant=None):
+        with self._lock:
+            super().add_plant(plant_type, count, tolerance, avg_per_plant)
+
+    def update_plant(self, plant_type, count=None, tolerance=None, avg_per_plant=None):
+        with self._lock:
+            return super().update_plant(plant_type, count, tolerance, avg_per_plant)
+
+    def remove_plant(self, plant_type):
+        with self._lock:
+            return super().remove_plant(plant_type)
+
+    def plants(self):
+        with self._lock:
+            return super().plants()
+
+    def total_yield(self, include_details=True):
+        with self._lock:
+            return super().total_yield(include_details)
+
+    def yield_by_type(self):
+        with self._lock:
+            return super().yield_by_type()
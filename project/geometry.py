@@ -0,0 +1,503 @@
+"""Container geometry, unit conversion, plant spacing, compost, and the NumPy batch functions."""
+
+from fractions import Fraction
+import math
+
+from ._common import _require_numpy
+
+
+def calculate_area(length, width=None, shape='rectangle', unit='in'):
+    """
+    Calculate the area of our containers.
+
+    Parameters:
+        length (float): Length in inches
+        width (float): Width in inches
+        shape (str): 'rectangle' or 'circle'
+        unit (str): Unit of length and width, 'in', 'ft', or 'cm'; the area is always in square inches
+
+    Returns:
+        float: area in square inches
+
+    Raises:
+        ValueError: if shape is unknown
+    """
+    if unit != 'in':
+        length, width = _to_inches(unit, length, width)
+    if shape == 'rectangle':
+        if width is None:
+            raise ValueError("Width must be provided for rectangle.")
+        return length * width
+    elif shape == 'circle':
+        radius = length / 2
+        return math.pi * (radius * radius)
+    else:
+        raise ValueError("The shape is not recognized.")
+
+
+def validate_container_dimensions(length, width, depth, unit='in'):
+    """
+    Validate that the container dimensions are reasonable sizes for the garden.
+    
+    Parameters:
+        length(float): Length in inches
+        width(float): width in inches
+        depth(float): depth in inches
+        unit(str): Unit of the dimensions, 'in', 'ft', or 'cm'; the limits are checked in inches
+
+    Returns:
+        bool: True if the dimensions are reasonable
+    
+    Raises: 
+        ValueError: if dimensions are not reasonable
+    """
+    if unit != 'in':
+        length, width, depth = _to_inches(unit, length, width, depth)
+    if length <= 0:
+        raise ValueError("Length must be positive.")
+    if width <= 0:
+        raise ValueError("Width must be positive.")
+    if depth <= 0:
+        raise ValueError("Depth must be positive.")
+    if length > 240:
+        raise ValueError("Length is larger than maximum limit (240 inches).")
+    if width > 240:
+        raise ValueError("Width is larger than maximum limit (240 inches).")
+    if depth < 2:
+        raise ValueError("Depth is smaller than minimum limit of 2 inches.")
+    if depth > 48:
+        raise ValueError("Depth is larger than maximum limit of 48 inches.")
+    return True
+
+
+# Exact size of each unit in a base unit of its kind (centimeters for lengths,
+# liters for volumes). A bag is a standard 1 cubic foot bag of potting soil.
+_LENGTH_UNITS = {'in': Fraction('2.54'), 'ft': Fraction('30.48'), 'cm': Fraction(1)}
+_VOLUME_UNITS = {
+    'cu_in': Fraction('0.016387064'),
+    'cu_ft': Fraction('0.016387064') * 1728,
+    'cu_yd': Fraction('0.016387064') * 46656,
+    'liter': Fraction(1),
+    'bag': Fraction('0.016387064') * 1728,
+}
+
+
+def _conversion_matrix(units):
+    """
+    Return {(from_unit, to_unit): (numerator, denominator)} for the exact ratio of
+    every pair. Converting as value * numerator / denominator gives exact results
+    far more often than multiplying by one rounded factor (12 in is exactly 1 ft).
+    """
+    matrix = {}
+    for a in units:
+        for b in units:
+            ratio = units[a] / units[b]
+            matrix[a, b] = (float(ratio.numerator), float(ratio.denominator))
+    return matrix
+
+
+LENGTH_FACTORS = _conversion_matrix(_LENGTH_UNITS)
+VOLUME_FACTORS = _conversion_matrix(_VOLUME_UNITS)
+
+
+def measurement_conversion(value, from_unit, to_unit):
+    """
+    Convert measurements using units of inches, feet, and centimeters.
+    Parameters:
+        value(float): Value to convert
+        from_unit(str): inches, feet, centimeters
+        to_unit(str): Target unit of inches, feet, centimeters
+
+    Returns:
+        float: converted value
+    
+    Raises: 
+        ValueError: if units are invalid
+    """
+    validate_units = ['in', 'ft', 'cm']
+    if from_unit not in validate_units:
+        raise ValueError("Invalid from_unit. Must be 'in', 'ft', or 'cm'.")
+    if to_unit not in validate_units:
+        raise ValueError("Invalid to_unit. Must be 'in', 'ft', or 'cm'.")
+    numerator, denominator = LENGTH_FACTORS[from_unit, to_unit]
+    return value * numerator / denominator
+
+
+def volume_conversion(value, from_unit, to_unit):
+    """
+    Convert volumes between cubic inches, cubic feet, cubic yards, liters, and 1 cu ft bags.
+
+    Parameters:
+        value (float): Value to convert
+        from_unit (str): 'cu_in', 'cu_ft', 'cu_yd', 'liter', or 'bag'
+        to_unit (str): Target unit, one of the same
+
+    Returns:
+        float: converted value
+
+    Raises:
+        ValueError: if units are invalid
+    """
+    try:
+        numerator, denominator = VOLUME_FACTORS[from_unit, to_unit]
+    except KeyError:
+        raise ValueError(f"Invalid volume unit. Must be one of {', '.join(_VOLUME_UNITS)}.") from None
+    return value * numerator / denominator
+
+
+def convert_batch(values, from_unit, to_unit):
+    """
+    Convert a whole column of lengths or volumes in one vectorized step.
+
+    Parameters:
+        values (array-like): Values to convert
+        from_unit (str): A length unit ('in', 'ft', 'cm') or a volume unit ('cu_in', 'cu_ft', 'cu_yd', 'liter', 'bag')
+        to_unit (str): Target unit of the same kind
+
+    Returns:
+        numpy.ndarray: converted values, matching measurement_conversion / volume_conversion row by row
+
+    Raises:
+        ValueError: if the units are unknown or measure different things
+    """
+    np = _require_numpy()
+    factor = LENGTH_FACTORS.get((from_unit, to_unit)) or VOLUME_FACTORS.get((from_unit, to_unit))
+    if factor is None:
+        raise ValueError(f"Cannot convert from {from_unit!r} to {to_unit!r}.")
+    numerator, denominator = factor
+    return np.asarray(values, dtype=float) * numerator / denominator
+
+
+def _inch_factor(unit):
+    try:
+        return LENGTH_FACTORS[unit, 'in']
+    except KeyError:
+        raise ValueError("Invalid unit. Must be 'in', 'ft', or 'cm'.") from None
+
+
+def _to_inches(unit, *values):
+    """Convert dimensions given in unit to inches, leaving None values alone."""
+    numerator, denominator = _inch_factor(unit)
+    return tuple(None if value is None else value * numerator / denominator for value in values)
+
+
+def calculate_soil_volume(length, width, depth, shape='rectangle', unit='in'):
+    """
+    Calculate the volume of soil needed for a container.
+
+    Parameters:
+        length (float): Length in inches
+        width (float): Width in inches
+        depth (float): Depth in inches
+        shape (str): 'rectangle' or 'circle'
+        unit (str): Unit of the dimensions, 'in', 'ft', or 'cm'; the volume is always in cubic inches
+    Returns:
+        float: volume in cubic inches
+    """
+    if unit != 'in':
+        length, width, depth = _to_inches(unit, length, width, depth)
+    if shape == 'rectangle':
+        volume = length * width * depth
+    elif shape == 'circle':
+        radius = length / 2
+        volume = math.pi * (radius * radius) * depth
+    else:
+        raise ValueError("The shape is not a rectangle or circle.")
+    return volume
+
+
+def validate_boolean_input(value: bool) -> bool:
+    """
+    Validate that the input is strictly a Python boolean (True or False).
+
+    Parameters:
+        value (bool): The value to check.
+
+    Returns:
+        bool: True if the value is a boolean, False otherwise.
+
+    Raises:
+        TypeError: If the input is not a boolean.
+    """
+    if not isinstance(value, bool):
+        raise TypeError("Input must be a standard boolean (True or False).")
+    return True
+
+
+def calculate_plant_space(length, width=None, count=1, shape='rectangle', unit='in'):
+    """
+    Help to calculate what estimated amount of spacing is needed between plants in our containers.
+
+    Parameters:
+        length (float): Container length in inches
+        width (float): Container width in inches
+        count (int): Number of plants
+        shape (str): 'rectangle' or 'circle'
+        unit (str): Unit of length and width, 'in', 'ft', or 'cm'; the spacing is always in inches
+
+    Returns:
+        float: Needed space in inches.
+
+    Raises:
+        ValueError: If count invalid
+        ValueError: Shape measurement is empty
+        ValueError: Shape unknown
+    """
+    if count <= 0:
+        raise ValueError("Count of plants must be a positive number.")
+    if unit != 'in':
+        length, width = _to_inches(unit, length, width)
+
+    if shape == 'rectangle':
+        if width is None:
+            raise ValueError("Width must be provided for rectangle.")
+        area = length * width
+    elif shape == 'circle':
+        radius = length / 2
+        area = math.pi * (radius * radius)
+    else:
+        raise ValueError("Shape is not recognized.")
+
+    area_per_plant = area / count
+    spacing = math.sqrt(area_per_plant)
+    return spacing
+
+
+def calculate_compost_needed(soil_volume, target_ratio=0.25):
+    """
+    Calculate the estimated amount of compost based on the volume of soil needed to maintain plants.
+
+    Parameters:
+        soil_volume (float): Total soil volume in cubic inches.
+        target_ratio (float): Desired compost ratio wanted (range from 0.0 to 1.0, default ratio is 0.25)
+
+    Returns:
+        dict: with 'compost_ratio_needed' and 'soil_ratio_needed'
+
+    raises: 
+        ValueError: If soil volume is negative
+        ValueError: Target ratio is outside 0.0 and 1.0.
+    """
+    if soil_volume <= 0:
+        raise ValueError("Soil volume must be a positive number.")
+    if not (0.0 <= target_ratio <= 1.0):
+        raise ValueError("Target ratio must be between 0.0 and 1.0.")
+
+    compost_needed = soil_volume * target_ratio
+    soil_needed = soil_volume - compost_needed
+
+    return {
+        'compost_ratio_needed': compost_needed,
+        'soil_ratio_needed': soil_needed
+    }
+
+
+def _shape_groups(np, shape, size, error_message):
+    """
+    Split rows by shape so each shape's formula runs once per group instead of once per row.
+
+    Returns:
+        list: (shape name, row selector) pairs
+    """
+    if isinstance(shape, str):
+        groups = [(shape, slice(None))]
+    else:
+        shapes = np.asarray(shape)
+        if shapes.shape != (size,):
+            raise ValueError("Shape column must be the same length as the length column.")
+        groups = [(name, shapes == name) for name in ('rectangle', 'circle')]
+        if not (groups[0][1] | groups[1][1]).all():
+            raise ValueError(error_message)
+        return groups
+    if shape not in ('rectangle', 'circle'):
+        raise ValueError(error_message)
+    return groups
+
+
+def _batch_columns(np, length, *columns):
+    lengths = np.asarray(length, dtype=float)
+    if lengths.ndim != 1:
+        raise ValueError("Length must be a one-dimensional column.")
+    result = [lengths]
+    for column in columns:
+        if column is None:
+            result.append(None)
+        else:
+            result.append(np.broadcast_to(np.asarray(column, dtype=float), lengths.shape))
+    return result
+
+
+def _columns_to_inches(unit, *columns):
+    """Scale NumPy columns given in unit to inches in one pass each, leaving None columns alone."""
+    if unit == 'in':
+        return columns
+    numerator, denominator = _inch_factor(unit)
+    return tuple(None if column is None else column * numerator / denominator for column in columns)
+
+
+def _rectangle_widths(np, widths, rows):
+    if widths is None or np.isnan(widths[rows]).any():
+        raise ValueError("Width must be provided for rectangle.")
+    return widths[rows]
+
+
+def calculate_area_batch(length, width=None, shape='rectangle', unit='in'):
+    """
+    Calculate the areas of many containers at once.
+
+    Parameters:
+        length (array-like): Lengths (or diameters for circles) in inches
+        width (array-like or float): Widths in inches, None/NaN allowed for circles
+        shape (str or array-like): 'rectangle' or 'circle', for all rows or per row
+        unit (str): Unit of the dimension columns, 'in', 'ft', or 'cm'; results are always in inches
+
+    Returns:
+        numpy.ndarray: areas in square inches, matching calculate_area row by row
+
+    Raises:
+        ValueError: if a shape is unknown or a rectangle is missing its width
+    """
+    np = _require_numpy()
+    lengths, widths = _columns_to_inches(unit, *_batch_columns(np, length, width))
+    areas = np.empty(lengths.shape)
+    for name, rows in _shape_groups(np, shape, lengths.size, "The shape is not recognized."):
+        if name == 'rectangle':
+            areas[rows] = lengths[rows] * _rectangle_widths(np, widths, rows)
+        else:
+            radius = lengths[rows] / 2
+            areas[rows] = math.pi * (radius * radius)
+    return areas
+
+
+def calculate_soil_volume_batch(length, width, depth, shape='rectangle', unit='in'):
+    """
+    Calculate the soil volumes of many containers at once.
+
+    Parameters:
+        length (array-like): Lengths (or diameters for circles) in inches
+        width (array-like or float): Widths in inches, None/NaN allowed for circles
+        depth (array-like or float): Depths in inches
+        shape (str or array-like): 'rectangle' or 'circle', for all rows or per row
+        unit (str): Unit of the dimension columns, 'in', 'ft', or 'cm'; results are always in inches
+
+    Returns:
+        numpy.ndarray: volumes in cubic inches, matching calculate_soil_volume row by row
+
+    Raises:
+        ValueError: if a shape is unknown or a rectangle is missing its width
+    """
+    np = _require_numpy()
+    lengths, widths, depths = _columns_to_inches(unit, *_batch_columns(np, length, width, depth))
+    volumes = np.empty(lengths.shape)
+    for name, rows in _shape_groups(np, shape, lengths.size, "The shape is not a rectangle or circle."):
+        if name == 'rectangle':
+            volumes[rows] = lengths[rows] * _rectangle_widths(np, widths, rows) * depths[rows]
+        else:
+            radius = lengths[rows] / 2
+            volumes[rows] = math.pi * (radius * radius) * depths[rows]
+    return volumes
+
+
+def calculate_plant_space_batch(length, width=None, count=1, shape='rectangle', unit='in'):
+    """
+    Calculate plant spacing for many containers at once.
+
+    Parameters:
+        length (array-like): Lengths (or diameters for circles) in inches
+        width (array-like or float): Widths in inches, None/NaN allowed for circles
+        count (array-like or int): Number of plants per container
+        shape (str or array-like): 'rectangle' or 'circle', for all rows or per row
+        unit (str): Unit of the dimension columns, 'in', 'ft', or 'cm'; results are always in inches
+
+    Returns:
+        numpy.ndarray: spacing in inches, matching calculate_plant_space row by row
+
+    Raises:
+        ValueError: If any count is not positive
+        ValueError: If a shape is unknown or a rectangle is missing its width
+    """
+    np = _require_numpy()
+    lengths, widths, counts = _batch_columns(np, length, width, count)
+    if (counts <= 0).any():
+        raise ValueError("Count of plants must be a positive number.")
+    lengths, widths = _columns_to_inches(unit, lengths, widths)
+    areas = np.empty(lengths.shape)
+    for name, rows in _shape_groups(np, shape, lengths.size, "Shape is not recognized."):
+        if name == 'rectangle':
+            areas[rows] = lengths[rows] * _rectangle_widths(np, widths, rows)
+        else:
+            radius = lengths[rows] / 2
+            areas[rows] = math.pi * (radius * radius)
+    return np.sqrt(areas / counts)
+
+
+def _validate_ratios(ratios):
+    ratios = tuple(ratios)
+    if not ratios:
+        raise ValueError("At least one target ratio is required.")
+    for ratio in ratios:
+        if not (0.0 <= ratio <= 1.0):
+            raise ValueError("Target ratio must be between 0.0 and 1.0.")
+    return ratios
+
+
+def _compost_totals(volume, count, ratios):
+    totals = {'containers': count, 'soil_volume_cu_in': volume, 'ratios': {}}
+    for ratio in ratios:
+        compost_needed = volume * ratio
+        totals['ratios'][ratio] = {
+            'compost_ratio_needed': compost_needed,
+            'soil_ratio_needed': volume - compost_needed
+        }
+    return totals
+
+
+def aggregate_compost(volumes, ratios=(0.25,), groups=None):
+    """
+    Total compost and soil for a whole column of container volumes in one vectorized pass.
+
+    Parameters:
+        volumes (array-like): Soil volume of each container in cubic inches
+        ratios (iterable): Target compost ratios to total at the same time
+        groups (array-like): Group label of each container (e.g. site or shape), or None for one group
+
+    Returns:
+        dict: group label -> {'containers', 'soil_volume_cu_in', 'ratios': {ratio:
+            {'compost_ratio_needed', 'soil_ratio_needed'}}}, in the order labels first
+            appear; the label is None without groups
+
+    Raises:
+        ValueError: If a volume is not positive or a ratio is outside 0.0 to 1.0
+    """
+    np = _require_numpy()
+    ratios = _validate_ratios(ratios)
+    volumes = np.asarray(volumes, dtype=float)
+    if (volumes <= 0).any():
+        raise ValueError("Soil volume must be a positive number.")
+    if groups is None:
+        labels = [None]
+        inverse = np.zeros(volumes.shape, dtype=np.intp)
+    else:
+        # Labels are coded in Python rather than with np.unique, which cannot sort
+        # labels of mixed types or None.
+        groups = groups.tolist() if hasattr(groups, 'tolist') else list(groups)
+        codes = {}
+        inverse = np.fromiter((codes.setdefault(label, len(codes)) for label in groups),
+                              dtype=np.intp, count=len(groups))
+        if inverse.shape != volumes.shape:
+            raise ValueError("Groups must be the same length as volumes.")
+        labels = list(codes)
+    sums = np.bincount(inverse, weights=volumes, minlength=len(labels))
+    counts = np.bincount(inverse, minlength=len(labels))
+    compost = np.outer(sums, ratios)
+    soil = sums[:, np.newaxis] - compost
+    return {
+        label: {
+            'containers': int(counts[i]),
+            'soil_volume_cu_in': float(sums[i]),
+            'ratios': {ratio: {'compost_ratio_needed': float(compost[i, j]),
+                               'soil_ratio_needed': float(soil[i, j])}
+                       for j, ratio in enumerate(ratios)}
+        }
+        for i, label in enumerate(labels)
+    }
@@ -0,0 +1,260 @@
+"""Streaming CSV and JSON Lines import of containers, plants, and plantings."""
+
+import csv
+from itertools import islice
+import json
+
+from .geometry import validate_container_dimensions
+from .soil import is_valid_ph_level
+
+
+IMPORT_CHUNK_SIZE = 10_000
+
+
+class ImportReport:
+    """Counts the rows an import accepted and keeps the reasons rows were rejected."""
+
+    def __init__(self, max_rejected=1000):
+        self._accepted = 0
+        self._rejected_count = 0
+        self._rejected = []
+        self._max_rejected = max_rejected
+
+    @property
+    def accepted(self):
+        return self._accepted
+
+    @property
+    def rejected_count(self):
+        return self._rejected_count
+
+    @property
+    def rejected(self):
+        """(row number, reason) pairs in row order, keeping at most max_rejected of them."""
+        return sorted(self._rejected)
+
+    def accept(self, count=1):
+        self._accepted += count
+
+    def reject(self, row_number, reason):
+        self._rejected_count += 1
+        if len(self._rejected) < self._max_rejected:
+            self._rejected.append((row_number, str(reason)))
+
+    def __str__(self):
+        return f"Import - {self._accepted} rows accepted, {self._rejected_count} rows rejected."
+
+
+def iter_record_chunks(path, chunk_size=IMPORT_CHUNK_SIZE, file_format=None, report=None):
+    """
+    Read a CSV or JSON Lines file in chunks so only one chunk is held in memory.
+
+    Parameters:
+        path (str): File to read
+        chunk_size (int): Rows per chunk
+        file_format (str): 'csv' or 'jsonl'; guessed from the file extension when None
+        report (ImportReport): Where to record lines that are not valid JSON objects
+
+    Yields:
+        list: (row number, row dict) pairs
+
+    Raises:
+        ValueError: If the format is unknown or chunk_size is not positive
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be a positive number.")
+    if file_format is None:
+        file_format = 'csv' if str(path).lower().endswith('.csv') else 'jsonl'
+    if file_format not in ('csv', 'jsonl'):
+        raise ValueError("File format must be 'csv' or 'jsonl'.")
+
+    with open(path, newline='', encoding='utf-8') as handle:
+        if file_format == 'csv':
+            reader = csv.DictReader(handle)
+            rows = ((reader.line_num, row) for row in reader)
+        else:
+            rows = _iter_json_lines(handle, report)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+def _iter_json_lines(handle, report):
+    for line_number, line in enumerate(handle, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as error:
+            if report is not None:
+                report.reject(line_number, f"Invalid JSON: {error.msg}")
+            continue
+        if not isinstance(row, dict):
+            if report is not None:
+                report.reject(line_number, "Each line must be a JSON object.")
+            continue
+        yield line_number, row
+
+
+def _optional(row, key):
+    value = row.get(key)
+    return None if value is None or value == '' else value
+
+
+def _optional_text(row, key):
+    """Like _optional, but JSON Lines values that are not strings are rejected with TypeError."""
+    value = _optional(row, key)
+    if value is not None and not isinstance(value, str):
+        raise TypeError(f"{key} must be text.")
+    return value
+
+
+def _identifier(value, label):
+    """Return an ID read from a row as a string; IDs may be strings or whole numbers."""
+    if isinstance(value, bool) or not isinstance(value, (str, int)):
+        raise TypeError(f"{label} must be text or a whole number.")
+    return str(value)
+
+
+def _real(value, label):
+    """Return a number read from a row as a float; JSON true/false are not numbers."""
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise TypeError(f"{label} must be a number.")
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"{label} must be a number.") from None
+
+
+def _whole_number(value, label):
+    """Return a count read from a row as an int, rejecting fractions instead of truncating them."""
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise TypeError(f"{label} must be a whole number.")
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"{label} must be a whole number.")
+        return int(value)
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{label} must be a whole number.") from None
+
+
+def _container_fields(row):
+    container_id = row.get('id') or row.get('container_id')
+    if not container_id:
+        raise ValueError("Container ID is required.")
+    container_id = _identifier(container_id, "Container ID")
+    shape = (_optional_text(row, 'shape') or 'rectangle').lower()
+    length = _real(row['length'], "Length")
+    width = _optional(row, 'width')
+    width = None if width is None else _real(width, "Width")
+    depth = _real(row['depth'], "Depth")
+    if shape == 'circle':
+        validate_container_dimensions(length, 1, depth)
+    elif width is None:
+        raise ValueError("Width and depth required for rectangle")
+    else:
+        validate_container_dimensions(length, width, depth)
+    return (container_id, length, width, depth, shape)
+
+
+def _plant_fields(row):
+    ph = _optional(row, 'ph')
+    if ph is not None:
+        try:
+            ph = _real(ph, "pH value")
+        except ValueError as error:
+            raise TypeError(str(error)) from None
+        if not is_valid_ph_level(ph):
+            raise ValueError("pH must be between 0 and 14.")
+    avg_per_plant = _optional(row, 'avg_per_plant')
+    return (
+        _optional_text(row, 'plant_type'),
+        _whole_number(row['count'], "Count"),
+        _optional_text(row, 'tolerance') or 'tender',
+        None if avg_per_plant is None else _real(avg_per_plant, "Average per plant"),
+    )
+
+
+def _planting_fields(row):
+    plant_name = _optional_text(row, 'plant') or _optional_text(row, 'plant_name')
+    if not plant_name:
+        raise ValueError("Plant name is required.")
+    container_id = _optional(row, 'container')
+    if container_id is None:
+        container_id = _optional(row, 'container_id')
+    if container_id is not None:
+        container_id = _identifier(container_id, "Container ID")
+    return (plant_name, _optional_text(row, 'date'), container_id)
+
+
+def _import_rows(path, convert, insert, chunk_size, file_format, max_rejected):
+    report = ImportReport(max_rejected)
+    for chunk in iter_record_chunks(path, chunk_size, file_format, report):
+        row_numbers = []
+        batch = []
+        for row_number, row in chunk:
+            try:
+                batch.append(convert(row))
+            except KeyError as error:
+                report.reject(row_number, f"Missing column: {error.args[0]}")
+                continue
+            except (ValueError, TypeError) as error:
+                report.reject(row_number, error)
+                continue
+            row_numbers.append(row_number)
+        rejected = insert(batch)
+        for position, reason in rejected:
+            report.reject(row_numbers[position], reason)
+        report.accept(len(batch) - len(rejected))
+    return report
+
+
+def import_containers(path, manager, chunk_size=IMPORT_CHUNK_SIZE, file_format=None, max_rejected=1000):
+    """
+    Stream containers from a CSV or JSON Lines file into a container manager.
+
+    Rows need id (or container_id), length, width, depth, and shape columns; width
+    may be blank for circles. Each chunk is validated with
+    validate_container_dimensions and then inserted with add_containers.
+
+    Parameters:
+        path (str): File to read
+        manager: ContainerManagement or ColumnarContainerStore to fill
+        chunk_size (int): Rows read and validated at a time
+        file_format (str): 'csv' or 'jsonl'; guessed from the file extension when None
+        max_rejected (int): Most rejected rows to keep reasons for
+
+    Returns:
+        ImportReport: accepted count and rejected rows with reasons
+    """
+    return _import_rows(path, _container_fields, manager.add_containers, chunk_size, file_format, max_rejected)
+
+
+def import_plants(path, garden, chunk_size=IMPORT_CHUNK_SIZE, file_format=None, max_rejected=1000):
+    """
+    Stream plants from a CSV or JSON Lines file into a Garden.
+
+    Rows need plant_type and count columns, and may have tolerance, avg_per_plant,
+    and ph columns. A ph value is checked with is_valid_ph_level.
+
+    Returns:
+        ImportReport: accepted count and rejected rows with reasons
+    """
+    return _import_rows(path, _plant_fields, garden.add_plants, chunk_size, file_format, max_rejected)
+
+
+def import_plantings(path, schedule, chunk_size=IMPORT_CHUNK_SIZE, file_format=None, max_rejected=1000):
+    """
+    Stream planting records from a CSV or JSON Lines file into a PlantingSchedule.
+
+    Rows need plant (or plant_name) and date (MM/DD/YYYY) columns, and may have a
+    container (or container_id) column.
+
+    Returns:
+        ImportReport: accepted count and rejected rows with reasons
+    """
+    return _import_rows(path, _planting_fields, schedule.add_planting_records, chunk_size, file_format, max_rejected)
@@ -0,0 +1,1286 @@
+"""Container classes, container management and storage, compost planning, and plant layout."""
+
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
+import itertools
+import heapq
+import math
+import threading
+
+from ._common import _insert_rows
+from .geometry import (_compost_totals, _to_inches, _validate_ratios, calculate_area, calculate_compost_needed,
+                       calculate_plant_space, calculate_soil_volume, validate_container_dimensions)
+
+
+_container_cache_counts = {'hits': 0, 'misses': 0}
+
+
+def container_cache_info():
+    """Return the hit and miss counts of the cached container area, volume, and derived values."""
+    return dict(_container_cache_counts)
+
+
+def reset_container_cache_info():
+    _container_cache_counts['hits'] = 0
+    _container_cache_counts['misses'] = 0
+
+
+class AbstractContainer(ABC):
+    """
+    Abstract base class for garden containers.
+
+    Area, volume, and the derived compost split and plant spacing are computed on
+    first use and cached on the instance; resizing clears whatever depends on the
+    dimensions that changed.
+    """
+
+    __slots__ = ('_id', '_length', '_depth', '_area', '_volume', '_derived')
+
+    def __init__(self, container_id, length, depth):
+        if not isinstance(container_id, str) or not container_id:
+            raise ValueError("Container ID must be a non-empty string.")
+        if length <= 0 or depth <= 0:
+            raise ValueError("Length and Depth must be positive.")
+        self._id = container_id
+        self._length = length
+        self._depth = depth
+        self._area = None
+        self._volume = None
+        self._derived = None
+
+    @property
+    def container_id(self):
+        return self._id
+
+    @property
+    def area(self):
+        if self._area is None:
+            _container_cache_counts['misses'] += 1
+            self._area = self.calculate_area()
+        else:
+            _container_cache_counts['hits'] += 1
+        return self._area
+
+    @property
+    def volume(self):
+        if self._volume is None:
+            _container_cache_counts['misses'] += 1
+            self._volume = self.calculate_volume()
+        else:
+            _container_cache_counts['hits'] += 1
+        return self._volume
+
+    @property
+    def depth(self):
+        return self._depth
+
+    def _cached(self, key, compute):
+        derived = self._derived
+        if derived is None:
+            derived = self._derived = {}
+        try:
+            value = derived[key]
+        except KeyError:
+            _container_cache_counts['misses'] += 1
+            value = derived[key] = compute()
+        else:
+            _container_cache_counts['hits'] += 1
+        return value
+
+    def compost_split(self, ratio=0.25):
+        """Return calculate_compost_needed for this container's volume, cached per ratio."""
+        split = self._cached(('compost', ratio), lambda: calculate_compost_needed(self.volume, ratio))
+        return dict(split)
+
+    def plant_spacing(self, count):
+        """Return calculate_plant_space for this container and plant count, cached per count."""
+        def compute():
+            length, width, shape = self._spacing_dimensions()
+            return calculate_plant_space(length, width, count, shape)
+        return self._cached(('spacing', count), compute)
+
+    def _invalidate(self, footprint=True):
+        """Forget cached values; only volume and compost depend on depth alone."""
+        self._volume = None
+        if footprint:
+            self._area = None
+            self._derived = None
+        elif self._derived:
+            self._derived = {key: value for key, value in self._derived.items() if key[0] != 'compost'}
+
+    def set_depth(self, depth):
+        if depth <= 0:
+            raise ValueError("Depth must be positive.")
+        self._depth = depth
+        self._invalidate(footprint=False)
+
+    @abstractmethod
+    def get_shape_name(self):
+        pass
+
+    @abstractmethod
+    def calculate_area(self):
+        pass
+
+    @abstractmethod
+    def calculate_volume(self):
+        pass
+
+    @abstractmethod
+    def _spacing_dimensions(self):
+        """Return (length, width, shape) as calculate_plant_space expects them."""
+
+    def __str__(self):
+        return (
+            f"{self.get_shape_name().capitalize()} Container ID:{self._id}, "
+            f"Area: {round(self.area, 2)} sq in, Volume: {round(self.volume, 2)} cu in"
+        )
+
+
+class RectangularContainer(AbstractContainer):
+    __slots__ = ('_width',)
+
+    def __init__(self, container_id, length, width, depth):
+        validate_container_dimensions(length, width, depth)
+        self._width = width
+        super().__init__(container_id, length, depth)
+
+    def get_shape_name(self):
+        return "rectangle"
+
+    def calculate_area(self):
+        return self._length * self._width
+
+    def calculate_volume(self):
+        return self.area * self._depth
+
+    def _spacing_dimensions(self):
+        return self._length, self._width, 'rectangle'
+
+    def resize(self, length=None, width=None, depth=None):
+        """Change any of the dimensions and drop the cached values that depended on them."""
+        length = self._length if length is None else length
+        width = self._width if width is None else width
+        depth = self._depth if depth is None else depth
+        validate_container_dimensions(length, width, depth)
+        footprint = (length, width) != (self._length, self._width)
+        self._length, self._width, self._depth = length, width, depth
+        self._invalidate(footprint)
+
+    def __str__(self):
+        base_str = super().__str__()
+        return f"{base_str} (Dimensions: {self._length}x{self._width}x{self._depth} in)"
+
+
+class CircularContainer(AbstractContainer):
+    __slots__ = ('_diameter', '_radius')
+
+    def __init__(self, container_id, diameter, depth):
+        validate_container_dimensions(diameter, 1, depth)
+        self._diameter = diameter
+        self._radius = diameter / 2
+        super().__init__(container_id, diameter, depth)
+
+    def get_shape_name(self):
+        return "circle"
+
+    def calculate_area(self):
+        return math.pi * (self._radius * self._radius)
+
+    def calculate_volume(self):
+        return self.area * self._depth
+
+    def _spacing_dimensions(self):
+        return self._diameter, None, 'circle'
+
+    def resize(self, diameter=None, depth=None):
+        """Change the diameter and/or depth and drop the cached values that depended on them."""
+        diameter = self._diameter if diameter is None else diameter
+        depth = self._depth if depth is None else depth
+        validate_container_dimensions(diameter, 1, depth)
+        footprint = diameter != self._diameter
+        self._diameter = self._length = diameter
+        self._radius = diameter / 2
+        self._depth = depth
+        self._invalidate(footprint)
+
+    def __str__(self):
+        base_str = super().__str__()
+        return f"{base_str} (Diameter: {self._diameter} in, Depth: {self._depth} in)"
+
+
+class SquareContainer(AbstractContainer):
+    __slots__ = ('_side_length',)
+
+    def __init__(self, container_id, side_length, depth):
+        if side_length <= 0 or depth <= 0:
+            raise ValueError("Side length and depth must be positive.")
+        self._side_length = side_length
+        super().__init__(container_id, side_length, depth)
+
+    def get_shape_name(self):
+        return "square"
+
+    def calculate_area(self):
+        return self._side_length ** 2
+
+    def calculate_volume(self):
+        return self.area * self._depth
+
+    def _spacing_dimensions(self):
+        return self._side_length, self._side_length, 'rectangle'
+
+    def resize(self, side_length=None, depth=None):
+        """Change the side length and/or depth and drop the cached values that depended on them."""
+        side_length = self._side_length if side_length is None else side_length
+        depth = self._depth if depth is None else depth
+        if side_length <= 0 or depth <= 0:
+            raise ValueError("Side length and depth must be positive.")
+        footprint = side_length != self._side_length
+        self._side_length = self._length = side_length
+        self._depth = depth
+        self._invalidate(footprint)
+
+    def __str__(self):
+        base_str = super().__str__()
+        return f"{base_str} (side: {self._side_length} in, Depth: {self._depth} in)"
+
+
+class ContainerRegistry:
+    """
+    Stores containers keyed by container ID, with secondary indexes on shape,
+    depth, and volume so lookups and filtered listings do not scan every container.
+
+    The depth and volume indexes are sorted on the first range query. After that,
+    add and remove keep them sorted with bisect, while add_many drops them so a
+    large batch costs one re-sort on the next range query.
+    """
+
+    def __init__(self):
+        self._by_id = {}
+        self._meta = {}
+        self._by_shape = {}
+        self._next_seq = 0
+        self._depth_index = None
+        self._volume_index = None
+
+    def add(self, container_id, container, shape, depth, volume):
+        """
+        Register a container.
+
+        Parameters:
+            container_id (str): Unique ID for the container
+            container: The container object or record to store
+            shape (str): Shape name used for the shape index
+            depth (float): Depth in inches used for the depth index
+            volume (float): Volume in cubic inches used for the volume index
+
+        Raises:
+            ValueError: If a container with the same ID already exists
+        """
+        if container_id in self._by_id:
+            raise ValueError(f"Container with ID {container_id} already exists.")
+        seq = self._next_seq
+        self._by_id[container_id] = container
+        self._meta[container_id] = (seq, shape, depth, volume)
+        self._by_shape.setdefault(shape, {})[container_id] = container
+        self._next_seq += 1
+        if self._depth_index is not None:
+            self._index_insert(self._depth_index, depth, seq, container_id)
+        if self._volume_index is not None:
+            self._index_insert(self._volume_index, volume, seq, container_id)
+
+    def add_many(self, items):
+        """Register (container_id, container, shape, depth, volume) tuples, in order."""
+        self._depth_index = None
+        self._volume_index = None
+        for item in items:
+            self.add(*item)
+
+    def remove(self, container_id):
+        """
+        Remove a container and return it.
+
+        Raises:
+            ValueError: If the container ID is not registered
+        """
+        if container_id not in self._by_id:
+            raise ValueError(f"Container with ID {container_id} not found.")
+        container = self._by_id.pop(container_id)
+        seq, shape, depth, volume = self._meta.pop(container_id)
+        shape_group = self._by_shape[shape]
+        del shape_group[container_id]
+        if not shape_group:
+            del self._by_shape[shape]
+        if self._depth_index is not None:
+            self._index_delete(self._depth_index, depth, seq)
+        if self._volume_index is not None:
+            self._index_delete(self._volume_index, volume, seq)
+        return container
+
+    def get(self, container_id):
+        try:
+            return self._by_id[container_id]
+        except KeyError:
+            raise ValueError(f"Container with ID {container_id} not found.") from None
+
+    def values(self):
+        return list(self._by_id.values())
+
+    def find(self, shape=None, min_depth=None, max_depth=None, min_volume=None, max_volume=None):
+        """
+        Return the containers matching every given filter, in insertion order.
+
+        Parameters:
+            shape (str): Only containers of this shape
+            min_depth (float): Smallest depth to include (inches)
+            max_depth (float): Largest depth to include (inches)
+            min_volume (float): Smallest volume to include (cubic inches)
+            max_volume (float): Largest volume to include (cubic inches)
+
+        Returns:
+            list: matching containers
+        """
+        candidates = None
+        if min_depth is not None or max_depth is not None:
+            candidates = self._range_ids(self._sorted_index(2), min_depth, max_depth)
+        if min_volume is not None or max_volume is not None:
+            volume_ids = self._range_ids(self._sorted_index(3), min_volume, max_volume)
+            if candidates is None or len(volume_ids) < len(candidates):
+                candidates = volume_ids
+        if candidates is None:
+            if shape is None:
+                return self.values()
+            return list(self._by_shape.get(shape, {}).values())
+
+        if len(candidates) * 8 > len(self._meta):
+            # A wide range matches so much that sorting the matches back into
+            # insertion order costs more than filtering every container in order.
+            return [self._by_id[container_id] for container_id, (_, c_shape, depth, volume) in self._meta.items()
+                    if (shape is None or c_shape == shape)
+                    and (min_depth is None or depth >= min_depth) and (max_depth is None or depth <= max_depth)
+                    and (min_volume is None or volume >= min_volume) and (max_volume is None or volume <= max_volume)]
+
+        matches = []
+        for container_id in candidates:
+            seq, c_shape, depth, volume = self._meta[container_id]
+            if shape is not None and c_shape != shape:
+                continue
+            if min_depth is not None and depth < min_depth:
+                continue
+            if max_depth is not None and depth > max_depth:
+                continue
+            if min_volume is not None and volume < min_volume:
+                continue
+            if max_volume is not None and volume > max_volume:
+                continue
+            matches.append((seq, container_id))
+        matches.sort()
+        return [self._by_id[container_id] for _, container_id in matches]
+
+    def _sorted_index(self, field):
+        """Return (keys, seqs, ids) for depth (field 2) or volume (field 3), sorted by (key, seq)."""
+        index = self._depth_index if field == 2 else self._volume_index
+        if index is None:
+            triples = sorted((meta[field], meta[0], container_id) for container_id, meta in self._meta.items())
+            index = ([key for key, _, _ in triples], [seq for _, seq, _ in triples],
+                     [container_id for _, _, container_id in triples])
+            if field == 2:
+                self._depth_index = index
+            else:
+                self._volume_index = index
+        return index
+
+    @staticmethod
+    def _index_insert(index, key, seq, container_id):
+        keys, seqs, ids = index
+        # seq is the newest, so the container goes after every other one with this key.
+        position = bisect_right(keys, key)
+        keys.insert(position, key)
+        seqs.insert(position, seq)
+        ids.insert(position, container_id)
+
+    @staticmethod
+    def _index_delete(index, key, seq):
+        keys, seqs, ids = index
+        low = bisect_left(keys, key)
+        high = bisect_right(keys, key, low)
+        position = bisect_left(seqs, seq, low, high)
+        del keys[position]
+        del seqs[position]
+        del ids[position]
+
+    def _range_ids(self, index, low, high):
+        keys, _, ids = index
+        start = 0 if low is None else bisect_left(keys, low)
+        stop = len(keys) if high is None else bisect_right(keys, high)
+        return ids[start:stop]
+
+    def __contains__(self, container_id):
+        return container_id in self._by_id
+
+    def __len__(self):
+        return len(self._by_id)
+
+
+class ContainerManagement:
+    """
+    Designed to manage our garden containers, making sure to include size, soil, and compost calculations.
+
+    Containers are held in a ContainerRegistry unless another store with the same
+    methods is passed in, such as GardenDatabase.container_store() to keep them in SQLite.
+    """
+    def __init__(self, store=None):
+        self._containers = ContainerRegistry() if store is None else store
+        self._planners = []
+
+    def add_container(self, container_id, length, width, depth, shape='rectangle', unit='in'):
+        """
+        Add a new container to the management system.
+        
+        Parameters:
+            container_id (str): Unique ID for the container
+            length (float): Length in inches
+            width (float): Width in inches
+            depth (float): Depth in inches
+            shape (str): 'rectangle' or 'circle'
+            unit (str): Unit of the dimensions, 'in', 'ft', or 'cm'; they are stored in inches
+
+        Returns:
+            dict: Details about the container.
+
+        Raises:
+            ValueError: If the ID is already in use or the dimensions are invalid
+        """
+        container = self._new_container(container_id, length, width, depth, shape, unit)
+        self._containers.add(container_id, container, shape, container['depth'], container['volume_cu_in'])
+        for planner, site in self._planners:
+            planner.add_container(container_id, container['volume_cu_in'], shape, site)
+        return container
+
+    def _new_container(self, container_id, length, width, depth, shape='rectangle', unit='in'):
+        if unit != 'in':
+            length, width, depth = _to_inches(unit, length, width, depth)
+        if container_id in self._containers:
+            raise ValueError(f"Container with ID {container_id} already exists.")
+        validate_container_dimensions(length, width if shape == 'rectangle' else 1, depth)
+
+        area = calculate_area(length, width, shape)
+        volume = calculate_soil_volume(length, width if shape == 'rectangle' else 1, depth, shape)
+        return {
+            'id': container_id,
+            'shape': shape,
+            'length': length,
+            'width': width,
+            'depth': depth,
+            'area_sq_in': round(area, 2),
+            'volume_cu_in': round(volume, 2)
+        }
+
+    def add_containers(self, rows, unit='in'):
+        """
+        Add many containers at once. Every accepted row is handed to the store in one
+        add_many call, so a SQLite store inserts the whole batch in one transaction.
+
+        Parameters:
+            rows (iterable): (container_id, length, width, depth, shape) tuples
+            unit (str): Unit of every row's dimensions, 'in', 'ft', or 'cm'
+
+        Returns:
+            list: (position, reason) for each row that was rejected
+        """
+        accepted = []
+        batch_ids = set()
+
+        def build(container_id, length, width, depth, shape='rectangle'):
+            if container_id in batch_ids:
+                raise ValueError(f"Container with ID {container_id} already exists.")
+            container = self._new_container(container_id, length, width, depth, shape, unit)
+            batch_ids.add(container_id)
+            accepted.append((container_id, container, shape, container['depth'], container['volume_cu_in']))
+
+        rejected = _insert_rows(build, rows)
+        self._containers.add_many(accepted)
+        for planner, site in self._planners:
+            for container_id, _, shape, _, volume in accepted:
+                planner.add_container(container_id, volume, shape, site)
+        return rejected
+    
+    def get_container(self, container_id):
+        return self._containers.get(container_id)
+
+    def remove_container(self, container_id):
+        """Remove a container from the management system and return its details."""
+        container = self._containers.remove(container_id)
+        for planner, _ in self._planners:
+            planner.remove_container(container_id)
+        return container
+
+    def attach_planner(self, planner, site=None):
+        """
+        Keep a CompostPlanner's totals in step with this manager.
+
+        The current containers are added to the planner under the given site, and
+        later add_container / remove_container calls update it as they happen.
+        """
+        planner.add_fleet(self, site)
+        self._planners.append((planner, site))
+    
+    def calculate_compost(self, container_id, ratio=0.25):
+        container = self.get_container(container_id)
+        compost_info = calculate_compost_needed(container['volume_cu_in'], ratio)
+        return compost_info
+    
+    def list_containers(self, shape=None, min_depth=None, max_depth=None, min_volume=None, max_volume=None):
+        """
+        List managed containers, optionally filtered by shape, depth range, or volume range.
+
+        Parameters:
+            shape (str): 'rectangle' or 'circle'
+            min_depth (float): Smallest depth to include (inches)
+            max_depth (float): Largest depth to include (inches)
+            min_volume (float): Smallest volume to include (cubic inches)
+            max_volume (float): Largest volume to include (cubic inches)
+
+        Returns:
+            list: container details in the order they were added
+        """
+        return self._containers.find(shape, min_depth, max_depth, min_volume, max_volume)
+    
+    def __len__(self):
+        return len(self._containers)
+    
+    def __str__(self):
+        return f"ContainerManagement - {len(self._containers)} containers managed."
+
+
+CONTAINER_STRIPES = 16
+
+
+class _Stripe:
+    __slots__ = ('lock', 'containers')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # container_id -> (seq, container, shape, depth, volume); entries are replaced, never changed
+        self.containers = {}
+
+
+class StripedContainerRegistry:
+    """
+    Thread-safe ContainerRegistry replacement for concurrent writers.
+
+    Containers are split across stripes by container ID, each with its own lock,
+    so writers only wait for writers of the same stripe. Readers take no lock:
+    they copy each stripe's dict (a single atomic operation) and filter the copy,
+    so list_containers never blocks add_container. Range filters scan that copy
+    instead of using sorted indexes.
+    """
+
+    def __init__(self, stripes=CONTAINER_STRIPES):
+        if stripes <= 0:
+            raise ValueError("Stripe count must be a positive number.")
+        self._stripes = tuple(_Stripe() for _ in range(stripes))
+        self._seq = itertools.count()
+
+    def _stripe(self, container_id):
+        return self._stripes[hash(container_id) % len(self._stripes)]
+
+    def add(self, container_id, container, shape, depth, volume):
+        stripe = self._stripe(container_id)
+        with stripe.lock:
+            if container_id in stripe.containers:
+                raise ValueError(f"Container with ID {container_id} already exists.")
+            stripe.containers[container_id] = (next(self._seq), container, shape, depth, volume)
+
+    def add_many(self, items):
+        for item in items:
+            self.add(*item)
+
+    def remove(self, container_id):
+        stripe = self._stripe(container_id)
+        with stripe.lock:
+            try:
+                return stripe.containers.pop(container_id)[1]
+            except KeyError:
+                raise ValueError(f"Container with ID {container_id} not found.") from None
+
+    def get(self, container_id):
+        entry = self._stripe(container_id).containers.get(container_id)
+        if entry is None:
+            raise ValueError(f"Container with ID {container_id} not found.")
+        return entry[1]
+
+    def values(self):
+        return self.find()
+
+    def find(self, shape=None, min_depth=None, max_depth=None, min_volume=None, max_volume=None):
+        """Return the containers matching every given filter, in insertion order."""
+        # Each stripe's dict is in seq order, so the copies merge into global insertion order.
+        snapshots = [stripe.containers.copy().values() for stripe in self._stripes]
+        matches = []
+        for seq, container, c_shape, depth, volume in heapq.merge(*snapshots, key=lambda entry: entry[0]):
+            if shape is not None and c_shape != shape:
+                continue
+            if min_depth is not None and depth < min_depth:
+                continue
+            if max_depth is not None and depth > max_depth:
+                continue
+            if min_volume is not None and volume < min_volume:
+                continue
+            if max_volume is not None and volume > max_volume:
+                continue
+            matches.append(container)
+        return matches
+
+    def __contains__(self, container_id):
+        return container_id in self._stripe(container_id).containers
+
+    def __len__(self):
+        return sum(len(stripe.containers) for stripe in self._stripes)
+
+
+class ConcurrentContainerManagement(ContainerManagement):
+    """
+    ContainerManagement that many threads can read and write at once, backed by a
+    StripedContainerRegistry. Works the same on free-threaded CPython builds.
+    """
+
+    def __init__(self, stripes=CONTAINER_STRIPES):
+        super().__init__(store=StripedContainerRegistry(stripes))
+        self._planner_lock = threading.Lock()
+
+    def add_container(self, container_id, length, width, depth, shape='rectangle', unit='in'):
+        if not self._planners:
+            return super().add_container(container_id, length, width, depth, shape, unit)
+        with self._planner_lock:
+            return super().add_container(container_id, length, width, depth, shape, unit)
+
+    def add_containers(self, rows, unit='in'):
+        """
+        Add many containers at once, one row at a time, so a row that another thread
+        added first is reported as rejected rather than failing the batch.
+        """
+        return _insert_rows(lambda *row: self.add_container(*row, unit=unit), rows)
+
+    def remove_container(self, container_id):
+        if not self._planners:
+            return super().remove_container(container_id)
+        with self._planner_lock:
+            return super().remove_container(container_id)
+
+    def attach_planner(self, planner, site=None):
+        """
+        Keep a CompostPlanner in step with this manager. Attach planners before
+        writer threads start: once one is attached, adds and removes are serialized
+        so the planner sees them in the same order as the registry.
+        """
+        with self._planner_lock:
+            super().attach_planner(planner, site)
+
+
+class ContainerRecord(Mapping):
+    """Read-only dict-like view of one container row in a ColumnarContainerStore."""
+
+    __slots__ = ('_store', '_id')
+
+    _KEYS = ('id', 'shape', 'length', 'width', 'depth', 'area_sq_in', 'volume_cu_in')
+
+    def __init__(self, store, container_id):
+        self._store = store
+        self._id = container_id
+
+    def __getitem__(self, key):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        if key == 'id':
+            return self._id
+        return self._store._field(self._id, key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self):
+        return len(self._KEYS)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class ColumnarContainerStore:
+    """
+    Stores container details column by column in typed arrays instead of one dict per container.
+
+    Offers the same add_container / get_container / list_containers / __len__ API as
+    ContainerManagement, but get_container and list_containers return ContainerRecord
+    views that are built only when asked for.
+    """
+
+    _SHAPES = ('rectangle', 'circle')
+    _COLUMNS = {
+        'shape': '_shape',
+        'length': '_length',
+        'width': '_width',
+        'depth': '_depth',
+        'area_sq_in': '_area',
+        'volume_cu_in': '_volume',
+    }
+
+    def __init__(self):
+        self._ids = []
+        self._rows = {}
+        self._removed = 0
+        self._exported = False
+        self._shape = array('B')
+        self._length = array('d')
+        self._width = array('d')
+        self._depth = array('d')
+        self._area = array('d')
+        self._volume = array('d')
+
+    def add_container(self, container_id, length, width, depth, shape='rectangle', unit='in'):
+        """
+        Add a new container to the store.
+
+        Parameters:
+            container_id (str): Unique ID for the container
+            length (float): Length in inches
+            width (float): Width in inches
+            depth (float): Depth in inches
+            shape (str): 'rectangle' or 'circle'
+            unit (str): Unit of the dimensions, 'in', 'ft', or 'cm'; they are stored in inches
+
+        Returns:
+            ContainerRecord: View of the stored container.
+
+        Raises:
+            ValueError: If the ID is already in use or the dimensions are invalid
+        """
+        if unit != 'in':
+            length, width, depth = _to_inches(unit, length, width, depth)
+        if container_id in self._rows:
+            raise ValueError(f"Container with ID {container_id} already exists.")
+        validate_container_dimensions(length, width if shape == 'rectangle' else 1, depth)
+        area = calculate_area(length, width, shape)
+        volume = calculate_soil_volume(length, width if shape == 'rectangle' else 1, depth, shape)
+
+        self._unshare()
+        self._rows[container_id] = len(self._ids)
+        self._ids.append(container_id)
+        self._shape.append(self._SHAPES.index(shape))
+        self._length.append(length)
+        self._width.append(math.nan if width is None else width)
+        self._depth.append(depth)
+        self._area.append(round(area, 2))
+        self._volume.append(round(volume, 2))
+        return ContainerRecord(self, container_id)
+
+    def add_containers(self, rows, unit='in'):
+        """
+        Add many containers at once.
+
+        Parameters:
+            rows (iterable): (container_id, length, width, depth, shape) tuples
+            unit (str): Unit of every row's dimensions, 'in', 'ft', or 'cm'
+
+        Returns:
+            list: (position, reason) for each row that was rejected
+        """
+        if unit == 'in':
+            return _insert_rows(self.add_container, rows)
+        return _insert_rows(lambda *row: self.add_container(*row, unit=unit), rows)
+
+    def remove_container(self, container_id):
+        """
+        Remove a container.
+
+        The row is only marked as removed, so the remaining containers keep their
+        insertion order; removed rows are dropped from the columns once they make up
+        half of the store, or before column() hands out a view.
+
+        Returns:
+            dict: Details of the removed container.
+        """
+        details = dict(self.get_container(container_id))
+        row = self._rows.pop(container_id)
+        self._ids[row] = None
+        self._removed += 1
+        if self._removed * 2 >= len(self._ids):
+            self._compact()
+        return details
+
+    def _compact(self):
+        """Drop the rows of removed containers from every column."""
+        if not self._removed:
+            return
+        keep = [row for row, container_id in enumerate(self._ids) if container_id is not None]
+        for name in ('_shape', '_length', '_width', '_depth', '_area', '_volume'):
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, [column[row] for row in keep]))
+        self._ids = [self._ids[row] for row in keep]
+        self._rows = {container_id: row for row, container_id in enumerate(self._ids)}
+        self._removed = 0
+        self._exported = False
+
+    def _unshare(self):
+        """
+        Copy the columns before they are resized if column() has handed out views
+        of them, since an array cannot grow while a memoryview holds its buffer.
+        """
+        if not self._exported:
+            return
+        for name in ('_shape', '_length', '_width', '_depth', '_area', '_volume'):
+            setattr(self, name, getattr(self, name)[:])
+        self._exported = False
+
+    def get_container(self, container_id):
+        if container_id not in self._rows:
+            raise ValueError(f"Container with ID {container_id} not found.")
+        return ContainerRecord(self, container_id)
+
+    def calculate_compost(self, container_id, ratio=0.25):
+        container = self.get_container(container_id)
+        return calculate_compost_needed(container['volume_cu_in'], ratio)
+
+    def list_containers(self, shape=None, min_depth=None, max_depth=None, min_volume=None, max_volume=None):
+        """
+        List stored containers as ContainerRecord views, optionally filtered like
+        ContainerManagement.list_containers.
+        """
+        shape_code = None
+        if shape is not None:
+            shape_code = self._SHAPES.index(shape) if shape in self._SHAPES else -1
+        records = []
+        for row, container_id in enumerate(self._ids):
+            if container_id is None:
+                continue
+            if shape_code is not None and self._shape[row] != shape_code:
+                continue
+            depth = self._depth[row]
+            if (min_depth is not None and depth < min_depth) or (max_depth is not None and depth > max_depth):
+                continue
+            volume = self._volume[row]
+            if (min_volume is not None and volume < min_volume) or (max_volume is not None and volume > max_volume):
+                continue
+            records.append(ContainerRecord(self, container_id))
+        return records
+
+    def column(self, name):
+        """
+        Return a read-only view of one stored column.
+
+        The view is not copied and does not see containers added or removed after
+        it was taken; the store moves to fresh arrays before its next change.
+
+        Parameters:
+            name (str): 'shape', 'length', 'width', 'depth', 'area_sq_in' or 'volume_cu_in'
+
+        Returns:
+            memoryview: the column values, in row order ('shape' holds indexes into ('rectangle', 'circle'))
+        """
+        if name not in self._COLUMNS:
+            raise ValueError(f"Unknown column: {name}")
+        self._compact()
+        self._exported = True
+        return memoryview(getattr(self, self._COLUMNS[name])).toreadonly()
+
+    def _field(self, container_id, key):
+        row = self._rows.get(container_id)
+        if row is None:
+            raise KeyError(f"Container with ID {container_id} was removed.")
+        if key == 'shape':
+            return self._SHAPES[self._shape[row]]
+        if key == 'width':
+            width = self._width[row]
+            return None if math.isnan(width) else width
+        return getattr(self, self._COLUMNS[key])[row]
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __str__(self):
+        return f"ColumnarContainerStore - {len(self._rows)} containers stored."
+
+
+class CompostPlanner:
+    """
+    Keeps running soil volume totals grouped by site and shape, so compost and soil
+    purchase totals for any set of ratios come from the group totals instead of a
+    pass over every container.
+
+    Adds update a group's total directly. Subtracting a removed volume could cancel
+    away the smaller volumes left in the group, so a remove instead marks the total
+    stale and the next totals() call re-adds that group with math.fsum.
+    """
+
+    _GROUP_FIELDS = ('site', 'shape')
+
+    def __init__(self):
+        self._containers = {}
+        self._groups = {}
+
+    def add_container(self, container_id, volume, shape='rectangle', site=None):
+        """
+        Count a container's soil volume in its (site, shape) group.
+
+        Raises:
+            ValueError: If the ID is already counted or the volume is not positive
+        """
+        if container_id in self._containers:
+            raise ValueError(f"Container with ID {container_id} already exists.")
+        if volume <= 0:
+            raise ValueError("Soil volume must be a positive number.")
+        key = (site, shape)
+        self._containers[container_id] = key
+        group = self._groups.setdefault(key, [0.0, {}])
+        if group[0] is not None:
+            group[0] += volume
+        group[1][container_id] = volume
+
+    def add_fleet(self, containers, site=None):
+        """
+        Count every container of a ContainerManagement, ColumnarContainerStore, or GardenSnapshot.
+
+        Returns:
+            int: number of containers added
+        """
+        records = containers.list_containers()
+        for record in records:
+            self.add_container(record['id'], record['volume_cu_in'], record['shape'], site)
+        return len(records)
+
+    def remove_container(self, container_id):
+        try:
+            key = self._containers.pop(container_id)
+        except KeyError:
+            raise ValueError(f"Container with ID {container_id} not found.") from None
+        group = self._groups[key]
+        del group[1][container_id]
+        if not group[1]:
+            del self._groups[key]
+        else:
+            group[0] = None
+
+    def totals(self, ratios=(0.25,), by=('site', 'shape')):
+        """
+        Return compost and soil totals for every group, for several ratios at once.
+
+        Parameters:
+            ratios (iterable): Target compost ratios
+            by (tuple): Any of 'site' and 'shape'; () gives one fleet-wide total
+
+        Returns:
+            dict: group key tuple -> {'containers', 'soil_volume_cu_in', 'ratios': {ratio:
+                {'compost_ratio_needed', 'soil_ratio_needed'}}}
+
+        Raises:
+            ValueError: If a ratio is outside 0.0 to 1.0 or a grouping field is unknown
+        """
+        ratios = _validate_ratios(ratios)
+        for field in by:
+            if field not in self._GROUP_FIELDS:
+                raise ValueError(f"Can only group by {', '.join(self._GROUP_FIELDS)}.")
+        positions = [self._GROUP_FIELDS.index(field) for field in by]
+        merged = {}
+        for key, (volume, volumes) in self._groups.items():
+            if volume is None:
+                volume = self._groups[key][0] = math.fsum(volumes.values())
+            group_key = tuple(key[i] for i in positions)
+            group = merged.setdefault(group_key, [0.0, 0])
+            group[0] += volume
+            group[1] += len(volumes)
+        return {key: _compost_totals(volume, count, ratios) for key, (volume, count) in merged.items()}
+
+    def __len__(self):
+        return len(self._containers)
+
+    def __str__(self):
+        return f"CompostPlanner - {len(self._containers)} containers in {len(self._groups)} groups."
+
+
+LAYOUT_CELL_SIZE = 12.0
+_GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+
+
+class PlantLayout:
+    """
+    Positions of plants in inches, indexed by a uniform grid of square cells so that
+    radius, nearest-neighbor, and spacing checks only look at nearby cells.
+
+    The cell size works best close to the usual query radius or plant spacing.
+    """
+
+    def __init__(self, cell_size=LAYOUT_CELL_SIZE):
+        if cell_size <= 0:
+            raise ValueError("Cell size must be a positive number.")
+        self._cell_size = float(cell_size)
+        self._plants = {}
+        self._cells = {}
+        # Cell range covering every plant placed so far; it never shrinks on remove,
+        # which only makes nearest() search a few empty rings further.
+        self._bounds = None
+
+    @property
+    def cell_size(self):
+        return self._cell_size
+
+    def _cell(self, x, y):
+        return (math.floor(x / self._cell_size), math.floor(y / self._cell_size))
+
+    def place(self, plant_id, x, y, container_id=None):
+        """
+        Put a plant at (x, y).
+
+        Raises:
+            ValueError: If a plant with this ID is already placed
+        """
+        if plant_id in self._plants:
+            raise ValueError(f"Plant with ID {plant_id} is already placed.")
+        x, y = float(x), float(y)
+        cell = self._cell(x, y)
+        self._plants[plant_id] = (x, y, container_id, cell)
+        self._cells.setdefault(cell, []).append(plant_id)
+        if self._bounds is None:
+            self._bounds = [cell[0], cell[0], cell[1], cell[1]]
+        else:
+            bounds = self._bounds
+            bounds[0] = min(bounds[0], cell[0])
+            bounds[1] = max(bounds[1], cell[0])
+            bounds[2] = min(bounds[2], cell[1])
+            bounds[3] = max(bounds[3], cell[1])
+
+    def auto_place(self, plant_ids, length, width=None, shape='rectangle', container_id=None, origin=(0.0, 0.0)):
+        """
+        Spread plants evenly over a container whose lower-left corner sits at origin.
+
+        Rectangles get a grid with about calculate_plant_space inches between plants;
+        circles get a sunflower spiral, which keeps spacing even all the way to the rim.
+
+        Parameters:
+            plant_ids (list): IDs of the plants to place
+            length (float): Container length (or diameter) in inches
+            width (float): Container width in inches, for rectangles
+            shape (str): 'rectangle' or 'circle'
+            container_id: Container the plants are recorded under
+            origin (tuple): (x, y) of the container's lower-left corner
+
+        Returns:
+            float: spacing from calculate_plant_space for this container and count
+
+        Raises:
+            ValueError: If there are no plants or the shape is unknown
+        """
+        plant_ids = list(plant_ids)
+        spacing = calculate_plant_space(length, width, len(plant_ids), shape)
+        left, bottom = origin
+        count = len(plant_ids)
+        if shape == 'rectangle':
+            best = None
+            for columns in {math.floor(length / spacing), math.ceil(length / spacing)}:
+                columns = min(count, max(1, columns))
+                rows = -(-count // columns)
+                steps = (length / columns, width / rows)
+                if best is None or min(steps) > min(best[1]):
+                    best = (columns, steps)
+            columns, (step_x, step_y) = best
+            for i, plant_id in enumerate(plant_ids):
+                row, column = divmod(i, columns)
+                self.place(plant_id, left + (column + 0.5) * step_x, bottom + (row + 0.5) * step_y, container_id)
+        else:
+            radius = length / 2
+            for i, plant_id in enumerate(plant_ids):
+                r = radius * math.sqrt((i + 0.5) / count)
+                theta = i * _GOLDEN_ANGLE
+                self.place(plant_id, left + radius + r * math.cos(theta),
+                           bottom + radius + r * math.sin(theta), container_id)
+        return spacing
+
+    def remove(self, plant_id):
+        try:
+            x, y, container_id, cell = self._plants.pop(plant_id)
+        except KeyError:
+            raise ValueError(f"Plant with ID {plant_id} not found.") from None
+        members = self._cells[cell]
+        members.remove(plant_id)
+        if not members:
+            del self._cells[cell]
+
+    def position(self, plant_id):
+        """Return (x, y, container_id) for a placed plant."""
+        try:
+            x, y, container_id, _ = self._plants[plant_id]
+        except KeyError:
+            raise ValueError(f"Plant with ID {plant_id} not found.") from None
+        return x, y, container_id
+
+    def within(self, x, y, radius, exclude=None):
+        """
+        Return (plant_id, distance) for every plant within radius inches of (x, y), closest first.
+        """
+        if radius < 0:
+            raise ValueError("Radius must not be negative.")
+        if not self._cells:
+            return []
+        plants = self._plants
+        cells = self._cells
+        low_x, low_y = self._cell(x - radius, y - radius)
+        high_x, high_y = self._cell(x + radius, y + radius)
+        bounds = self._bounds
+        low_x, high_x = max(low_x, bounds[0]), min(high_x, bounds[1])
+        low_y, high_y = max(low_y, bounds[2]), min(high_y, bounds[3])
+        if low_x > high_x or low_y > high_y:
+            return []
+        if (high_x - low_x + 1) * (high_y - low_y + 1) > len(cells):
+            # Fewer occupied cells than cells in range: check the occupied ones instead.
+            searched = (members for (cx, cy), members in cells.items()
+                        if low_x <= cx <= high_x and low_y <= cy <= high_y)
+        else:
+            searched = (cells.get((cx, cy), ()) for cx in range(low_x, high_x + 1) for cy in range(low_y, high_y + 1))
+        found = []
+        for members in searched:
+            for plant_id in members:
+                px, py, _, _ = plants[plant_id]
+                distance = math.hypot(px - x, py - y)
+                if distance <= radius and plant_id != exclude:
+                    found.append((plant_id, distance))
+        found.sort(key=lambda item: item[1])
+        return found
+
+    def neighbors_within(self, plant_id, radius):
+        """Return (plant_id, distance) for the other plants within radius inches of a placed plant."""
+        x, y, _ = self.position(plant_id)
+        return self.within(x, y, radius, exclude=plant_id)
+
+    def nearest(self, x, y, k=1, exclude=None):
+        """
+        Return the k plants closest to (x, y) as (plant_id, distance), closest first.
+
+        Cells are searched in growing square rings around (x, y), clipped to the
+        cells that hold plants, until no unsearched cell can hold anything closer
+        than the k-th plant found so far. When plants are spread thinly over that
+        range, occupied cells are visited in order of their distance instead.
+        """
+        if k <= 0:
+            raise ValueError("k must be a positive number.")
+        if not self._cells:
+            return []
+        plants = self._plants
+        cells = self._cells
+        best = []
+
+        def visit(cell):
+            for plant_id in cells.get(cell, ()):
+                if plant_id == exclude:
+                    continue
+                px, py, _, _ = plants[plant_id]
+                distance = math.hypot(px - x, py - y)
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, plant_id))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, plant_id))
+
+        cx, cy = self._cell(x, y)
+        low_x, high_x, low_y, high_y = self._bounds
+        if (high_x - low_x + 1) * (high_y - low_y + 1) > 4 * len(cells):
+            for gap, cell in sorted((self._cell_gap(cell, x, y), cell) for cell in cells):
+                if len(best) == k and gap > -best[0][0]:
+                    break
+                visit(cell)
+        else:
+            first_ring = max(low_x - cx, cx - high_x, low_y - cy, cy - high_y, 0)
+            max_ring = max(abs(cx - low_x), abs(cx - high_x), abs(cy - low_y), abs(cy - high_y))
+            for ring in range(first_ring, max_ring + 1):
+                for cell in self._ring_cells(cx, cy, ring):
+                    visit(cell)
+                if len(best) == k:
+                    kth = -best[0][0]
+                    # ring * cell_size is a cheap lower bound; the exact gap to the unsearched
+                    # cells ends searches from far outside the layout much sooner.
+                    if kth <= ring * self._cell_size or kth <= self._outside_ring_gap(cx, cy, ring, x, y):
+                        break
+        return sorted(((plant_id, -distance) for distance, plant_id in best), key=lambda item: item[1])
+
+    def _ring_cells(self, cx, cy, ring):
+        """Return the cells of the square ring around (cx, cy) that lie inside the occupied bounds."""
+        if ring == 0:
+            return [(cx, cy)]
+        low_x, high_x, low_y, high_y = self._bounds
+        ring_cells = []
+        x_from, x_to = max(cx - ring, low_x), min(cx + ring, high_x)
+        for row in (cy - ring, cy + ring):
+            if low_y <= row <= high_y:
+                ring_cells.extend((column, row) for column in range(x_from, x_to + 1))
+        y_from, y_to = max(cy - ring + 1, low_y), min(cy + ring - 1, high_y)
+        for column in (cx - ring, cx + ring):
+            if low_x <= column <= high_x:
+                ring_cells.extend((column, row) for row in range(y_from, y_to + 1))
+        return ring_cells
+
+    def _outside_ring_gap(self, cx, cy, ring, x, y):
+        """
+        Return the distance from (x, y) to the nearest cell inside the occupied bounds
+        but outside the square of rings searched so far, or infinity if there is none.
+        """
+        low_x, high_x, low_y, high_y = self._bounds
+        size = self._cell_size
+        gap = math.inf
+        for x_from, x_to, y_from, y_to in ((cx + ring + 1, high_x, low_y, high_y), (low_x, cx - ring - 1, low_y, high_y),
+                                           (low_x, high_x, cy + ring + 1, high_y), (low_x, high_x, low_y, cy - ring - 1)):
+            if x_from <= x_to and y_from <= y_to:
+                gap_x = max(x_from * size - x, 0.0, x - (x_to + 1) * size)
+                gap_y = max(y_from * size - y, 0.0, y - (y_to + 1) * size)
+                gap = min(gap, math.hypot(gap_x, gap_y))
+        return gap
+
+    def _cell_gap(self, cell, x, y):
+        """Return the distance from (x, y) to the nearest point of a cell."""
+        size = self._cell_size
+        gap_x = max(cell[0] * size - x, 0.0, x - (cell[0] + 1) * size)
+        gap_y = max(cell[1] * size - y, 0.0, y - (cell[1] + 1) * size)
+        return math.hypot(gap_x, gap_y)
+
+    def spacing_violations(self, min_spacing):
+        """
+        Return every pair of plants closer together than min_spacing inches.
+
+        Returns:
+            list: (plant_id, plant_id, distance) tuples, closest pairs first
+        """
+        if min_spacing <= 0:
+            raise ValueError("Minimum spacing must be a positive number.")
+        plants = self._plants
+        cells = self._cells
+        reach = math.ceil(min_spacing / self._cell_size)
+        forward = [(dx, dy) for dx in range(0, reach + 1) for dy in range(-reach, reach + 1)
+                   if dx > 0 or dy > 0]
+        violations = []
+        for (cx, cy), members in cells.items():
+            points = [(plant_id, plants[plant_id][0], plants[plant_id][1]) for plant_id in members]
+            for i, (first, x1, y1) in enumerate(points):
+                for second, x2, y2 in points[i + 1:]:
+                    distance = math.hypot(x2 - x1, y2 - y1)
+                    if distance < min_spacing:
+                        violations.append((first, second, distance))
+            for dx, dy in forward:
+                others = cells.get((cx + dx, cy + dy))
+                if not others:
+                    continue
+                for second in others:
+                    x2, y2, _, _ = plants[second]
+                    for first, x1, y1 in points:
+                        distance = math.hypot(x2 - x1, y2 - y1)
+                        if distance < min_spacing:
+                            violations.append((first, second, distance))
+        violations.sort(key=lambda item: item[2])
+        return violations
+
+    def __contains__(self, plant_id):
+        return plant_id in self._plants
+
+    def __len__(self):
+        return len(self._plants)
+
+    def __str__(self):
+        return f"PlantLayout - {len(self._plants)} plants in {len(self._cells)} cells."
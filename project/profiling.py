@@ -0,0 +1,270 @@
+"""Latency histograms and the opt-in Profiler."""
+
+from bisect import bisect_left
+from functools import wraps
+import importlib
+import json
+import math
+import sys
+import time
+
+
+class LatencyHistogram:
+    """Counts request latencies in fixed millisecond buckets."""
+
+    BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    def __init__(self, buckets_ms=None):
+        self._buckets_ms = self.BUCKETS_MS if buckets_ms is None else tuple(buckets_ms)
+        self._counts = [0] * (len(self._buckets_ms) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+
+    @property
+    def buckets_ms(self):
+        return self._buckets_ms
+
+    @property
+    def counts(self):
+        """Count per bucket, with the last entry for latencies above every bound."""
+        return tuple(self._counts)
+
+    @property
+    def total_ms(self):
+        return self._total_ms
+
+    def record(self, seconds):
+        milliseconds = seconds * 1000
+        self._counts[bisect_left(self._buckets_ms, milliseconds)] += 1
+        self._count += 1
+        self._total_ms += milliseconds
+
+    def percentile(self, fraction):
+        """Return the upper bound (ms) of the bucket holding the given fraction of requests."""
+        if not self._count:
+            return 0.0
+        target = fraction * self._count
+        seen = 0
+        for bound, count in zip(self._buckets_ms + (math.inf,), self._counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return math.inf
+
+    def summary(self):
+        return {
+            'count': self._count,
+            'mean_ms': self._total_ms / self._count if self._count else 0.0,
+            'p50_ms': self.percentile(0.5),
+            'p99_ms': self.percentile(0.99),
+            'buckets': {str(bound): count for bound, count in zip(self._buckets_ms + ('+Inf',), self._counts)}
+        }
+
+
+PROFILE_BUCKETS_MS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 10, 100, 1000)
+
+PROFILE_TARGETS = (
+    'calculate_area', 'validate_container_dimensions', 'measurement_conversion', 'calculate_soil_volume',
+    'validate_boolean_input', 'format_planting_date', 'parse_plant_species', 'is_valid_ph_level',
+    'calculate_plant_space', 'calculate_compost_needed', 'calculate_season_change', 'to_date',
+    'days_until_frost', 'is_safe_to_plant', 'estimate_harvest_yield',
+    'ContainerManagement.add_container', 'ContainerManagement.get_container',
+    'ContainerManagement.calculate_compost', 'ContainerManagement.list_containers',
+    'Garden.add_plant', 'Garden.total_yield', 'Garden.is_safe_on',
+    'PlantingSchedule.get_season_info', 'PlantingSchedule.add_planting_record', 'PlantingSchedule.find_plantings',
+    'Soil.check_compatibility',
+)
+
+_active_profiler = None
+
+_PACKAGE = __name__.rpartition('.')[0]
+
+
+def _rebind(current, replacement):
+    """
+    Point every name bound to current in the package and its loaded submodules at
+    replacement, including private aliases such as dates._to_date.
+    """
+    prefix = _PACKAGE + '.'
+    for name, module in list(sys.modules.items()):
+        if module is not None and (name == _PACKAGE or name.startswith(prefix)):
+            namespace = vars(module)
+            for attribute, value in list(namespace.items()):
+                if value is current:
+                    namespace[attribute] = replacement
+
+
+class _CallStats:
+    __slots__ = ('calls', 'errors', 'allocated_blocks', 'latency')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.allocated_blocks = 0
+        self.latency = LatencyHistogram(PROFILE_BUCKETS_MS)
+
+
+class Profiler:
+    """
+    Opt-in call counts, latency histograms, and allocation counts for library functions and methods.
+
+    enable() swaps each target (a library function name or 'Class.method') for a
+    timing wrapper in the package and in every submodule loaded so far, and
+    disable() puts the originals back, so nothing is measured, and nothing costs
+    anything, while the profiler is off. Only one profiler can be enabled at a
+    time. Code outside the package that did `from project import name` before
+    enable() holds the original function and is not measured. Counts are not
+    locked, so totals from several threads are approximate.
+    """
+
+    def __init__(self, targets=PROFILE_TARGETS, allocations=False):
+        self._targets = tuple(targets)
+        self._allocations = allocations
+        self._stats = {}
+        self._originals = []
+
+    @property
+    def enabled(self):
+        return bool(self._originals)
+
+    def _resolve(self, target):
+        package = importlib.import_module(_PACKAGE)
+        owner_name, _, attribute = target.rpartition('.')
+        owner = getattr(package, owner_name, None) if owner_name else None
+        if owner_name and not isinstance(owner, type):
+            raise ValueError(f"Unknown profiling target: {target}")
+        original = owner.__dict__.get(attribute) if owner else getattr(package, attribute, None)
+        if not callable(original):
+            raise ValueError(f"Unknown profiling target: {target}")
+        return owner, attribute, original
+
+    def _wrap(self, name, func):
+        stats = self._stats.setdefault(name, _CallStats())
+        clock = time.perf_counter
+        blocks = sys.getallocatedblocks if self._allocations else None
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            before = blocks() if blocks else 0
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                stats.errors += 1
+                raise
+            finally:
+                stats.latency.record(clock() - start)
+                stats.calls += 1
+                if blocks:
+                    stats.allocated_blocks += blocks() - before
+
+        for attribute in ('cache_info', 'cache_clear'):
+            if hasattr(func, attribute):
+                setattr(wrapper, attribute, getattr(func, attribute))
+        return wrapper
+
+    def enable(self):
+        """
+        Start measuring the targets.
+
+        Raises:
+            RuntimeError: If a profiler is already enabled
+            ValueError: If a target does not name a function or method
+        """
+        global _active_profiler
+        if _active_profiler is not None:
+            raise RuntimeError("A profiler is already enabled.")
+        resolved = [self._resolve(target) for target in self._targets]
+        for target, (owner, attribute, original) in zip(self._targets, resolved):
+            wrapper = self._wrap(target, original)
+            if owner is None:
+                _rebind(original, wrapper)
+            else:
+                setattr(owner, attribute, wrapper)
+            self._originals.append((owner, attribute, original, wrapper))
+        _active_profiler = self
+
+    def disable(self):
+        """Put every original function back; the recorded numbers are kept."""
+        global _active_profiler
+        for owner, attribute, original, wrapper in reversed(self._originals):
+            if owner is None:
+                _rebind(wrapper, original)
+            else:
+                setattr(owner, attribute, original)
+        self._originals = []
+        if _active_profiler is self:
+            _active_profiler = None
+
+    def reset(self):
+        for stats in self._stats.values():
+            stats.calls = stats.errors = stats.allocated_blocks = 0
+            stats.latency = LatencyHistogram(PROFILE_BUCKETS_MS)
+
+    def report(self):
+        """Return {target: {'calls', 'errors', 'allocated_blocks', 'latency'}} for every target called."""
+        return {
+            name: {
+                'calls': stats.calls,
+                'errors': stats.errors,
+                'allocated_blocks': stats.allocated_blocks if self._allocations else None,
+                'latency': stats.latency.summary()
+            }
+            for name, stats in sorted(self._stats.items()) if stats.calls
+        }
+
+    def to_json(self):
+        return json.dumps(self.report(), indent=2)
+
+    def to_prometheus(self, prefix='garden'):
+        """Return the measurements in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {prefix}_calls_total Calls to each instrumented function.",
+            f"# TYPE {prefix}_calls_total counter"
+        ]
+        called = [(name, stats) for name, stats in sorted(self._stats.items()) if stats.calls]
+        lines += [f'{prefix}_calls_total{{function="{name}"}} {stats.calls}' for name, stats in called]
+        lines += [
+            f"# HELP {prefix}_call_errors_total Calls that raised an exception.",
+            f"# TYPE {prefix}_call_errors_total counter"
+        ]
+        lines += [f'{prefix}_call_errors_total{{function="{name}"}} {stats.errors}' for name, stats in called]
+        lines += [
+            f"# HELP {prefix}_call_duration_seconds Time spent in each instrumented function.",
+            f"# TYPE {prefix}_call_duration_seconds histogram"
+        ]
+        for name, stats in called:
+            latency = stats.latency
+            seen = 0
+            for bound, count in zip(latency.buckets_ms + (math.inf,), latency.counts):
+                seen += count
+                le = '+Inf' if bound == math.inf else repr(bound / 1000)
+                lines.append(f'{prefix}_call_duration_seconds_bucket{{function="{name}",le="{le}"}} {seen}')
+            lines.append(f'{prefix}_call_duration_seconds_sum{{function="{name}"}} {latency.total_ms / 1000!r}')
+            lines.append(f'{prefix}_call_duration_seconds_count{{function="{name}"}} {stats.calls}')
+        if self._allocations:
+            lines += [
+                f"# HELP {prefix}_allocated_blocks_total Net memory blocks left allocated by each function.",
+                f"# TYPE {prefix}_allocated_blocks_total counter"
+            ]
+            lines += [f'{prefix}_allocated_blocks_total{{function="{name}"}} {stats.allocated_blocks}'
+                      for name, stats in called]
+        return "\n".join(lines) + "\n"
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.disable()
+
+
+def profiled(targets=PROFILE_TARGETS, allocations=False):
+    """
+    Profile the targets for one job:
+
+        with profiled() as profiler:
+            run_job()
+        print(profiler.to_prometheus())
+    """
+    return Profiler(targets, allocations)
@@ -0,0 +1,324 @@
+"""The asyncio garden service, its client, and the load test."""
+
+import asyncio
+import json
+import time
+
+from .garden import PlantingSchedule
+from .geometry import calculate_compost_needed
+from .management import ContainerManagement
+from .profiling import LatencyHistogram
+
+
+class ServiceBusy(Exception):
+    """Raised when GardenService already has max_pending requests in flight."""
+
+
+class GardenService:
+    """
+    asyncio server that answers JSON requests, one per line, over TCP or a Unix socket.
+
+    Each request is a JSON object with an 'op' and an optional 'id' that is echoed
+    back. Supported ops: 'compost' (container_id, ratio), 'yield' (garden, details),
+    'season' (date), 'safe' (garden, date), 'metrics', and 'ping'. Compost requests
+    that arrive together are answered in one flush instead of one callback each, and
+    requests beyond max_pending are turned away with a 'busy' error instead of
+    queueing. A connection is not read from while connection_limit of its requests
+    are still unanswered, so a client that sends faster than it is answered is held
+    back by TCP flow control rather than piling up tasks and replies on the server.
+    """
+
+    ENDPOINTS = ('compost', 'yield', 'season', 'safe', 'metrics', 'ping')
+
+    def __init__(self, containers=None, gardens=None, schedule=None,
+                 max_pending=10_000, batch_size=512, batch_wait=0.002, connection_limit=256):
+        self._containers = ContainerManagement() if containers is None else containers
+        self._gardens = {} if gardens is None else {g.name(): g for g in gardens}
+        self._schedule = PlantingSchedule() if schedule is None else schedule
+        self._max_pending = max_pending
+        self._batch_size = batch_size
+        self._batch_wait = batch_wait
+        self._connection_limit = connection_limit
+        self._pending = 0
+        self._compost_batch = []
+        self._flush_handle = None
+        self._latency = {endpoint: LatencyHistogram() for endpoint in self.ENDPOINTS}
+        self._server = None
+
+    async def start(self, host='127.0.0.1', port=0, path=None):
+        """
+        Start listening on a TCP host/port, or on a Unix socket when path is given.
+
+        Returns:
+            asyncio.Server: the running server (port 0 picks a free port)
+        """
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=path)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    @property
+    def address(self):
+        return self._server.sockets[0].getsockname()
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    def metrics(self):
+        return {endpoint: histogram.summary() for endpoint, histogram in self._latency.items()}
+
+    async def _handle_connection(self, reader, writer):
+        tasks = set()
+        in_flight = asyncio.Semaphore(self._connection_limit)
+
+        def done(task):
+            tasks.discard(task)
+            in_flight.release()
+
+        try:
+            while True:
+                await in_flight.acquire()
+                line = await reader.readline()
+                if not line:
+                    break
+                task = asyncio.ensure_future(self._respond(line, writer))
+                tasks.add(task)
+                task.add_done_callback(done)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    async def _respond(self, line, writer):
+        start = time.perf_counter()
+        request_id = None
+        histogram = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Each request must be a JSON object.")
+            request_id = request.get('id')
+            endpoint = request.get('op')
+            if not isinstance(endpoint, str) or endpoint not in self._latency:
+                raise ValueError(f"Unknown op: {endpoint}")
+            histogram = self._latency[endpoint]
+            if self._pending >= self._max_pending:
+                raise ServiceBusy("Server is busy, try again.")
+            self._pending += 1
+            try:
+                result = await self._dispatch(endpoint, request)
+            finally:
+                self._pending -= 1
+            response = {'id': request_id, 'ok': True, 'result': result}
+        except (ValueError, TypeError, KeyError, ServiceBusy) as error:
+            message = f"Missing field: {error.args[0]}" if isinstance(error, KeyError) else str(error)
+            response = {'id': request_id, 'ok': False, 'error': message}
+        except Exception as error:
+            # Any other failure still gets a reply, so the client is never left waiting.
+            response = {'id': request_id, 'ok': False, 'error': f"Internal error: {type(error).__name__}: {error}"}
+        if histogram is not None:
+            histogram.record(time.perf_counter() - start)
+        try:
+            payload = json.dumps(response)
+        except (TypeError, ValueError) as error:
+            payload = json.dumps({'id': request_id, 'ok': False, 'error': f"Result could not be encoded: {error}"})
+        writer.write(payload.encode('utf-8') + b'\n')
+        await writer.drain()
+
+    async def _dispatch(self, endpoint, request):
+        if endpoint == 'compost':
+            return await self._queue_compost(request['container_id'], request.get('ratio', 0.25))
+        if endpoint == 'yield':
+            return self._garden(request['garden']).total_yield(request.get('details', False))
+        if endpoint == 'season':
+            return self._schedule.get_season_info(request.get('date'))
+        if endpoint == 'safe':
+            return self._garden(request['garden']).is_safe_on(request['date'])
+        if endpoint == 'metrics':
+            return self.metrics()
+        return 'pong'
+
+    def _garden(self, name):
+        try:
+            return self._gardens[name]
+        except KeyError:
+            raise ValueError(f"Garden {name} not found.") from None
+
+    def _queue_compost(self, container_id, ratio):
+        future = asyncio.get_running_loop().create_future()
+        self._compost_batch.append((container_id, ratio, future))
+        if len(self._compost_batch) >= self._batch_size:
+            self._flush_compost()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self._batch_wait, self._flush_compost)
+        return future
+
+    def _flush_compost(self):
+        """Answer every queued compost request from one call to calculate_compost_rows."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._compost_batch = self._compost_batch, []
+        try:
+            results = calculate_compost_rows(self._containers, [(container_id, ratio) for container_id, ratio, _ in batch])
+        except Exception as error:
+            results = [error] * len(batch)
+        for (container_id, ratio, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def calculate_compost_rows(containers, requests):
+    """
+    Work out compost for many (container_id, ratio) requests, one row at a time.
+
+    Unlike calculate_compost, a bad row does not stop the others: its slot in the
+    result holds the ValueError or TypeError it raised.
+
+    Returns:
+        list: calculate_compost_needed results (or exceptions), one per request
+    """
+    results = []
+    for container_id, ratio in requests:
+        try:
+            container = containers.get_container(container_id)
+            results.append(calculate_compost_needed(container['volume_cu_in'], ratio))
+        except (ValueError, TypeError) as error:
+            results.append(error)
+    return results
+
+
+class GardenClient:
+    """asyncio client for GardenService that can keep many requests in flight on one connection."""
+
+    def __init__(self):
+        self._reader = None
+        self._writer = None
+        self._waiting = {}
+        self._next_id = 0
+        self._listener = None
+        self._closed = None
+
+    async def connect(self, host='127.0.0.1', port=None, path=None):
+        if path is not None:
+            self._reader, self._writer = await asyncio.open_unix_connection(path)
+        else:
+            self._reader, self._writer = await asyncio.open_connection(host, port)
+        self._listener = asyncio.ensure_future(self._listen())
+        return self
+
+    async def _listen(self):
+        reason = "Connection closed by the server."
+        while True:
+            try:
+                line = await self._reader.readline()
+            except (ConnectionError, ValueError) as error:
+                reason = f"Connection failed: {error}"
+                break
+            if not line:
+                break
+            try:
+                response = json.loads(line)
+                request_id = response.get('id')
+            except (ValueError, AttributeError):
+                # Without a readable id there is no telling which request this
+                # answers, so every waiting request is failed instead of left hanging.
+                reason = f"Malformed reply from the server: {line[:80]!r}"
+                break
+            future = self._waiting.pop(request_id, None)
+            if future is not None and not future.done():
+                future.set_result(response)
+        self._closed = reason
+        for future in self._waiting.values():
+            if not future.done():
+                future.set_exception(ConnectionError(reason))
+        self._waiting.clear()
+
+    async def request(self, op, **params):
+        """
+        Send one request and wait for its response.
+
+        Returns:
+            dict: the response, with 'ok' and either 'result' or 'error'
+
+        Raises:
+            ConnectionError: If the connection closed or the server sent a reply
+                that could not be read, before or while waiting
+        """
+        if self._closed is not None:
+            raise ConnectionError(self._closed)
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[request_id] = future
+        self._writer.write(json.dumps({'id': request_id, 'op': op, **params}).encode('utf-8') + b'\n')
+        await self._writer.drain()
+        return await future
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+        if self._listener is not None:
+            self._listener.cancel()
+
+
+async def load_test(requests, host='127.0.0.1', port=None, path=None, concurrency=100, connections=4):
+    """
+    Send many requests to a running GardenService and measure the throughput.
+
+    Parameters:
+        requests (list): (op, params dict) pairs to send
+        concurrency (int): Requests in flight at once, across all connections
+        connections (int): Client connections to spread the requests over
+
+    Returns:
+        dict: 'requests', 'errors', 'seconds', 'requests_per_second', and 'latency'
+            (a LatencyHistogram summary measured by the client)
+    """
+    clients = [await GardenClient().connect(host, port, path) for _ in range(connections)]
+    histogram = LatencyHistogram()
+    errors = 0
+    limit = asyncio.Semaphore(concurrency)
+
+    async def send(index, op, params):
+        nonlocal errors
+        async with limit:
+            start = time.perf_counter()
+            response = await clients[index % connections].request(op, **params)
+            histogram.record(time.perf_counter() - start)
+            if not response['ok']:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(i, op, params) for i, (op, params) in enumerate(requests)))
+    elapsed = time.perf_counter() - start
+    for client in clients:
+        await client.close()
+    return {
+        'requests': len(requests),
+        'errors': errors,
+        'seconds': elapsed,
+        'requests_per_second': len(requests) / elapsed if elapsed else 0.0,
+        'latency': histogram.summary()
+    }
+
+
+def run_service(containers=None, gardens=None, schedule=None, host='127.0.0.1', port=8326, path=None):
+    """Run a GardenService until interrupted."""
+    async def main():
+        service = GardenService(containers, gardens, schedule)
+        await service.start(host, port, path)
+        print(f"Garden service listening on {path or service.address}")
+        await service.serve_forever()
+
+    asyncio.run(main())
@@ -0,0 +1,283 @@
+"""Binary garden snapshots that are memory-mapped instead of parsed."""
+
+from datetime import date
+import math
+import mmap
+import struct
+
+from .garden import Garden, PlantingSchedule
+from .geometry import calculate_compost_needed
+from .management import ContainerManagement
+from .yields import estimate_harvest_yield
+
+
+SNAPSHOT_MAGIC = b'GARDENSN'
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct('<8sHH8QIiiI')
+_SNAPSHOT_CONTAINER = struct.Struct('<IB3x5d')
+# Plant counts are doubles so fractional counts, which Garden accepts, can be written.
+_SNAPSHOT_PLANT = struct.Struct('<IB3xdd')
+_SNAPSHOT_PLANTING = struct.Struct('<IiI')
+_SNAPSHOT_OFFSET = struct.Struct('<Q')
+_NO_STRING = 0xFFFFFFFF
+_SNAPSHOT_SHAPES = ('rectangle', 'circle')
+_SNAPSHOT_TOLERANCES = ('tender', 'half-hardy', 'hardy')
+
+
+def _check_text(value, what, optional=True):
+    if (value is not None or not optional) and not isinstance(value, str):
+        raise ValueError(f"Snapshots can only store text {what}s, not {value!r}.")
+    return value
+
+
+def write_snapshot(path, containers=None, garden=None, schedule=None):
+    """
+    Write containers, a garden, and a planting schedule to a binary snapshot file.
+
+    The file holds a fixed-size header, fixed-width container, plant, and planting
+    records, and a string table that every name and ID points into. Containers are
+    sorted by ID so GardenSnapshot can binary search them without loading the file.
+
+    Parameters:
+        path (str): File to write
+        containers: ContainerManagement or ColumnarContainerStore, or None
+        garden (Garden): Garden to include, or None
+        schedule (PlantingSchedule): Planting schedule to include, or None
+
+    Returns:
+        int: number of bytes written
+
+    Raises:
+        ValueError: If a container ID, plant name, or other stored name is not a
+            string; this is checked before the file is opened
+    """
+    strings = {}
+
+    def intern(text):
+        if text is None:
+            return _NO_STRING
+        index = strings.get(text)
+        if index is None:
+            index = strings[text] = len(strings)
+        return index
+
+    records = [] if containers is None else containers.list_containers()
+    records = sorted(records, key=lambda record: _check_text(record['id'], "container ID", optional=False).encode('utf-8'))
+    plants = [] if garden is None else garden.plants()
+    plantings = [] if schedule is None else schedule.get_planting_history()
+    for plant in plants:
+        _check_text(plant['plant_type'], "plant type")
+    for planting in plantings:
+        _check_text(planting['plant'], "plant name")
+        _check_text(planting['container'], "container ID")
+    if garden is not None:
+        _check_text(garden.name(), "garden name")
+    if schedule is not None:
+        _check_text(schedule.location, "location")
+
+    with open(path, 'wb') as handle:
+        handle.write(bytes(_SNAPSHOT_HEADER.size))
+        containers_offset = handle.tell()
+        for record in records:
+            width = record['width']
+            handle.write(_SNAPSHOT_CONTAINER.pack(
+                intern(record['id']), _SNAPSHOT_SHAPES.index(record['shape']),
+                record['length'], math.nan if width is None else width,
+                record['depth'], record['area_sq_in'], record['volume_cu_in']))
+        plants_offset = handle.tell()
+        for plant in plants:
+            avg = plant['avg_per_plant']
+            handle.write(_SNAPSHOT_PLANT.pack(
+                intern(plant['plant_type']), _SNAPSHOT_TOLERANCES.index(plant['tolerance']),
+                float(plant['count']), math.nan if avg is None else avg))
+        plantings_offset = handle.tell()
+        for planting in plantings:
+            handle.write(_SNAPSHOT_PLANTING.pack(
+                intern(planting['plant']), planting['date'].toordinal(), intern(planting['container'])))
+
+        garden_name = _NO_STRING if garden is None else intern(garden.name())
+        last_frost = 0 if garden is None else garden.last_frost().toordinal()
+        first_frost = 0 if garden is None else garden.first_frost().toordinal()
+        location = _NO_STRING if schedule is None else intern(schedule.location)
+
+        strings_offset = handle.tell()
+        encoded = [text.encode('utf-8') for text in strings]
+        position = 0
+        for text in encoded:
+            handle.write(_SNAPSHOT_OFFSET.pack(position))
+            position += len(text)
+        handle.write(_SNAPSHOT_OFFSET.pack(position))
+        for text in encoded:
+            handle.write(text)
+        size = handle.tell()
+
+        handle.seek(0)
+        handle.write(_SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0,
+            len(records), containers_offset, len(plants), plants_offset,
+            len(plantings), plantings_offset, len(encoded), strings_offset,
+            garden_name, last_frost, first_frost, location))
+    return size
+
+
+class GardenSnapshot:
+    """
+    Read-only view of a snapshot written by write_snapshot.
+
+    The file is memory-mapped and only the header is read up front, so
+    get_container and total_yield can be answered right after opening.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < _SNAPSHOT_HEADER.size:
+            self._map.close()
+            raise ValueError("File is not a garden snapshot.")
+        (magic, version, _, self._n_containers, self._containers_offset,
+         self._n_plants, self._plants_offset, self._n_plantings, self._plantings_offset,
+         self._n_strings, self._strings_offset, self._garden_name, self._last_frost,
+         self._first_frost, self._location) = _SNAPSHOT_HEADER.unpack_from(self._map)
+        if magic != SNAPSHOT_MAGIC:
+            self._map.close()
+            raise ValueError("File is not a garden snapshot.")
+        if version != SNAPSHOT_VERSION:
+            self._map.close()
+            raise ValueError(f"Unsupported snapshot version: {version}")
+        self._text_offset = self._strings_offset + (self._n_strings + 1) * _SNAPSHOT_OFFSET.size
+        self._yield = None
+
+    def _string_bytes(self, index):
+        start, end = struct.unpack_from('<QQ', self._map, self._strings_offset + index * _SNAPSHOT_OFFSET.size)
+        return self._map[self._text_offset + start:self._text_offset + end]
+
+    def _string(self, index):
+        if index == _NO_STRING:
+            return None
+        return self._string_bytes(index).decode('utf-8')
+
+    def _container(self, row):
+        (id_index, shape, length, width, depth, area, volume) = _SNAPSHOT_CONTAINER.unpack_from(
+            self._map, self._containers_offset + row * _SNAPSHOT_CONTAINER.size)
+        return {
+            'id': self._string(id_index),
+            'shape': _SNAPSHOT_SHAPES[shape],
+            'length': length,
+            'width': None if math.isnan(width) else width,
+            'depth': depth,
+            'area_sq_in': area,
+            'volume_cu_in': volume
+        }
+
+    def get_container(self, container_id):
+        """
+        Binary search the sorted container records for an ID.
+
+        Returns:
+            dict: Details about the container, in the ContainerManagement format.
+
+        Raises:
+            ValueError: If the container is not in the snapshot
+        """
+        target = container_id.encode('utf-8')
+        low, high = 0, self._n_containers
+        while low < high:
+            middle = (low + high) // 2
+            id_index = struct.unpack_from(
+                '<I', self._map, self._containers_offset + middle * _SNAPSHOT_CONTAINER.size)[0]
+            key = self._string_bytes(id_index)
+            if key < target:
+                low = middle + 1
+            elif key > target:
+                high = middle
+            else:
+                return self._container(middle)
+        raise ValueError(f"Container with ID {container_id} not found.")
+
+    def calculate_compost(self, container_id, ratio=0.25):
+        container = self.get_container(container_id)
+        return calculate_compost_needed(container['volume_cu_in'], ratio)
+
+    def list_containers(self):
+        """Return every container, sorted by ID."""
+        return [self._container(row) for row in range(self._n_containers)]
+
+    def plants(self):
+        plants = []
+        for row in range(self._n_plants):
+            type_index, tolerance, count, avg = _SNAPSHOT_PLANT.unpack_from(
+                self._map, self._plants_offset + row * _SNAPSHOT_PLANT.size)
+            plants.append({
+                "plant_type": self._string(type_index),
+                "count": int(count) if isinstance(count, float) and count.is_integer() else count,
+                "tolerance": _SNAPSHOT_TOLERANCES[tolerance],
+                "avg_per_plant": None if math.isnan(avg) else avg
+            })
+        return plants
+
+    def total_yield(self):
+        """Return the stored garden's yield in the same format as Garden.total_yield."""
+        if self._yield is None:
+            total = 0
+            details = []
+            for p in self.plants():
+                y = estimate_harvest_yield(p["plant_type"], p["count"], p["avg_per_plant"])
+                total += y["total"]
+                details.append(y)
+            self._yield = {"garden": self._string(self._garden_name), "total_lb": total, "by_plant": details}
+        return {**self._yield, "by_plant": [dict(y) for y in self._yield["by_plant"]]}
+
+    def plantings(self):
+        plantings = []
+        for row in range(self._n_plantings):
+            plant_index, ordinal, container_index = _SNAPSHOT_PLANTING.unpack_from(
+                self._map, self._plantings_offset + row * _SNAPSHOT_PLANTING.size)
+            plantings.append({
+                'plant': self._string(plant_index),
+                'date': date.fromordinal(ordinal),
+                'container': self._string(container_index)
+            })
+        return plantings
+
+    def to_container_management(self):
+        """Load every stored container into a new ContainerManagement."""
+        cm = ContainerManagement()
+        for container in self.list_containers():
+            cm.add_container(container['id'], container['length'], container['width'],
+                             container['depth'], container['shape'])
+        return cm
+
+    def to_garden(self):
+        """Load the stored garden into a new Garden, or return None if there is none."""
+        if self._garden_name == _NO_STRING:
+            return None
+        garden = Garden(self._string(self._garden_name), date.fromordinal(self._last_frost),
+                        date.fromordinal(self._first_frost))
+        garden.add_plants((p["plant_type"], p["count"], p["tolerance"], p["avg_per_plant"])
+                          for p in self.plants())
+        return garden
+
+    def to_planting_schedule(self):
+        """Load the stored plantings into a new PlantingSchedule, or return None if there is none."""
+        if self._location == _NO_STRING:
+            return None
+        schedule = PlantingSchedule(self._string(self._location))
+        for planting in self.plantings():
+            schedule.add_planting_record(planting['plant'], planting['date'], planting['container'])
+        return schedule
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._n_containers
+
+    def __str__(self):
+        return (f"GardenSnapshot - {self._n_containers} containers, {self._n_plants} plants, "
+                f"{self._n_plantings} plantings.")
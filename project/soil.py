@@ -0,0 +1,368 @@
+"""Plant species and pH checks, the Plant and Soil classes, and SoilMatcher."""
+
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+from .dates import _parse_iso
+
+
+def parse_plant_species(full_name: str) -> str:
+    """
+    Extracts the Genus (the first word) from a scientific plant name.
+
+    Parameters:
+        full_name (str): The full scientific name (e.g., 'Solanum lycopersicum').
+
+    Returns:
+        str: The genus name.
+
+    Raises:
+        TypeError: If full_name is not a string.
+        ValueError: If the name is empty or does not contain a space.
+    """
+    if not isinstance(full_name, str):
+        raise TypeError("Scientific name must be a string.")
+        
+    cleaned_name = full_name.strip()
+    if not cleaned_name:
+        raise ValueError("Scientific name cannot be empty.")
+        
+    name_parts = cleaned_name.split()
+    if len(name_parts) == 0:
+        raise ValueError("Could not parse genus from the provided name.")
+        
+    return name_parts[0].capitalize()
+
+
+def is_valid_ph_level(ph_value: float) -> bool:
+    """
+    Validate that a soil pH value is a number and is within the valid range of 0.0 to 14.0.
+
+    Parameters:
+        ph_value (float): The pH measurement to validate.
+
+    Returns:
+        bool: True if the pH is valid, False otherwise.
+
+    Raises:
+        TypeError: If ph_value is not an int or float.
+    """
+    if not isinstance(ph_value, (int, float)):
+        raise TypeError("pH value must be a number.")
+    return 0.0 <= ph_value <= 14.0
+
+
+_SPECIES_NAMES = {}
+_SOIL_TYPES = {}
+
+
+def _intern(table, name):
+    """Return the one shared copy of name kept in table, adding it if it is new."""
+    return table.setdefault(name, name)
+
+
+def interned_name_counts():
+    """Return how many distinct species names and soil types Plant and Soil objects share."""
+    return {'species': len(_SPECIES_NAMES), 'soil_types': len(_SOIL_TYPES)}
+
+
+class Plant:
+    """
+    Represents a plant with species, planting date, and soil requirements.
+
+    Instances use __slots__, share one copy of each species name, and keep the
+    planting date as a day ordinal, so millions of plants stay small.
+    """
+
+    __slots__ = ('_species', '_planting_ordinal', '_required_ph', '_harvest_ready')
+
+    def __init__(self, species, planting_date, required_ph):
+        """
+        Initialize a Plant object.
+        
+        Args:
+            species (str): Scientific or common name of the plant.
+            planting_date (str): Date the plant was planted (YYYY-MM-DD).
+            required_ph (float): Ideal soil pH for this plant.
+
+        Raises:
+            ValueError: If inputs are invalid.
+        """
+        if not isinstance(species, str) or not species.strip():
+            raise ValueError("Species name must be a valid string.")
+        if not self.is_valid_date(planting_date):
+            raise ValueError("Planting date must be in YYYY-MM-DD format.")
+        if not self.is_valid_ph(required_ph):
+            raise ValueError("pH must be between 0 and 14.")
+
+        self._species = _intern(_SPECIES_NAMES, self.parse_plant_species(species))
+        self._planting_ordinal = _parse_iso(planting_date).toordinal()
+        self._required_ph = required_ph
+        self._harvest_ready = False
+
+    @property
+    def species(self):
+        return self._species
+
+    @property
+    def planting_date(self):
+        return date.fromordinal(self._planting_ordinal).isoformat()
+
+    @property
+    def planting_ordinal(self):
+        return self._planting_ordinal
+
+    @property
+    def required_ph(self):
+        return self._required_ph
+
+    def mark_ready_for_harvest(self):
+        self._harvest_ready = True
+
+    def is_ready(self):
+        return self._harvest_ready
+
+    def days_since_planted(self):
+        return date.today().toordinal() - self._planting_ordinal
+
+    def parse_plant_species(self, name):
+        return name.split()[0]
+
+    def format_planting_date(self, date_obj):
+        return date_obj.strftime("%Y-%m-%d")
+
+    def is_valid_ph(self, ph_value):
+        return isinstance(ph_value, (int, float)) and 0 <= ph_value <= 14
+
+    def is_valid_date(self, date_str):
+        if not isinstance(date_str, str):
+            raise TypeError("date_str must be a string")
+        try:
+            _parse_iso(date_str)
+            return True
+        except ValueError:
+            return False
+
+    def __str__(self):
+        status = "Ready" if self._harvest_ready else "Growing"
+        return f"{self._species} planted on {self.planting_date} ({status})"
+
+    def __repr__(self):
+        return f"Plant(species='{self._species}', date='{self.planting_date}', pH={self._required_ph})"
+
+
+class Soil:
+    """Represents soil with its type and pH level."""
+
+    __slots__ = ('_soil_type', '_ph_level')
+
+    def __init__(self, soil_type, ph_level):
+        """
+        Initialize a Soil object.
+
+        Args:
+            soil_type (str): The soil type (e.g., 'loamy', 'clay', 'sandy').
+            ph_level (float): The soil's pH level.
+
+        Raises:
+            ValueError: If parameters are invalid.
+        """
+        if not isinstance(soil_type, str) or not soil_type.strip():
+            raise ValueError("Soil type must be a valid string.")
+        if not self.is_valid_ph(ph_level):
+            raise ValueError("pH must be between 0 and 14.")
+
+        self._soil_type = _intern(_SOIL_TYPES, soil_type)
+        self._ph_level = ph_level
+
+    @property
+    def soil_type(self):
+        return self._soil_type
+
+    @property
+    def ph_level(self):
+        return self._ph_level
+
+    def adjust_ph(self, new_ph):
+        if not self.is_valid_ph(new_ph):
+            raise ValueError("Invalid pH level.")
+        self._ph_level = new_ph
+        return f"Soil pH adjusted to {new_ph}"
+
+    def check_compatibility(self, plant, tolerance=1):
+        return abs(self._ph_level - plant.required_ph) <= tolerance
+
+    def is_valid_ph(self, ph_value):
+        return isinstance(ph_value, (int, float)) and 0 <= ph_value <= 14
+
+    def __str__(self):
+        return f"{self._soil_type.capitalize()} soil (pH {self._ph_level})"
+
+    def __repr__(self):
+        return f"Soil(type='{self._soil_type}', pH={self._ph_level})"
+
+
+def _required_ph(plant):
+    return plant.required_ph if isinstance(plant, Plant) else plant
+
+
+class SoilMatcher:
+    """
+    Soil samples indexed by pH in a sorted list, so the soils compatible with a
+    plant (abs(ph_level - required_ph) <= tolerance, as Soil.check_compatibility)
+    come from a bisect range instead of a pass over every soil.
+
+    Each soil is indexed at the pH it had when added. Change an indexed soil's pH
+    with SoilMatcher.adjust_ph; a soil changed with Soil.adjust_ph keeps its old
+    place until SoilMatcher.adjust_ph(soil_id, soil.ph_level) is called for it.
+    """
+
+    def __init__(self, tolerance=1):
+        if tolerance < 0:
+            raise ValueError("Tolerance must not be negative.")
+        self._tolerance = tolerance
+        self._soils = {}
+        self._indexed_ph = {}
+        self._phs = []
+        self._ids = []
+
+    @property
+    def tolerance(self):
+        return self._tolerance
+
+    def add_soil(self, soil_id, soil):
+        """
+        Index a Soil under soil_id.
+
+        Raises:
+            ValueError: If a soil with this ID is already indexed
+        """
+        if soil_id in self._soils:
+            raise ValueError(f"Soil with ID {soil_id} already exists.")
+        self._soils[soil_id] = soil
+        self._index(soil_id, soil.ph_level)
+
+    def _index(self, soil_id, ph):
+        position = bisect_right(self._phs, ph)
+        self._phs.insert(position, ph)
+        self._ids.insert(position, soil_id)
+        self._indexed_ph[soil_id] = ph
+
+    def _unindex(self, soil_id):
+        position = bisect_left(self._phs, self._indexed_ph.pop(soil_id))
+        while self._ids[position] != soil_id:
+            position += 1
+        del self._phs[position]
+        del self._ids[position]
+
+    def remove_soil(self, soil_id):
+        try:
+            soil = self._soils.pop(soil_id)
+        except KeyError:
+            raise ValueError(f"Soil with ID {soil_id} not found.") from None
+        self._unindex(soil_id)
+        return soil
+
+    def adjust_ph(self, soil_id, new_ph):
+        """
+        Adjust an indexed soil's pH with Soil.adjust_ph and move it to its new place in the index.
+
+        Raises:
+            ValueError: If no soil has this ID or new_ph is not a valid pH
+        """
+        soil = self.get_soil(soil_id)
+        message = soil.adjust_ph(new_ph)
+        self._unindex(soil_id)
+        self._index(soil_id, new_ph)
+        return message
+
+    def get_soil(self, soil_id):
+        try:
+            return self._soils[soil_id]
+        except KeyError:
+            raise ValueError(f"Soil with ID {soil_id} not found.") from None
+
+    def _window(self, ph, tolerance):
+        """Return the index range of soils whose pH is within tolerance of ph."""
+        # Bisect on a slightly wider range, then trim with the exact abs() test so
+        # results match check_compatibility even where the bounds round differently.
+        slack = 1e-9 * (abs(ph) + tolerance + 1)
+        phs = self._phs
+        low = bisect_left(phs, ph - tolerance - slack)
+        high = bisect_right(phs, ph + tolerance + slack)
+        while low < high and abs(phs[low] - ph) > tolerance:
+            low += 1
+        while high > low and abs(phs[high - 1] - ph) > tolerance:
+            high -= 1
+        return low, high
+
+    def compatible_soils(self, plant, tolerance=None):
+        """
+        Return the IDs of the soils compatible with a plant, in pH order.
+
+        Parameters:
+            plant (Plant or float): Plant, or its required pH
+            tolerance (float): Allowed pH difference, or None for the matcher's tolerance
+        """
+        tolerance = self._tolerance if tolerance is None else tolerance
+        low, high = self._window(_required_ph(plant), tolerance)
+        return self._ids[low:high]
+
+    def best_soil(self, plant, tolerance=None):
+        """
+        Return the ID of the compatible soil closest in pH to the plant, or None.
+
+        Ties go to the soil with the lower pH, then to the one indexed first.
+        """
+        tolerance = self._tolerance if tolerance is None else tolerance
+        ph = _required_ph(plant)
+        phs = self._phs
+        position = bisect_left(phs, ph)
+        best = None
+        for candidate in (position - 1, position):
+            if 0 <= candidate < len(phs):
+                distance = abs(phs[candidate] - ph)
+                if distance <= tolerance and (best is None or distance < best[0]):
+                    best = (distance, candidate)
+        if best is None:
+            return None
+        # Step back over soils with the same pH so the first one indexed wins.
+        candidate = best[1]
+        while candidate > 0 and phs[candidate - 1] == phs[candidate]:
+            candidate -= 1
+        return self._ids[candidate]
+
+    def best_soils(self, plants, tolerance=None):
+        """Return {plant_id: best soil ID or None} for a mapping of plant IDs to plants."""
+        return {plant_id: self.best_soil(plant, tolerance) for plant_id, plant in plants.items()}
+
+    def join(self, plants, tolerance=None):
+        """
+        Yield every compatible (plant_id, soil_id) pair for a mapping of plant IDs to plants.
+
+        Plants are sorted by required pH and swept across the sorted soils, so the
+        whole join costs O((n + m) log n + pairs) instead of one check per combination.
+        Pairs come out in plant pH order, and soils in pH order within each plant.
+        """
+        tolerance = self._tolerance if tolerance is None else tolerance
+        ordered = sorted(((_required_ph(plant), plant_id) for plant_id, plant in plants.items()),
+                         key=lambda item: item[0])
+        phs = self._phs
+        ids = self._ids
+        count = len(phs)
+        low = high = 0
+        for ph, plant_id in ordered:
+            while low < count and phs[low] < ph and abs(phs[low] - ph) > tolerance:
+                low += 1
+            if high < low:
+                high = low
+            while high < count and (phs[high] <= ph or abs(phs[high] - ph) <= tolerance):
+                high += 1
+            for position in range(low, high):
+                yield plant_id, ids[position]
+
+    def __len__(self):
+        return len(self._soils)
+
+    def __str__(self):
+        return f"SoilMatcher - {len(self._soils)} soils, tolerance {self._tolerance}."
@@ -0,0 +1,138 @@
+"""Harvest yield estimates and the parallel yield forecast."""
+
+
+DEFAULT_YIELDS = {
+    "tomato": 8.0,
+    "pepper": 3.0,
+    "cucumber": 5.0,
+    "zucchini": 6.0,
+    "eggplant": 4.0,
+    "lettuce": 1.0,
+    "kale": 1.5,
+    "bush bean": 2.0
+}
+
+
+def estimate_harvest_yield(plant_type, plant_count, avg_per_plant=None):
+    """Estimate total harvest yield using simple defaults."""
+    if plant_count < 0:
+        raise ValueError("Plant count must be 0 or more.")
+
+    plant_type = plant_type.lower()
+
+    if avg_per_plant is not None:
+        per_plant = avg_per_plant
+    elif plant_type in DEFAULT_YIELDS:
+        per_plant = DEFAULT_YIELDS[plant_type]
+    else:
+        raise ValueError("Unknown plant type. Please give avg_per_plant value.")
+
+    total = per_plant * plant_count
+
+    return {
+        "plant": plant_type,
+        "plants": plant_count,
+        "each": per_plant,
+        "total": round(total, 2)
+    }
+
+
+FORECAST_CHUNK_SIZE = 256
+
+_forecast_yields = DEFAULT_YIELDS
+
+
+def _init_forecast_worker(yields):
+    """Give a pool worker its copy of the yield table once, instead of with every chunk."""
+    global _forecast_yields
+    _forecast_yields = yields
+
+
+def _forecast_chunk(chunk, yields=None):
+    """
+    Total the yields of a chunk of gardens.
+
+    Parameters:
+        chunk (list): (garden name, [(plant_type, count, avg_per_plant), ...]) pairs
+        yields (dict): Pounds per plant by lowercase plant type; the worker's table when None
+
+    Returns:
+        tuple: ([(garden name, total_lb), ...], {plant type: total_lb})
+    """
+    if yields is None:
+        yields = _forecast_yields
+    lowered = {}
+    garden_totals = []
+    by_plant = {}
+    for name, plants in chunk:
+        total = 0
+        for plant_type, count, avg_per_plant in plants:
+            if count < 0:
+                raise ValueError("Plant count must be 0 or more.")
+            key = lowered.get(plant_type)
+            if key is None:
+                key = lowered[plant_type] = plant_type.lower()
+            if avg_per_plant is not None:
+                per_plant = avg_per_plant
+            elif key in yields:
+                per_plant = yields[key]
+            else:
+                raise ValueError("Unknown plant type. Please give avg_per_plant value.")
+            amount = round(per_plant * count, 2)
+            total += amount
+            by_plant[key] = by_plant.get(key, 0) + amount
+        garden_totals.append((name, total))
+    return garden_totals, by_plant
+
+
+def forecast_yields(gardens, workers=None, chunk_size=FORECAST_CHUNK_SIZE, yields=None):
+    """
+    Forecast the harvest of many gardens, spreading the work over a process pool.
+
+    Gardens are sent to the workers as plain tuples in chunks of chunk_size, and
+    the yield table is handed to each worker once when it starts. Each garden's
+    total matches Garden.total_yield.
+
+    Parameters:
+        gardens (iterable): Garden objects
+        workers (int): Worker processes; 1 runs in this process, None uses every CPU
+        chunk_size (int): Gardens per unit of work
+        yields (dict): Pounds per plant by plant type, DEFAULT_YIELDS when None
+
+    Returns:
+        dict: 'gardens' ([{'garden', 'total_lb'}] in input order), 'by_plant'
+            (total pounds per plant type), and 'total_lb'
+
+    Raises:
+        ValueError: If chunk_size or workers is not positive, or a plant has no known yield
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be a positive number.")
+    if workers is not None and workers <= 0:
+        raise ValueError("Workers must be a positive number.")
+    yields = DEFAULT_YIELDS if yields is None else {k.lower(): v for k, v in yields.items()}
+    rows = [(g.name(), [(p["plant_type"], p["count"], p["avg_per_plant"]) for p in g.plants()])
+            for g in gardens]
+    chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+
+    if workers == 1 or len(chunks) <= 1:
+        results = [_forecast_chunk(chunk, yields) for chunk in chunks]
+    else:
+        # Imported here: concurrent.futures roughly doubles the startup time of the yield code.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_forecast_worker,
+                                 initargs=(yields,)) as pool:
+            results = list(pool.map(_forecast_chunk, chunks))
+
+    garden_totals = []
+    by_plant = {}
+    for chunk_gardens, chunk_plants in results:
+        garden_totals.extend({"garden": name, "total_lb": total} for name, total in chunk_gardens)
+        for plant_type, amount in chunk_plants.items():
+            by_plant[plant_type] = by_plant.get(plant_type, 0) + amount
+    return {
+        "gardens": garden_totals,
+        "by_plant": by_plant,
+        "total_lb": sum(g["total_lb"] for g in garden_totals)
+    }
@@ -0,0 +1,46 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from project.cli import main
+
+
+class TestDuplicateContainerIds(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.input = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w", encoding="utf-8") as output:
+            output.write("id,length,width,depth,shape,site\n"
+                         "a,10,10,5,rectangle,north\n"
+                         "b,10,10,5,rectangle,north\n"
+                         "a,20,10,5,rectangle,south\n"
+                         "c,10,10,5,rectangle,east\n"
+                         "c,10,10,5,rectangle,west\n")
+        self.addCleanup(os.remove, self.input)
+
+    def run_command(self, *argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            main(list(argv) + [self.input, "--format", "jsonl", "--chunk-size", "2"])
+        return [json.loads(line) for line in stdout.getvalue().splitlines()], stderr.getvalue()
+
+    def test_compost_report_counts_each_id_once(self):
+        rows, messages = self.run_command("compost", "report", "--by", "site")
+        self.assertEqual({row['site']: row['containers'] for row in rows}, {'north': 2, 'east': 1})
+        self.assertEqual(sum(row['soil_volume_cu_in'] for row in rows), 1500.0)
+        self.assertIn("Container with ID a already exists.", messages)
+
+    def test_both_commands_reject_the_same_rows(self):
+        imported, import_messages = self.run_command("containers", "import")
+        _, compost_messages = self.run_command("compost", "report", "--by", "")
+        self.assertEqual([row['id'] for row in imported], ["a", "b", "c"])
+        rejected = [line for line in import_messages.splitlines() if line.startswith("  row")]
+        self.assertEqual(rejected, [line for line in compost_messages.splitlines() if line.startswith("  row")])
+        self.assertEqual(len(rejected), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+from datetime import date
+import unittest
+
+from project import ContainerManagement, Garden, GardenDatabase, PlantingSchedule
+
+
+class TestGardenDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.db = GardenDatabase()
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_container_store(self):
+        manager = ContainerManagement(store=self.db.container_store("north"))
+        manager.add_container("bed-1", 48, 24, 12)
+        manager.add_container("pot-1", 12, None, 10, shape="circle")
+        self.assertEqual(manager.get_container("bed-1")["volume_cu_in"], 13824)
+        self.assertEqual([c["id"] for c in manager.list_containers(min_depth=11)], ["bed-1"])
+        with self.assertRaises(ValueError):
+            manager.add_container("bed-1", 10, 10, 10)
+        other = ContainerManagement(store=self.db.container_store("south"))
+        other.add_container("bed-1", 10, 10, 10)
+        manager.remove_container("pot-1")
+        self.assertEqual((len(manager), len(other)), (1, 1))
+
+    def test_planting_store(self):
+        schedule = PlantingSchedule("Plot 7", store=self.db.planting_store("plot-7"))
+        rejected = schedule.add_planting_records([("Tomato", "05/01/2025", "bed-1"), (None, "04/01/2025", "bed-2"),
+                                                  ("basil", "06/15/2025", None)])
+        self.assertEqual(rejected, [])
+        self.assertEqual([r["plant"] for r in schedule.find_plantings(plant_name="tomato")], ["Tomato"])
+        self.assertEqual([r["plant"] for r in schedule.find_plantings(container_id="bed-2")], [None])
+        between = schedule.plantings_between("04/01/2025", "05/31/2025")
+        self.assertEqual([r["date"] for r in between], [date(2025, 4, 1), date(2025, 5, 1)])
+        self.assertEqual(len(schedule.get_planting_history()), 3)
+
+    def test_int_ids_match_in_memory_stores(self):
+        schedules = [PlantingSchedule("Plot 7"), PlantingSchedule("Plot 7", store=self.db.planting_store("plot-7"))]
+        managers = [ContainerManagement(), ContainerManagement(store=self.db.container_store())]
+        for schedule, manager in zip(schedules, managers):
+            schedule.add_planting_records([(5, "05/01/2025", 7), ("5", "05/02/2025", "7"), ("kale", "05/03/2025", 7)])
+            manager.add_container(7, 10, 10, 10)
+            manager.add_container("7", 12, 12, 12)
+        memory, stored = schedules
+        self.assertEqual(list(stored.get_planting_history()), list(memory.get_planting_history()))
+        self.assertEqual(stored.get_planting_history()[0], {'plant': 5, 'date': date(2025, 5, 1), 'container': 7})
+        for filters in ({'container_id': 7}, {'container_id': "7"}, {'plant_name': 5}, {'plant_name': "5"}):
+            self.assertEqual(list(stored.find_plantings(**filters)), list(memory.find_plantings(**filters)))
+        self.assertEqual(managers[1].list_containers(), managers[0].list_containers())
+        self.assertEqual(managers[1].get_container(7)["id"], 7)
+        self.assertEqual(managers[1].get_container("7")["volume_cu_in"], 1728)
+
+    def test_garden_round_trip(self):
+        garden = Garden("Backyard", "04/15/2025", "10/15/2025")
+        garden.add_plant("Tomato", 2)
+        garden.add_plant("kale", 1.5, "hardy", 1.0)
+        self.db.save_garden(garden)
+        loaded = self.db.load_garden("Backyard")
+        self.assertEqual(loaded.plants(), garden.plants())
+        self.assertEqual(loaded.last_frost(), garden.last_frost())
+        self.assertEqual(self.db.find_plants("TOMATO"), [("Backyard", "Tomato", 2, "tender")])
+        with self.assertRaises(ValueError):
+            self.db.load_garden("Front")
+
+
+if __name__ == "__main__":
+    unittest.main()
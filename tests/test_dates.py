@@ -0,0 +1,110 @@
+from datetime import date, datetime
+import unittest
+
+from project import (FrostCalendar, PlantingSchedule, SeasonCalendar, calculate_season_change, clear_date_cache, date_cache_info,
+                     format_planting_date, parse_dates, to_date)
+
+
+class TestDateParsing(unittest.TestCase):
+
+    def test_parse_dates_matches_to_date(self):
+        values = ["04/10/2025", "4/1/2025", "04/10/2025", date(2025, 5, 1)]
+        self.assertEqual(parse_dates(values), [to_date(value) for value in values])
+        self.assertEqual(parse_dates(["2025-04-10"], layout='YYYY-MM-DD'), [date(2025, 4, 10)])
+
+    def test_parse_dates_errors(self):
+        with self.assertRaises(ValueError):
+            parse_dates(["02/30/2025"])
+        with self.assertRaises(TypeError):
+            parse_dates([20250410])
+        self.assertEqual(parse_dates(["2025-04-10", None, "04/10/2025"], errors='coerce'),
+                         [None, None, date(2025, 4, 10)])
+        with self.assertRaises(ValueError):
+            parse_dates([], layout='DD.MM.YYYY')
+
+    def test_format_planting_date(self):
+        self.assertEqual(format_planting_date("3/1/2025"), "2025-03-01")
+        self.assertEqual(format_planting_date("03-01-2025"), "2025-03-01")
+        with self.assertRaises(ValueError):
+            format_planting_date("13/01/2025")
+        with self.assertRaises(TypeError):
+            format_planting_date(date(2025, 3, 1))
+
+    def test_cache_is_shared_and_clearable(self):
+        clear_date_cache()
+        to_date("06/01/2025")
+        to_date("06/01/2025")
+        info = date_cache_info()['MM/DD/YYYY']
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        clear_date_cache()
+        self.assertEqual(date_cache_info()['MM/DD/YYYY'].currsize, 0)
+
+
+class TestSeasonCalendar(unittest.TestCase):
+
+    def test_lookup_at_boundaries(self):
+        calendar = SeasonCalendar()
+        self.assertEqual(calendar.lookup(date(2025, 3, 19))[:2], ('Winter', 'Spring'))
+        self.assertEqual(calendar.lookup(date(2025, 3, 20))[:2], ('Spring', 'Summer'))
+        self.assertEqual(calendar.lookup(date(2025, 12, 21))[:2], ('Winter', 'Spring'))
+        current, _, start = calendar.lookup(date(2025, 12, 31))
+        self.assertEqual((current, calendar.start_string(start)), ('Winter', '2026-03-20'))
+
+    def test_label_seasons_matches_lookup(self):
+        calendar = SeasonCalendar()
+        days = [date(2024, 12, 31), date(2025, 6, 21), date(2025, 9, 21), date(2025, 9, 22)]
+        self.assertEqual(list(calendar.label_seasons(days)), [calendar.season_of(day) for day in days])
+        self.assertEqual(len(calendar.label_seasons([])), 0)
+
+    def test_season_helpers(self):
+        info = PlantingSchedule().get_season_info("06/20/2025")
+        self.assertEqual((info['current_season'], info['next_season']), ('Spring', 'Summer'))
+        self.assertEqual((info['season_start_date'], info['days_until_next_season']), ('2025-06-21', 1))
+        change = calculate_season_change(datetime(2025, 6, 20, 12, 0))
+        self.assertEqual((change['next_season'], change['days_remaining']), ('Summer', 0))
+        with self.assertRaises(TypeError):
+            calculate_season_change(date(2025, 6, 20))
+
+
+class TestFrostCalendar(unittest.TestCase):
+
+    def setUp(self):
+        self.calendar = FrostCalendar()
+        self.calendar.add_zone("7a", "04/15", "10/15")
+        self.calendar.add_zone("5b", date(2020, 5, 10), "09/30")
+        self.calendar.add_site("plot-1", "7a")
+        self.calendar.add_site("plot-2", "5b")
+
+    def test_single_lookups(self):
+        self.assertEqual(self.calendar.frost_dates("plot-2", 2025), (date(2025, 5, 10), date(2025, 9, 30)))
+        self.assertEqual(self.calendar.days_until_frost("plot-1", "10/05/2025"), 10)
+        self.assertEqual(self.calendar.days_until_frost("plot-1", "11/05/2025"), 0)
+        self.assertTrue(self.calendar.is_safe_to_plant("plot-1", "04/01/2025", "hardy"))
+        self.assertFalse(self.calendar.is_safe_to_plant("plot-2", "05/01/2025"))
+        garden = self.calendar.garden("plot-1", "Backyard", 2026)
+        self.assertEqual(garden.last_frost(), date(2026, 4, 15))
+        self.assertEqual(len(self.calendar), 2)
+
+    def test_batch_matches_single_lookups(self):
+        sites = ["plot-1", "plot-2", "plot-1", "plot-2"]
+        dates = ["04/20/2025", "04/20/2025", "10/01/2026", "09/01/2024"]
+        safe = self.calendar.is_safe_to_plant_batch(sites, dates)
+        days = self.calendar.days_until_frost_batch(sites, dates)
+        self.assertEqual(safe.tolist(), [self.calendar.is_safe_to_plant(s, d) for s, d in zip(sites, dates)])
+        self.assertEqual(days.tolist(), [self.calendar.days_until_frost(s, d) for s, d in zip(sites, dates)])
+
+    def test_unknown_zone_and_site(self):
+        with self.assertRaises(ValueError):
+            self.calendar.add_site("plot-3", "9z")
+        with self.assertRaises(ValueError):
+            self.calendar.zone_of("plot-3")
+        with self.assertRaises(ValueError):
+            self.calendar.is_safe_to_plant_batch(["plot-3"], ["04/20/2025"])
+        with self.assertRaises(ValueError):
+            self.calendar.days_until_frost_batch(["plot-1"], [])
+        with self.assertRaises(ValueError):
+            self.calendar.add_zone("bad", "13/40", "10/15")
+
+
+if __name__ == "__main__":
+    unittest.main()
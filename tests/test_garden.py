@@ -0,0 +1,160 @@
+from datetime import date
+import threading
+import unittest
+
+from project import ConcurrentPlantingSchedule, Garden, PlantingIndex, PlantingSchedule, is_safe_to_plant_batch
+
+
+class TestPlantingRecords(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = PlantingSchedule("Backyard")
+        self.schedule.add_planting_record("Tomato", "04/10/2025", "bed-1")
+        self.schedule.add_planting_record("Basil", "04/12/2025", "bed-1")
+        self.schedule.add_planting_record("Tomato", "07/01/2025", "bed-2")
+
+    def test_adding_while_iterating_history_terminates(self):
+        seen = []
+        for record in self.schedule.get_planting_history():
+            seen.append(record['plant'])
+            self.schedule.add_planting_record("Kale", "09/30/2025", "bed-3")
+        self.assertEqual(seen, ["Tomato", "Basil", "Tomato"])
+        self.assertEqual(len(self.schedule.get_planting_history()), 6)
+
+    def test_every_kind_of_result_is_a_snapshot(self):
+        results = [
+            self.schedule.get_planting_history(),
+            self.schedule.find_plantings(season='Spring'),
+            self.schedule.find_plantings(plant_name='tomato'),
+            self.schedule.find_plantings(season='Spring', year=2025, container_id='bed-1'),
+            self.schedule.find_plantings(season='Spring', plant_name='tomato'),
+        ]
+        before = [list(result) for result in results]
+        self.schedule.add_planting_record("Tomato", "04/20/2025", "bed-1")
+        for result, records in zip(results, before):
+            self.assertEqual(len(result), len(records))
+            self.assertEqual(list(result), records)
+            self.assertEqual(result[-1], records[-1])
+            self.assertEqual(result[:], records)
+
+    def test_index_out_of_range(self):
+        result = self.schedule.find_plantings(plant_name='basil')
+        self.schedule.add_planting_record("Basil", "05/01/2025", "bed-2")
+        with self.assertRaises(IndexError):
+            result[1]
+
+    def test_non_string_plant_name_is_kept(self):
+        self.schedule.add_planting_record(None, "05/02/2025", "bed-1")
+        self.assertEqual(len(self.schedule.get_planting_history()), 4)
+        self.assertEqual(len(self.schedule.find_plantings(season='Spring', plant_name='basil')), 1)
+
+    def test_bad_rows_are_rejected_without_being_stored(self):
+        rejected = self.schedule.add_planting_records([
+            ("Kale", "05/01/2025", ["bed-1"]),
+            (["Kale"], "05/01/2025", "bed-1"),
+            ("Kale", "2025-05-01", "bed-1"),
+            ("Kale", "05/01/2025", "bed-1"),
+        ])
+        self.assertEqual([position for position, _ in rejected], [0, 1, 2])
+        self.assertEqual(len(self.schedule.get_planting_history()), 4)
+        self.assertEqual(len(self.schedule.find_plantings(season='Spring')), 3)
+        self.assertIn("4 plantings", str(self.schedule))
+
+    def test_index_add_stores_nothing_on_bad_key(self):
+        index = PlantingIndex()
+        record = {'plant': "Kale", 'date': self.schedule.parse_date("05/01/2025"), 'container': ["bed-1"]}
+        with self.assertRaises(TypeError):
+            index.add(record)
+        self.assertEqual(len(index), 0)
+        self.assertEqual(len(index.find(season='Spring')), 0)
+
+
+class TestConcurrentPlantingSchedule(unittest.TestCase):
+
+    def test_readers_see_stable_results_while_writers_add(self):
+        schedule = ConcurrentPlantingSchedule("Plot 7")
+        errors = []
+
+        def write(worker):
+            for i in range(500):
+                schedule.add_planting_record("Tomato" if i % 2 else "Basil", "04/10/2025", f"bed-{worker}")
+
+        def read():
+            for _ in range(200):
+                for result in (schedule.get_planting_history(), schedule.find_plantings(plant_name='tomato'),
+                               schedule.find_plantings(season='Spring', plant_name='basil')):
+                    size = len(result)
+                    if len(list(result)) != size or any(record is None for record in result):
+                        errors.append(size)
+
+        threads = [threading.Thread(target=write, args=(worker,)) for worker in range(3)]
+        threads += [threading.Thread(target=read) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(schedule.get_planting_history()), 1500)
+        self.assertEqual(len(schedule.find_plantings(plant_name='TOMATO')), 750)
+
+
+class TestGardenYield(unittest.TestCase):
+
+    def setUp(self):
+        self.garden = Garden("Backyard", "04/15/2025", "10/15/2025")
+        self.garden.add_plant("tomato", 2)
+        self.garden.add_plant("basil", 3, avg_per_plant=0.5)
+
+    def test_details_follow_every_change(self):
+        first = self.garden.total_yield()
+        self.assertEqual([y["plant"] for y in first["by_plant"]], ["tomato", "basil"])
+        self.garden.add_plant("kale", 4, avg_per_plant=1)
+        self.assertEqual(len(self.garden.total_yield()["by_plant"]), 3)
+        self.garden.update_plant("basil", count=6)
+        self.assertEqual(self.garden.total_yield()["by_plant"][1]["total"], 3.0)
+        self.garden.remove_plant("tomato")
+        result = self.garden.total_yield()
+        self.assertEqual([y["plant"] for y in result["by_plant"]], ["basil", "kale"])
+        self.assertEqual(result["total_lb"], 7.0)
+        self.assertEqual(len(first["by_plant"]), 2)
+
+    def test_returned_list_is_a_new_list(self):
+        self.garden.total_yield()["by_plant"].clear()
+        self.assertEqual(len(self.garden.total_yield()["by_plant"]), 2)
+        self.garden.total_yield()["by_plant"][0]["total"] = 1000
+        self.assertEqual(self.garden.total_yield()["by_plant"][0]["total"], 16.0)
+        self.assertEqual(self.garden.total_yield()["total_lb"], 17.5)
+        self.assertNotIn("by_plant", self.garden.total_yield(include_details=False))
+
+
+class TestSafeDays(unittest.TestCase):
+
+    def setUp(self):
+        self.garden = Garden("Backyard", "04/15/2025", "10/15/2025")
+        self.garden.add_plant("tomato", 2, "tender")
+        self.garden.add_plant("kale", 4, "hardy")
+
+    def test_safe_days_match_first_safe_dates(self):
+        rows = self.garden.safe_days("03/30/2025", 20)
+        self.assertEqual([plant for plant, _ in rows], ["tomato", "kale"])
+        self.assertEqual(int(rows[0][1].argmax()), 16)
+        self.assertEqual(int(rows[1][1].argmax()), 2)
+        self.assertEqual(self.garden.first_safe_dates("03/30/2025"),
+                         [("tomato", date(2025, 4, 15)), ("kale", date(2025, 4, 1))])
+        self.assertEqual(self.garden.first_safe_dates("05/01/2025")[1], ("kale", date(2025, 5, 1)))
+        packed = self.garden.safe_days("03/30/2025", 20, packed=True)
+        self.assertEqual(len(packed[0][1]), 3)
+        with self.assertRaises(ValueError):
+            self.garden.safe_days("03/30/2025", -1)
+
+    def test_batch_matches_single_checks(self):
+        dates = ["04/01/2025", "04/08/2025", "04/15/2025"]
+        self.assertEqual(is_safe_to_plant_batch(dates, "04/15/2025", "half-hardy").tolist(), [False, True, True])
+        matrix = is_safe_to_plant_batch(dates, "04/15/2025", ["tender", "hardy"], extra_days=1)
+        self.assertEqual(matrix.tolist(), [[False, False, False], [False, True, True]])
+        with self.assertRaises(ValueError):
+            is_safe_to_plant_batch(dates, "04/15/2025", ["frosty"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import math
+import unittest
+
+from project import (aggregate_compost, calculate_area, calculate_area_batch, calculate_plant_space,
+                     calculate_plant_space_batch, calculate_soil_volume, calculate_soil_volume_batch, convert_batch,
+                     measurement_conversion, volume_conversion)
+
+
+class TestBatchGeometry(unittest.TestCase):
+
+    rows = [(10, 12, 6, 'rectangle'), (24, None, 8, 'circle'), (36, 18, 12, 'rectangle')]
+
+    def columns(self):
+        lengths, widths, depths, shapes = zip(*self.rows)
+        return list(lengths), [math.nan if w is None else w for w in widths], list(depths), list(shapes)
+
+    def test_batch_matches_scalar_functions(self):
+        lengths, widths, depths, shapes = self.columns()
+        areas = calculate_area_batch(lengths, widths, shapes)
+        volumes = calculate_soil_volume_batch(lengths, widths, depths, shapes)
+        spacing = calculate_plant_space_batch(lengths, widths, [1, 3, 4], shapes)
+        for i, (length, width, depth, shape) in enumerate(self.rows):
+            self.assertAlmostEqual(areas[i], calculate_area(length, width, shape))
+            self.assertAlmostEqual(volumes[i], calculate_soil_volume(length, width if width else 1, depth, shape))
+            self.assertAlmostEqual(spacing[i], calculate_plant_space(length, width, [1, 3, 4][i], shape))
+
+    def test_batch_units_convert_to_inches(self):
+        self.assertAlmostEqual(calculate_area_batch([1], [2], unit='ft')[0], 12 * 24)
+
+    def test_batch_errors(self):
+        with self.assertRaises(ValueError):
+            calculate_area_batch([10], [math.nan], 'rectangle')
+        with self.assertRaises(ValueError):
+            calculate_area_batch([10], [10], 'triangle')
+        with self.assertRaises(ValueError):
+            calculate_plant_space_batch([10], [10], [0])
+
+
+class TestAggregateCompost(unittest.TestCase):
+
+    def test_mixed_type_groups(self):
+        totals = aggregate_compost([100, 200, 300, 400], ratios=(0.25, 0.5), groups=['north', None, 3, 'north'])
+        self.assertEqual(list(totals), ['north', None, 3])
+        self.assertEqual(totals['north']['containers'], 2)
+        self.assertEqual(totals['north']['soil_volume_cu_in'], 500.0)
+        self.assertEqual(totals[None]['ratios'][0.5]['compost_ratio_needed'], 100.0)
+        self.assertEqual(totals[3]['ratios'][0.25]['soil_ratio_needed'], 225.0)
+
+    def test_groups_must_match_volumes(self):
+        with self.assertRaises(ValueError):
+            aggregate_compost([100, 200], groups=['north'])
+
+    def test_single_group_without_labels(self):
+        totals = aggregate_compost([100, 300])
+        self.assertEqual(list(totals), [None])
+        self.assertEqual(totals[None]['ratios'][0.25]['compost_ratio_needed'], 100.0)
+
+
+class TestUnitConversion(unittest.TestCase):
+
+    def test_exact_conversions(self):
+        self.assertEqual(measurement_conversion(12, 'in', 'ft'), 1.0)
+        self.assertEqual(measurement_conversion(3, 'ft', 'cm'), 91.44)
+        self.assertEqual(measurement_conversion(2.54, 'cm', 'in'), 1.0)
+        self.assertEqual(volume_conversion(1728, 'cu_in', 'cu_ft'), 1.0)
+        self.assertEqual(volume_conversion(27, 'cu_ft', 'cu_yd'), 1.0)
+        self.assertEqual(volume_conversion(2, 'cu_ft', 'bag'), 2.0)
+
+    def test_batch_matches_single_conversions(self):
+        values = [1, 12, 30.5, 100]
+        for from_unit, to_unit, single in (('in', 'cm', measurement_conversion), ('cu_in', 'liter', volume_conversion),
+                                           ('cu_yd', 'bag', volume_conversion)):
+            self.assertEqual(convert_batch(values, from_unit, to_unit).tolist(),
+                             [single(v, from_unit, to_unit) for v in values])
+
+    def test_unknown_units(self):
+        with self.assertRaises(ValueError):
+            measurement_conversion(1, 'in', 'm')
+        with self.assertRaises(ValueError):
+            volume_conversion(1, 'gallon', 'liter')
+        with self.assertRaises(ValueError):
+            convert_batch([1], 'in', 'liter')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+import unittest
+
+from project import ContainerManagement, Garden, PlantingSchedule, import_containers, import_plantings, import_plants
+
+
+class TestImportRows(unittest.TestCase):
+
+    def write_lines(self, rows):
+        handle, path = tempfile.mkstemp(suffix=".jsonl")
+        with os.fdopen(handle, "w", encoding="utf-8") as output:
+            for row in rows:
+                output.write(json.dumps(row) + "\n")
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_wrongly_typed_planting_fields_are_rejected(self):
+        path = self.write_lines([
+            {"plant": "Tomato", "date": "04/10/2025", "container": "bed-1"},
+            {"plant": 5, "date": "04/10/2025"},
+            {"plant": "Basil", "date": 20250410},
+            {"plant": "Basil", "date": "04/12/2025", "container": ["bed-1"]},
+            {"plant": "Basil", "date": "04/12/2025", "container": 7},
+        ])
+        schedule = PlantingSchedule("Backyard")
+        report = import_plantings(path, schedule, chunk_size=2)
+        self.assertEqual(report.accepted, 2)
+        self.assertEqual([row for row, _ in report.rejected], [2, 3, 4])
+        self.assertEqual(len(schedule.find_plantings(container_id="7")), 1)
+
+    def test_wrongly_typed_plant_fields_are_rejected(self):
+        path = self.write_lines([
+            {"plant_type": "tomato", "count": 2},
+            {"plant_type": "tomato", "count": 2, "tolerance": 3},
+            {"plant_type": ["tomato"], "count": 2},
+        ])
+        garden = Garden("Backyard", "04/15/2025", "10/15/2025")
+        report = import_plants(path, garden)
+        self.assertEqual(report.accepted, 1)
+        self.assertEqual(report.rejected_count, 2)
+
+    def test_plant_numbers_are_not_truncated(self):
+        path = self.write_lines([
+            {"plant_type": "tomato", "count": 2.7},
+            {"plant_type": "tomato", "count": True},
+            {"plant_type": "tomato", "count": 3.0},
+            {"plant_type": "tomato", "count": "2.7"},
+            {"plant_type": "basil", "count": 2, "avg_per_plant": False},
+            {"plant_type": "basil", "count": 2, "ph": True},
+        ])
+        garden = Garden("Backyard", "04/15/2025", "10/15/2025")
+        report = import_plants(path, garden)
+        self.assertEqual(report.accepted, 1)
+        self.assertEqual(garden.plants()[0]["count"], 3)
+        self.assertEqual([row for row, _ in report.rejected], [1, 2, 4, 5, 6])
+
+        handle, csv_path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w", encoding="utf-8") as output:
+            output.write("plant_type,count\ntomato,2.7\n")
+        self.addCleanup(os.remove, csv_path)
+        csv_report = import_plants(csv_path, Garden("Front", "04/15/2025", "10/15/2025"))
+        self.assertEqual(csv_report.rejected[0][1], report.rejected[0][1])
+        self.assertEqual(report.rejected[1][1], report.rejected[0][1])
+
+    def test_wrongly_typed_container_fields_are_rejected(self):
+        path = self.write_lines([
+            {"id": "a", "length": 10, "width": 10, "depth": 5},
+            {"id": "b", "length": 10, "width": 10, "depth": 5, "shape": 1},
+            {"id": {"x": 1}, "length": 10, "width": 10, "depth": 5},
+            {"id": "c", "length": True, "width": 10, "depth": 5},
+            {"id": "d", "length": 10, "width": 10, "depth": [5]},
+        ])
+        manager = ContainerManagement()
+        report = import_containers(path, manager)
+        self.assertEqual(report.accepted, 1)
+        self.assertEqual(report.rejected_count, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+import math
+import random
+import threading
+import unittest
+
+from project import (CircularContainer, ColumnarContainerStore, CompostPlanner, ConcurrentContainerManagement,
+                     ContainerManagement, PlantLayout, RectangularContainer, SquareContainer, aggregate_compost,
+                     container_cache_info, reset_container_cache_info)
+
+
+class TestContainerCache(unittest.TestCase):
+
+    def setUp(self):
+        reset_container_cache_info()
+
+    def test_values_are_computed_once(self):
+        box = RectangularContainer("box", 10, 4, 6)
+        self.assertEqual(box.volume, 240)
+        self.assertEqual(box.area, 40)
+        self.assertEqual(box.volume, 240)
+        info = container_cache_info()
+        self.assertEqual(info, {'hits': 2, 'misses': 2})
+        self.assertEqual(box.compost_split(), box.compost_split())
+
+    def test_resize_clears_what_changed(self):
+        box = RectangularContainer("box", 10, 4, 6)
+        spacing = box.plant_spacing(4)
+        compost = box.compost_split()
+        box.set_depth(12)
+        self.assertEqual(box.volume, 480)
+        self.assertIs(box.plant_spacing(4), spacing)
+        self.assertNotEqual(box.compost_split(), compost)
+        box.resize(length=20)
+        self.assertEqual((box.area, box.volume), (80, 960))
+        self.assertIsNot(box.plant_spacing(4), spacing)
+        pot = CircularContainer("pot", 10, 5)
+        pot.resize(diameter=20)
+        self.assertAlmostEqual(pot.area, 100 * 3.141592653589793)
+        with self.assertRaises(ValueError):
+            box.set_depth(0)
+        self.assertEqual(box.volume, 960)
+
+    def test_square_container(self):
+        square = SquareContainer("sq", 10, 4)
+        self.assertEqual((square.area, square.volume), (100, 400))
+        self.assertEqual(square.plant_spacing(4), RectangularContainer("box", 10, 10, 4).plant_spacing(4))
+        square.resize(depth=6)
+        self.assertEqual((square.area, square.volume), (100, 600))
+        square.resize(side_length=20)
+        self.assertEqual((square.area, square.volume), (400, 2400))
+        self.assertTrue(str(square).startswith("Square Container ID:sq"))
+        with self.assertRaises(ValueError):
+            square.resize(side_length=0)
+
+
+class TestColumnarContainerStore(unittest.TestCase):
+
+    def test_remove_keeps_insertion_order(self):
+        store = ColumnarContainerStore()
+        manager = ContainerManagement()
+        for i in range(10):
+            store.add_container(f"c{i}", 10 + i, 10, 5)
+            manager.add_container(f"c{i}", 10 + i, 10, 5)
+        for container_id in ("c0", "c4", "c9", "c5", "c6", "c2"):
+            store.remove_container(container_id)
+            manager.remove_container(container_id)
+            self.assertEqual([c['id'] for c in store.list_containers()],
+                             [c['id'] for c in manager.list_containers()])
+        self.assertEqual(len(store), 4)
+        self.assertEqual(list(store.column('length')), [11.0, 13.0, 17.0, 18.0])
+        store.add_container("c0", 30, 10, 5)
+        self.assertEqual([c['id'] for c in store.list_containers()], ["c1", "c3", "c7", "c8", "c0"])
+        self.assertEqual(store.get_container("c8")['length'], 18.0)
+
+    def test_removed_container_is_gone(self):
+        store = ColumnarContainerStore()
+        store.add_container("a", 10, 10, 5)
+        store.add_container("b", 12, None, 5, shape='circle')
+        store.remove_container("a")
+        with self.assertRaises(ValueError):
+            store.get_container("a")
+        self.assertEqual([c['id'] for c in store.list_containers(shape='circle')], ["b"])
+
+    def test_column_view_survives_mutation(self):
+        store = ColumnarContainerStore()
+        store.add_container("a", 10, 10, 5)
+        store.add_container("b", 20, 10, 5)
+        volumes = store.column('volume_cu_in')
+        store.add_container("c", 30, 10, 5)
+        self.assertEqual(list(volumes), [500.0, 1000.0])
+        lengths = store.column('length')
+        store.remove_container("a")
+        store.remove_container("b")
+        self.assertEqual(list(lengths), [10.0, 20.0, 30.0])
+        self.assertEqual(list(store.column('length')), [30.0])
+        store.add_container("d", 40, 10, 5)
+        self.assertEqual(list(store.column('length')), [30.0, 40.0])
+
+
+class TestContainerManagementIndexes(unittest.TestCase):
+
+    def test_range_queries_follow_adds_and_removes(self):
+        manager = ContainerManagement()
+        for i, depth in enumerate((6, 12, 12, 8, 12, 18)):
+            manager.add_container(f"c{i}", 10, 10, depth)
+        self.assertEqual([c['id'] for c in manager.list_containers(min_depth=12)], ["c1", "c2", "c4", "c5"])
+        manager.remove_container("c2")
+        manager.add_container("c6", 10, 10, 12)
+        manager.add_container("c7", 20, 10, 12)
+        manager.remove_container("c4")
+        self.assertEqual([c['id'] for c in manager.list_containers(min_depth=10, max_depth=12)], ["c1", "c6", "c7"])
+        self.assertEqual([c['id'] for c in manager.list_containers(min_volume=2400)], ["c7"])
+        self.assertEqual([c['id'] for c in manager.list_containers(max_depth=8)], ["c0", "c3"])
+        manager.add_containers([("c8", 10, 10, 7), ("c9", 10, 10, 30)])
+        self.assertEqual([c['id'] for c in manager.list_containers(min_depth=7, max_depth=8)], ["c3", "c8"])
+
+
+class TestConcurrentContainerManagement(unittest.TestCase):
+
+    def test_threads_add_each_id_once(self):
+        manager = ConcurrentContainerManagement(stripes=4)
+        rejected = []
+
+        def writer():
+            rejected.append(manager.add_containers([(f"bed-{i}", 10, 10, i % 5 + 2) for i in range(200)]))
+
+        threads = [threading.Thread(target=writer) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(manager), 200)
+        self.assertEqual(sum(len(r) for r in rejected), 600)
+        self.assertEqual(len(manager.list_containers(min_depth=6)), 40)
+        manager.remove_container("bed-4")
+        with self.assertRaises(ValueError):
+            manager.get_container("bed-4")
+        self.assertEqual([c["id"] for c in manager.list_containers(max_depth=2)][:2], ["bed-0", "bed-5"])
+
+
+class TestCompostPlanner(unittest.TestCase):
+
+    def assertTotalsEqual(self, planner_totals, aggregate_totals):
+        self.assertEqual(len(planner_totals), len(aggregate_totals))
+        for got, expected in zip(planner_totals, aggregate_totals):
+            self.assertEqual(got["containers"], expected["containers"])
+            self.assertAlmostEqual(got["soil_volume_cu_in"], expected["soil_volume_cu_in"])
+            for ratio, amounts in expected["ratios"].items():
+                for name, amount in amounts.items():
+                    self.assertAlmostEqual(got["ratios"][ratio][name], amount)
+
+    def test_attached_planner_matches_aggregate_compost(self):
+        manager = ContainerManagement()
+        planner = CompostPlanner()
+        manager.add_container("bed-1", 48, 24, 12)
+        manager.attach_planner(planner, site="north")
+        manager.add_container("pot-1", 12, None, 10, shape="circle")
+        manager.add_container("bed-2", 24, 24, 8)
+        manager.add_container("pot-2", 16, None, 12, shape="circle")
+        manager.remove_container("bed-1")
+        containers = manager.list_containers()
+        ratios = (0.25, 0.4)
+        by_shape = planner.totals(ratios, by=("shape",))
+        expected = aggregate_compost([c["volume_cu_in"] for c in containers], ratios,
+                                     [c["shape"] for c in containers])
+        self.assertEqual(set(by_shape), {("circle",), ("rectangle",)})
+        self.assertTotalsEqual([by_shape[("circle",)], by_shape[("rectangle",)]],
+                               [expected["circle"], expected["rectangle"]])
+        fleet = planner.totals(ratios, by=())
+        self.assertTotalsEqual([fleet[()]], [aggregate_compost([c["volume_cu_in"] for c in containers], ratios)[None]])
+        self.assertEqual(len(planner), 3)
+
+    def test_remove_keeps_small_volumes_exact(self):
+        planner = CompostPlanner()
+        for container_id, volume in (("a", 0.1), ("b", 0.2), ("c", 1e17)):
+            planner.add_container(container_id, volume)
+        planner.remove_container("c")
+        planner.remove_container("a")
+        group = planner.totals()[(None, "rectangle")]
+        self.assertEqual(group["soil_volume_cu_in"], 0.2)
+        self.assertEqual(group["ratios"][0.25]["compost_ratio_needed"], 0.05)
+        planner.add_container("d", 0.3)
+        self.assertAlmostEqual(planner.totals()[(None, "rectangle")]["soil_volume_cu_in"], 0.5)
+
+    def test_errors(self):
+        planner = CompostPlanner()
+        planner.add_container("a", 10)
+        with self.assertRaises(ValueError):
+            planner.add_container("a", 10)
+        with self.assertRaises(ValueError):
+            planner.add_container("b", 0)
+        with self.assertRaises(ValueError):
+            planner.remove_container("b")
+        with self.assertRaises(ValueError):
+            planner.totals(by=("depth",))
+        planner.remove_container("a")
+        self.assertEqual(planner.totals(), {})
+
+
+class CountingCells(dict):
+    """Grid cell dict that counts the cells PlantLayout looks up."""
+
+    lookups = 0
+
+    def get(self, key, default=None):
+        self.lookups += 1
+        return super().get(key, default)
+
+
+class TestPlantLayout(unittest.TestCase):
+
+    def test_far_queries_only_visit_occupied_range(self):
+        layout = PlantLayout()
+        layout.place("a", 1, 1)
+        layout.place("b", 30, 1)
+        cells = layout._cells = CountingCells(layout._cells)
+        self.assertEqual([plant_id for plant_id, _ in layout.nearest(60000, 0)], ["b"])
+        self.assertLessEqual(cells.lookups, 3)
+        cells.lookups = 0
+        self.assertEqual([plant_id for plant_id, _ in layout.within(0, 0, 20000)], ["a", "b"])
+        self.assertLessEqual(cells.lookups, 3)
+        cells.lookups = 0
+        self.assertEqual(layout.within(60000, 0, 10), [])
+        self.assertEqual(cells.lookups, 0)
+
+    def test_sparse_layout_matches_brute_force(self):
+        layout = PlantLayout(cell_size=2)
+        points = {"a": (0, 0), "b": (5000, 0), "c": (5003, 4), "d": (-2500, 7000)}
+        for plant_id, (x, y) in points.items():
+            layout.place(plant_id, x, y)
+        self.assertEqual([plant_id for plant_id, _ in layout.nearest(4990, 0, k=3)], ["b", "c", "a"])
+        self.assertEqual([plant_id for plant_id, _ in layout.within(5001, 1, 5)], ["b", "c"])
+        self.assertEqual([plant_id for plant_id, _ in layout.nearest(0, 0, k=2, exclude="a")], ["b", "c"])
+
+    def test_nearest_matches_brute_force_from_any_side(self):
+        rng = random.Random(7)
+        layout = PlantLayout(cell_size=5)
+        points = {i: (rng.uniform(0, 200), rng.uniform(0, 100)) for i in range(300)}
+        for plant_id, (x, y) in points.items():
+            layout.place(plant_id, x, y)
+        for x, y in ((100, 50), (-3000, -2000), (5000, 60), (150, 9000), (-40, 130), (210, -7)):
+            expected = sorted(points, key=lambda i: math.hypot(points[i][0] - x, points[i][1] - y))[:4]
+            self.assertEqual([plant_id for plant_id, _ in layout.nearest(x, y, k=4)], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
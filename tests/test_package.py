@@ -0,0 +1,34 @@
+import subprocess
+import sys
+import unittest
+
+import project
+
+
+def _loaded_after(code):
+    """Run code in a fresh interpreter and return which project modules and NumPy it imported."""
+    script = (f"import sys\n{code}\n"
+              "print(' '.join(sorted(m for m in sys.modules if m == 'numpy' or m.startswith('project'))))")
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    return set(output.split())
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_import_loads_no_submodules(self):
+        self.assertEqual(_loaded_after("import project"), {"project"})
+
+    def test_names_load_only_their_module(self):
+        loaded = _loaded_after("from project import to_date")
+        self.assertIn("project.dates", loaded)
+        self.assertFalse(loaded & {"numpy", "project.service", "project.database", "project.management"})
+
+    def test_every_public_name_resolves(self):
+        for name in project.__all__:
+            self.assertIs(getattr(project, name), getattr(project, name))
+        with self.assertRaises(AttributeError):
+            project.not_a_name
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from project import Profiler, days_until_frost, to_date
+from project import dates
+
+
+class TestProfiler(unittest.TestCase):
+
+    def test_private_aliases_are_measured_and_restored(self):
+        original = dates._to_date
+        with Profiler(targets=('to_date', 'days_until_frost')) as profiler:
+            self.assertIsNot(dates._to_date, original)
+            dates.days_until_frost("04/01/2025", "04/15/2025")
+        self.assertIs(dates._to_date, original)
+        self.assertIs(dates.to_date, original)
+        report = profiler.report()
+        self.assertEqual(report['days_until_frost']['calls'], 1)
+        self.assertEqual(report['to_date']['calls'], 2)
+
+    def test_disabled_profiler_records_nothing(self):
+        profiler = Profiler(targets=('to_date',))
+        to_date("04/01/2025")
+        days_until_frost("04/01/2025", "04/15/2025")
+        self.assertEqual(profiler.report(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
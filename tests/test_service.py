@@ -0,0 +1,130 @@
+import asyncio
+import json
+import unittest
+
+from project import ContainerManagement, Garden, GardenClient, GardenService
+
+
+class TestGardenService(unittest.TestCase):
+
+    def setUp(self):
+        containers = ContainerManagement()
+        containers.add_container("bed-1", 10, 10, 5)
+        garden = Garden("Backyard", "04/15/2025", "10/15/2025")
+        garden.add_plant("tomato", 2)
+        self.service = GardenService(containers, [garden], batch_wait=0)
+
+    def exchange(self, lines):
+        """Send raw request lines on one connection and return the decoded replies."""
+        async def run():
+            await self.service.start()
+            host, port = self.service.address[:2]
+            reader, writer = await asyncio.open_connection(host, port)
+            for line in lines:
+                writer.write(line.encode('utf-8') + b'\n')
+            await writer.drain()
+            replies = [json.loads(await asyncio.wait_for(reader.readline(), 5)) for _ in lines]
+            writer.close()
+            await self.service.close()
+            return replies
+        return asyncio.run(run())
+
+    def test_every_bad_request_gets_an_error_reply(self):
+        replies = self.exchange([
+            json.dumps({'id': 1, 'op': {'x': 1}}),
+            json.dumps({'id': 2, 'op': ['compost']}),
+            json.dumps({'id': 3, 'op': 'compost', 'container_id': {'x': 1}}),
+            json.dumps({'id': 4, 'op': 'yield'}),
+            json.dumps([1, 2]),
+            "not json",
+        ])
+        self.assertEqual(len(replies), 6)
+        self.assertTrue(all(not reply['ok'] for reply in replies))
+        self.assertEqual(sorted(reply['id'] for reply in replies if reply['id'] is not None), [1, 2, 3, 4])
+
+    def test_unexpected_errors_are_reported(self):
+        async def broken(endpoint, request):
+            raise RuntimeError("boom")
+        self.service._dispatch = broken
+        reply, = self.exchange([json.dumps({'id': 7, 'op': 'ping'})])
+        self.assertEqual(reply['id'], 7)
+        self.assertFalse(reply['ok'])
+        self.assertIn("boom", reply['error'])
+        self.assertEqual(self.service.metrics()['ping']['count'], 1)
+
+    def test_connection_stops_reading_at_its_limit(self):
+        service = GardenService(connection_limit=2)
+        started = []
+
+        async def run():
+            release = asyncio.Event()
+
+            async def slow(endpoint, request):
+                started.append(request['id'])
+                await release.wait()
+                return 'pong'
+            service._dispatch = slow
+            await service.start()
+            host, port = service.address[:2]
+            reader, writer = await asyncio.open_connection(host, port)
+            for request_id in range(5):
+                writer.write(json.dumps({'id': request_id, 'op': 'ping'}).encode('utf-8') + b'\n')
+            await writer.drain()
+            await asyncio.sleep(0.05)
+            waiting = list(started)
+            release.set()
+            replies = [json.loads(await asyncio.wait_for(reader.readline(), 5)) for _ in range(5)]
+            writer.close()
+            await service.close()
+            return waiting, replies
+
+        waiting, replies = asyncio.run(run())
+        self.assertEqual(waiting, [0, 1])
+        self.assertEqual(sorted(reply['id'] for reply in replies), [0, 1, 2, 3, 4])
+        self.assertTrue(all(reply['ok'] for reply in replies))
+
+    def test_client_gets_results(self):
+        async def run():
+            await self.service.start()
+            host, port = self.service.address[:2]
+            client = await GardenClient().connect(host, port)
+            replies = await asyncio.gather(client.request('compost', container_id='bed-1'),
+                                           client.request('compost', container_id='missing'),
+                                           client.request('ping'))
+            await client.close()
+            await self.service.close()
+            return replies
+        compost, missing, ping = asyncio.run(run())
+        self.assertTrue(compost['ok'])
+        self.assertFalse(missing['ok'])
+        self.assertEqual(ping['result'], 'pong')
+
+
+class TestGardenClient(unittest.TestCase):
+
+    def test_malformed_reply_fails_waiting_requests(self):
+        for reply in (b"not json\n", b"[1, 2]\n"):
+            async def run():
+                async def answer(reader, writer):
+                    await reader.readline()
+                    await reader.readline()
+                    writer.write(reply)
+                    await writer.drain()
+
+                server = await asyncio.start_server(answer, '127.0.0.1', 0)
+                client = await GardenClient().connect('127.0.0.1', server.sockets[0].getsockname()[1])
+                results = await asyncio.wait_for(asyncio.gather(client.request('ping'), client.request('ping'),
+                                                                return_exceptions=True), 5)
+                with self.assertRaises(ConnectionError):
+                    await client.request('ping')
+                await client.close()
+                server.close()
+                await server.wait_closed()
+                return results
+
+            results = asyncio.run(run())
+            self.assertTrue(all(isinstance(result, ConnectionError) for result in results), results)
+
+
+if __name__ == "__main__":
+    unittest.main()
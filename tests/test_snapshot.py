@@ -0,0 +1,62 @@
+import os
+import struct
+import tempfile
+import unittest
+
+from project import (SNAPSHOT_MAGIC, SNAPSHOT_VERSION, ContainerManagement, Garden, GardenSnapshot, PlantingSchedule,
+                     write_snapshot)
+
+
+class TestSnapshotRoundTrip(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".snap")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+        self.containers = ContainerManagement()
+        self.containers.add_container("bed-2", 10, 10, 5)
+        self.containers.add_container("bed-1", 24, None, 8, shape='circle')
+        self.garden = Garden("Backyard", "04/15/2025", "10/15/2025")
+        self.garden.add_plant("tomato", 2.5)
+        self.garden.add_plant("basil", 3, avg_per_plant=0.5)
+        self.schedule = PlantingSchedule("Plot 7")
+        self.schedule.add_planting_record("Tomato", "04/10/2025", "bed-1")
+        self.schedule.add_planting_record(None, "05/01/2025")
+
+    def test_round_trip_keeps_fractional_counts(self):
+        write_snapshot(self.path, self.containers, self.garden, self.schedule)
+        with GardenSnapshot(self.path) as snapshot:
+            self.assertEqual(snapshot.plants(), self.garden.plants())
+            self.assertIsInstance(snapshot.plants()[1]['count'], int)
+            self.assertEqual(snapshot.total_yield()['total_lb'], self.garden.total_yield()['total_lb'])
+            snapshot.total_yield()['by_plant'][0]['total'] = 1000
+            self.assertEqual(snapshot.total_yield()['by_plant'], self.garden.total_yield()['by_plant'])
+            self.assertEqual(snapshot.get_container("bed-1"), self.containers.get_container("bed-1"))
+            self.assertEqual([c['id'] for c in snapshot.list_containers()], ["bed-1", "bed-2"])
+            self.assertEqual(snapshot.plantings(), list(self.schedule.get_planting_history()))
+            self.assertEqual(snapshot.to_garden().plants(), self.garden.plants())
+
+    def test_other_versions_are_rejected(self):
+        write_snapshot(self.path, self.containers, self.garden)
+        with open(self.path, 'r+b') as handle:
+            handle.seek(len(SNAPSHOT_MAGIC))
+            handle.write(struct.pack('<H', SNAPSHOT_VERSION + 1))
+        with self.assertRaises(ValueError):
+            GardenSnapshot(self.path)
+
+    def test_non_text_ids_are_rejected_before_writing(self):
+        with open(self.path, 'wb') as handle:
+            handle.write(b'untouched')
+        self.containers.add_container(7, 10, 10, 5)
+        with self.assertRaises(ValueError):
+            write_snapshot(self.path, self.containers)
+        schedule = PlantingSchedule("Plot 7")
+        schedule.add_planting_record("Tomato", "04/10/2025", 12)
+        with self.assertRaises(ValueError):
+            write_snapshot(self.path, schedule=schedule)
+        with open(self.path, 'rb') as handle:
+            self.assertEqual(handle.read(), b'untouched')
+
+
+if __name__ == "__main__":
+    unittest.main()
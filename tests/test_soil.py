@@ -0,0 +1,101 @@
+import random
+import unittest
+
+from project import Plant, Soil, SoilMatcher, interned_name_counts
+
+
+class TestSoilMatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.matcher = SoilMatcher(tolerance=0.5)
+        self.soils = {"a": Soil("loamy", 6.0), "b": Soil("clay", 6.0), "c": Soil("sandy", 7.5)}
+        for soil_id, soil in self.soils.items():
+            self.matcher.add_soil(soil_id, soil)
+
+    def test_adjust_then_query(self):
+        self.matcher.adjust_ph("a", 7.4)
+        self.assertEqual(self.matcher.compatible_soils(6.0), ["b"])
+        self.assertEqual(self.matcher.compatible_soils(7.4), ["a", "c"])
+        self.assertEqual(self.matcher.best_soil(7.3), "a")
+        self.assertEqual(self.soils["a"].ph_level, 7.4)
+
+    def test_adjust_then_remove(self):
+        self.soils["a"].adjust_ph(9.0)
+        self.assertEqual(self.matcher.remove_soil("a"), self.soils["a"])
+        self.assertEqual(self.matcher.compatible_soils(6.0), ["b"])
+        self.matcher.adjust_ph("c", 1.0)
+        self.matcher.remove_soil("c")
+        self.assertEqual(self.matcher.compatible_soils(7.5, tolerance=7), ["b"])
+        self.assertEqual(len(self.matcher), 1)
+
+    def test_directly_adjusted_soil_can_be_reindexed(self):
+        self.soils["b"].adjust_ph(7.5)
+        self.assertEqual(self.matcher.compatible_soils(6.0), ["a", "b"])
+        self.matcher.adjust_ph("b", self.soils["b"].ph_level)
+        self.assertEqual(self.matcher.compatible_soils(6.0), ["a"])
+        self.assertEqual(self.matcher.compatible_soils(7.5), ["c", "b"])
+
+    def test_invalid_adjustment_leaves_index_alone(self):
+        with self.assertRaises(ValueError):
+            self.matcher.adjust_ph("a", 15)
+        with self.assertRaises(ValueError):
+            self.matcher.adjust_ph("missing", 6.0)
+        self.assertEqual(self.matcher.compatible_soils(6.0), ["a", "b"])
+
+    def test_queries_match_brute_force(self):
+        rng = random.Random(17)
+        for step, tolerance in ((0.25, 0.5), (0.1, 0.3), (0.1, 0.5)):
+            grid = [round(i * step, 2) for i in range(int(4 / step) + 1)]
+            matcher = SoilMatcher(tolerance=tolerance)
+            soils = {}
+            for soil_id in range(60):
+                soils[soil_id] = Soil("loamy", 5 + rng.choice(grid))
+                matcher.add_soil(soil_id, soils[soil_id])
+            order = list(soils)
+            matcher.adjust_ph(3, soils[5].ph_level)
+            order.append(order.pop(3))
+            plants = {f"p{i}": Plant("Solanum lycopersicum", "2025-04-10", 5 + rng.choice(grid)) for i in range(40)}
+
+            pairs = []
+            best = {}
+            for plant_id, plant in plants.items():
+                matches = [soil_id for soil_id in order if soils[soil_id].check_compatibility(plant, tolerance)]
+                pairs.extend((plant_id, soil_id) for soil_id in matches)
+                self.assertEqual(sorted(matcher.compatible_soils(plant)), sorted(matches))
+                self.assertEqual([soils[i].ph_level for i in matcher.compatible_soils(plant)],
+                                 sorted(soils[i].ph_level for i in matches))
+                best[plant_id] = min(matches, default=None, key=lambda soil_id: (
+                    abs(soils[soil_id].ph_level - plant.required_ph), soils[soil_id].ph_level, order.index(soil_id)))
+            self.assertEqual(matcher.best_soils(plants), best)
+            joined = list(matcher.join(plants))
+            self.assertEqual(len(joined), len(pairs))
+            self.assertEqual(set(joined), set(pairs))
+
+
+class TestPlant(unittest.TestCase):
+
+    def test_is_valid_date(self):
+        plant = Plant("Solanum lycopersicum", "2025-04-10", 6.5)
+        self.assertTrue(plant.is_valid_date("2025-02-28"))
+        self.assertFalse(plant.is_valid_date("2025-02-30"))
+        with self.assertRaises(TypeError):
+            plant.is_valid_date(20250410)
+
+    def test_slots_and_shared_names(self):
+        first = Plant("Ocimum basilicum", "2025-05-01", 6.5)
+        second = Plant("".join(["Ocimum", " basilicum"]), "2025-05-02", 6.5)
+        self.assertIs(first.species, second.species)
+        self.assertEqual(second.planting_date, "2025-05-02")
+        self.assertEqual(second.planting_ordinal - first.planting_ordinal, 1)
+        with self.assertRaises(AttributeError):
+            first.note = "by the fence"
+        soil = Soil("peaty", 5.5)
+        before = interned_name_counts()
+        again = Soil("".join(["pe", "aty"]), 5.0)
+        Plant("Ocimum basilicum", "2025-05-03", 6.5)
+        self.assertIs(again.soil_type, soil.soil_type)
+        self.assertEqual(interned_name_counts(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+from project import Garden, forecast_yields
+
+
+class TestForecastYields(unittest.TestCase):
+
+    def setUp(self):
+        self.gardens = []
+        for i in range(5):
+            garden = Garden(f"garden-{i}", "04/15/2025", "10/15/2025")
+            garden.add_plant("Tomato", i + 1)
+            garden.add_plant("basil", 2.5, avg_per_plant=0.3)
+            self.gardens.append(garden)
+
+    def test_totals_match_total_yield(self):
+        expected = [g.total_yield(include_details=False)["total_lb"] for g in self.gardens]
+        for workers in (1, 2):
+            forecast = forecast_yields(self.gardens, workers=workers, chunk_size=2)
+            self.assertEqual([g["total_lb"] for g in forecast["gardens"]], expected)
+            self.assertEqual([g["garden"] for g in forecast["gardens"]], [g.name() for g in self.gardens])
+            self.assertAlmostEqual(forecast["total_lb"], sum(expected))
+            self.assertEqual(set(forecast["by_plant"]), {"tomato", "basil"})
+
+    def test_custom_yields_and_errors(self):
+        forecast = forecast_yields(self.gardens[:1], yields={"TOMATO": 10})
+        self.assertEqual(forecast["by_plant"]["tomato"], 10)
+        garden = Garden("odd", "04/15/2025", "10/15/2025")
+        garden.add_plant("okra", 3)
+        with self.assertRaises(ValueError):
+            forecast_yields([garden], workers=1)
+        with self.assertRaises(ValueError):
+            forecast_yields(self.gardens, chunk_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()